@@ -14,6 +14,7 @@ class Portals(BaseCommand):
         :param str tenant: Name of the tenant to browse
         """
         await self._core.v1.api.put('/currentPortal', tenant)
+        self._core.v1.api.cache.clear()
 
     async def browse_global_admin(self):
         """
@@ -2,7 +2,6 @@ import sys
 import asyncio
 import logging
 import argparse
-import aiofiles
 import yarl
 
 
@@ -10,7 +9,7 @@ from .. import settings
 from ..common import utils
 from ..lib.storage import commonfs
 from ..direct.client import DirectIO
-from ..exceptions.direct import StreamError, DirectIOError
+from ..exceptions.direct import DirectIOError
 from ..exceptions.transport import TLSError
 
 
@@ -33,16 +32,14 @@ def validate_directory_and_filename(path):
     assert all([directory, filename]), f'Error: Could not resolve file path: {path}'
 
 
-async def download_from_object_storage(options, file_id, path):
+async def download_from_object_storage(options, file_id, path, resume=False):
     async with DirectIO(**options) as client:
-        streamer = await client.streamer(file_id)
         try:
-            async with aiofiles.open(path, 'wb') as fd:
-                async for block in streamer.start():
-                    await fd.seek(block.offset)
-                    await fd.write(block.data)
-        except StreamError as e:
-            print(f'Download failed. Cause: {e.__cause__}', file=sys.stderr)
+            await client.download(file_id, path, resume=resume)
+        except DirectIOError as e:
+            print(f'Download failed. Cause: {e}', file=sys.stderr)
+            if resume:
+                print('Run the command again to resume the download.', file=sys.stderr)
 
 
 def download_object():
@@ -57,6 +54,7 @@ def download_object():
         ("--secret", "-s", {"type": str, "help": "Secret Key (optional)"}),
         ("--bearer", "-b", {"type": str, "help": "Bearer token (optional)"}),
         ("--file-id", "-f", {"required": True, "type": int, "help": "File ID (numeric)"}),
+        ("--resume", "-r", {"action": "store_true", "help": "Resume a failed download"}),
         ("--no-verify-ssl", "-k", {"action": "store_true", "help": "Disable SSL verification"}),
         ("--debug", "-d", {"action": "store_true", "help": "Enable debug logging"}),
     ]
@@ -83,7 +81,7 @@ def download_object():
         settings.io.direct.api.settings.connector.ssl = not args.no_verify_ssl
         settings.io.direct.storage.settings.connector.ssl = not args.no_verify_ssl
 
-        asyncio.run(download_from_object_storage(options, args.file_id, args.path))
+        asyncio.run(download_from_object_storage(options, args.file_id, args.path, args.resume))
     except ConnectionError:
         print(f'Error: Could not establish connection to host: {args.endpoint}:443', file=sys.stderr)
     except (AssertionError, TLSError, DirectIOError) as e:
@@ -6,6 +6,10 @@ import aiohttp
 from yarl import URL
 from ..exceptions.transport import TLSError
 from .settings import from_configuration
+from .retries import RetryPolicy
+from .limiter import RateLimiter
+from .breaker import CircuitBreakers
+from .cache import ResponseCache
 
 logger = logging.getLogger('cterasdk.http')
 
@@ -16,6 +20,10 @@ class Session:
     def __init__(self, configuration):
         self._configuration = configuration
         self._cookie_jar = CachedCookieJar()
+        self._retries = RetryPolicy(configuration['retries'])
+        self._limiter = RateLimiter(configuration['rate_limits'])
+        self._breakers = CircuitBreakers(configuration['circuit_breaker'])
+        self._cache = ResponseCache(configuration['cache'])
         self._session = None
 
     @property
@@ -30,6 +38,22 @@ class Session:
     def cookie_jar(self):
         return self._cookie_jar
 
+    @property
+    def retries(self):
+        return self._retries
+
+    @property
+    def limiter(self):
+        return self._limiter
+
+    @property
+    def breakers(self):
+        return self._breakers
+
+    @property
+    def cache(self):
+        return self._cache
+
     async def request(self, r, *, await_promise=False, on_response=None):
         if await_promise:
             return await self.await_promise(r, on_response=on_response)
@@ -43,9 +67,35 @@ class Session:
         return await promise
 
     async def _request(self, r, *, on_response=None):
+        if not self._retries.enabled:
+            return asyncio.create_task(on_response(await self._send(r)))
+
+        self._retries.on_request()
+        attempt = 1
+        while True:
+            try:
+                response = await self._send(r)
+            except (ConnectionError, TimeoutError) as error:
+                delay = self._retries.on_error(r, attempt, error)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retries.on_response(r, attempt, response)
+                if delay is None:
+                    return asyncio.create_task(on_response(response))
+                response.release()
+            attempt = attempt + 1
+            await asyncio.sleep(delay)
+
+    async def _send(self, r):
+        if not self._limiter.enabled:
+            return await self._issue(r)
+        async with self._limiter.limit(r.method, r.url):
+            return await self._issue(r)
+
+    async def _issue(self, r):
         try:
-            response = await self.session.request(r.method, r.url, **r.kwargs)
-            return asyncio.create_task(on_response(response))
+            return await self.session.request(r.method, r.url, **r.kwargs)
         except aiohttp.ClientSSLError as error:
             logger.warning(error)
             raise TLSError(error.host, error.port) from error
@@ -143,9 +193,10 @@ class CachedCookieJar:
 class BaseRequest:
     """HTTP Request"""
 
-    def __init__(self, method, url, **kwargs):
+    def __init__(self, method, url, *, cacheable=None, **kwargs):
         self.method = method
         self.url = url
+        self.cacheable = cacheable if cacheable is not None else method == 'GET'
         self.kwargs = BaseRequest.accept(**kwargs)
 
     @staticmethod
@@ -1,8 +1,14 @@
+import os
+import asyncio
 import logging
 import platform
 import threading
+import contextlib
 import aiohttp
+from yarl import URL
 from . import async_requests, errors
+from .breaker import guard
+from .coalescing import SingleFlight
 from .settings import get_configuration
 from ..common import utils
 
@@ -70,6 +76,7 @@ class BaseClient:
         self._builder = builder
         self._session = session if session else async_requests.Session(get_configuration(settings))
         self._headers = headers if headers else Headers()
+        self._single_flight = SingleFlight()
 
     def clone(self, definition, builder=None, authenticator=None):
         """
@@ -79,18 +86,91 @@ class BaseClient:
         :param ,optional builder: Endpoint builder.
         :param ,optional authenticator: Authenticator function.
         """
-        return definition(
+        client = definition(
             builder if builder is not None else self._builder,
             self._session,
             None,
             authenticator if authenticator is not None else self._authenticator,
             self._headers
         )
+        client._single_flight = self._single_flight  # pylint: disable=protected-access
+        return client
 
     @property
     def cookie_jar(self):
         return self._session.cookie_jar
 
+    @property
+    def retries(self):
+        """
+        Retry Policy, Shared with Cloned Clients.
+
+        :rtype: cterasdk.clients.retries.RetryPolicy
+        """
+        return self._session.retries
+
+    @property
+    def limiter(self):
+        """
+        Rate Limiter, Shared with Cloned Clients.
+
+        :rtype: cterasdk.clients.limiter.RateLimiter
+        """
+        return self._session.limiter
+
+    @property
+    def breakers(self):
+        """
+        Circuit Breakers, per Base URL, Shared with Cloned Clients.
+
+        :rtype: cterasdk.clients.breaker.CircuitBreakers
+        """
+        return self._session.breakers
+
+    @property
+    def cache(self):
+        """
+        Response Cache, Shared with Cloned Clients.
+
+        :rtype: cterasdk.clients.cache.ResponseCache
+        """
+        return self._session.cache
+
+    async def _send(self, request, on_response):
+        if not self._session.cache.enabled:
+            return await self._session.await_promise(request, on_response=on_response)
+        return await self._session.cache.request(self._session, request, on_response)
+
+    def _breaker(self, request):
+        """
+        Guard a Request with the Circuit Breaker of the Base URL, or of the Request Origin if the Client has no Base URL.
+        """
+        if not self._session.breakers.enabled:
+            return contextlib.nullcontext()
+        base = self._builder.base if self._builder is not None else None
+        return guard(self._session.breakers.get(base if base else str(URL(str(request.url)).origin())))
+
+    def coalesce(self, enabled=True):
+        """
+        Enable or Disable Request Coalescing.
+
+        When enabled, identical ``get`` and ``get_multi`` requests issued while a request is in flight share its round trip.
+        Requests are identical if their URL, arguments and client headers are identical. Callers that awaited a request
+        in flight receive a deep copy of its deserialized result. Coalescing is shared with cloned clients.
+
+        :param bool, optional enabled: Enable request coalescing, defaults to ``True``
+        """
+        self._single_flight.enabled = enabled
+
+    @property
+    def coalescing(self):
+        """
+        Request Coalescing, Shared with Cloned Clients, if Enabled.
+
+        :rtype: cterasdk.clients.coalescing.SingleFlight
+        """
+        return self._single_flight if self._single_flight.enabled else None
+
     @property
     def headers(self):
         return self._headers
@@ -105,11 +185,13 @@ class BaseClient:
 
     def request(self, request, *, on_response=None, on_error=None):
         on_error = on_error if on_error else errors.DefaultHandler()
-        return self._request(request, on_response=on_response, on_error=on_error)
+        with self._breaker(request):
+            return self._request(request, on_response=on_response, on_error=on_error)
 
     async def a_request(self, request, *, on_response=None, on_error=None):
         on_error = on_error if on_error else errors.DefaultHandler()
-        return await self._request(request, on_response=on_response, on_error=on_error)
+        with self._breaker(request):
+            return await self._request(request, on_response=on_response, on_error=on_error)
 
     async def close(self):
         await self._session.close()
@@ -156,35 +238,74 @@ class BaseResponse:
         return self._response.raise_for_status()
 
 
-def run_threadsafe(loop, target, *args, **kwargs):
-    event = threading.Event()
+class EventLoopThread:
+    """
+    Background Event Loop Thread.
 
-    t = Task(loop, event, target, *args, **kwargs)
-    t.start()
+    Runs an event loop on a long-lived daemon thread. Synchronous clients submit their requests to this loop,
+    so that requests of all threads share one event loop and the connection pools bound to it.
+    """
 
-    event.wait()
-
-    if t.exception:
-        raise t.exception
-    return t.response
+    def __init__(self, name='CTERA SDK Event Loop'):
+        """
+        Initialize a Background Event Loop Thread.
 
+        :param str, optional name: Thread name.
+        """
+        self._name = name
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._pid = None
 
-class Task(threading.Thread):
+    @property
+    def loop(self):
+        """
+        Event Loop, started on first use, and restarted in child processes.
 
-    def __init__(self, loop, event, target, *args, **kwargs):
-        super().__init__(name='Thread-safe Executor')
-        self.loop = loop
-        self.event = event
-        self.target = target
-        self.args = args
-        self.kwargs = kwargs
-        self.exception = None
-        self.response = None
+        :rtype: asyncio.AbstractEventLoop
+        """
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive() or self._pid != os.getpid():
+                self._start()
+            return self._loop
+
+    def _start(self):
+        logger.debug('Starting event loop thread.')
+        self._loop = asyncio.new_event_loop()
+        self._pid = os.getpid()
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def run(self, target, *args, **kwargs):
+        """
+        Run a Coroutine Function on the Event Loop Thread, and Wait for its Result.
 
-    def run(self):
+        :param callable target: Coroutine function.
+        :returns: Result of the coroutine.
+        """
+        loop = self.loop
+        if threading.current_thread() is self._thread:
+            raise RuntimeError('Synchronous clients cannot be used from coroutines running on their event loop thread.')
+        future = asyncio.run_coroutine_threadsafe(target(*args, **kwargs), loop)
         try:
-            self.response = self.loop.run_until_complete(self.target(*self.args, **self.kwargs))
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            self.exception = e
-        finally:
-            self.event.set()
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def stop(self):
+        """
+        Stop the Event Loop Thread.
+        """
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive() or self._pid != os.getpid():
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._thread = None
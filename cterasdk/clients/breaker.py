@@ -0,0 +1,194 @@
+import time
+import asyncio
+import logging
+import threading
+import contextlib
+import aiohttp
+from ..exceptions.transport import CircuitOpenError, BadGateway, ServiceUnavailable, GatewayTimeout
+
+
+logger = logging.getLogger('cterasdk.http')
+
+
+class State:
+    """Circuit Breaker States"""
+    Closed = 'closed'
+    Open = 'open'
+    HalfOpen = 'half-open'
+
+
+class CircuitBreaker:  # pylint: disable=too-many-instance-attributes
+    """
+    Circuit Breaker.
+
+    Opens after consecutive connection errors, timeouts or ``502``, ``503`` and ``504`` responses,
+    failing requests fast for a cool-down period.
+    Once the cool-down period elapses, probe requests are sent to the endpoint. A successful probe closes the circuit,
+    and a failed probe opens it for another cool-down period.
+
+    :ivar str url: Base URL
+    :ivar int failures: Number of consecutive failures
+    :ivar int trips: Number of times the circuit opened
+    :ivar int rejected: Number of requests failed fast
+    """
+
+    def __init__(self, url, threshold, cooldown, probes):
+        """
+        Initialize a Circuit Breaker.
+
+        :param str url: Base URL.
+        :param int threshold: Number of consecutive failures that opens the circuit.
+        :param float cooldown: Cool-down period, in seconds.
+        :param int probes: Max number of concurrent probe requests.
+        """
+        self.url = url
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._probes = probes
+        self._lock = threading.Lock()
+        self._state = State.Closed
+        self._opened = None
+        self._probing = 0
+        self.failures = 0
+        self.trips = 0
+        self.rejected = 0
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._state == State.Open and self._remaining() <= 0:
+                return State.HalfOpen
+            return self._state
+
+    def _remaining(self):
+        return self._cooldown - (time.monotonic() - self._opened)
+
+    def acquire(self):
+        """
+        Permit a Request.
+
+        :returns: ``True`` if the request is a probe, ``False`` otherwise.
+        :rtype: bool
+        :raises: cterasdk.exceptions.transport.CircuitOpenError
+        """
+        with self._lock:
+            if self._state == State.Open:
+                remaining = self._remaining()
+                if remaining > 0:
+                    self.rejected = self.rejected + 1
+                    raise CircuitOpenError(self.url, remaining)
+                logger.debug('Circuit half-open. Probing: %s', self.url)
+                self._state = State.HalfOpen
+            if self._state == State.HalfOpen:
+                if self._probing >= self._probes:
+                    self.rejected = self.rejected + 1
+                    raise CircuitOpenError(self.url, 0)
+                self._probing = self._probing + 1
+                return True
+            return False
+
+    def on_success(self, probe):
+        with self._lock:
+            self._release(probe)
+            self.failures = 0
+            if self._state != State.Closed:
+                logger.info('Circuit closed: %s', self.url)
+                self._state = State.Closed
+
+    def on_failure(self, probe):
+        with self._lock:
+            self._release(probe)
+            self.failures = self.failures + 1
+            if self._state == State.HalfOpen or (self._state == State.Closed and self.failures >= self._threshold):
+                logger.warning('Circuit open for %s seconds after %s consecutive failures: %s', self._cooldown, self.failures, self.url)
+                self._state = State.Open
+                self._opened = time.monotonic()
+                self.trips = self.trips + 1
+
+    def on_cancel(self, probe):
+        with self._lock:
+            self._release(probe)
+
+    def _release(self, probe):
+        if probe:
+            self._probing = self._probing - 1
+
+    def to_dict(self):
+        return {'state': self.state, 'failures': self.failures, 'trips': self.trips, 'rejected': self.rejected}
+
+
+class CircuitBreakers:
+    """
+    Circuit Breakers, per Base URL.
+    """
+
+    def __init__(self, configuration):
+        """
+        Initialize Circuit Breakers.
+
+        :param dict configuration: Circuit breaker configuration.
+        """
+        self._configuration = configuration
+        self._lock = threading.Lock()
+        self._breakers = {}
+
+    @property
+    def enabled(self):
+        return self._configuration['threshold'] > 0
+
+    def get(self, url):
+        """
+        Get the Circuit Breaker of a Base URL.
+
+        :param str url: Base URL.
+        :rtype: cterasdk.clients.breaker.CircuitBreaker
+        """
+        with self._lock:
+            breaker = self._breakers.get(url)
+            if breaker is None:
+                breaker = self._breakers[url] = CircuitBreaker(url, **self._configuration)
+            return breaker
+
+    def urls(self, state=None):
+        """
+        Get the Base URLs of Circuit Breakers.
+
+        :param str,optional state: Circuit breaker state, defaults to all states.
+        :returns: List of base URLs.
+        :rtype: list[str]
+        """
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return [breaker.url for breaker in breakers if state is None or breaker.state == state]
+
+    def to_dict(self):
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.url: breaker.to_dict() for breaker in breakers}
+
+
+@contextlib.contextmanager
+def guard(breaker):
+    """
+    Guard a Request with a Circuit Breaker.
+
+    Connection errors, including operating system errors of the connection, such as a connection reset, timeouts and
+    ``502``, ``503`` and ``504`` responses are failures, as they are retryable.
+    Other errors indicate that the endpoint is reachable.
+
+    :param cterasdk.clients.breaker.CircuitBreaker breaker: Circuit breaker.
+    :raises: cterasdk.exceptions.transport.CircuitOpenError
+    """
+    probe = breaker.acquire()
+    try:
+        yield
+    except (ConnectionError, aiohttp.ClientOSError, TimeoutError, asyncio.TimeoutError, BadGateway, ServiceUnavailable, GatewayTimeout):
+        breaker.on_failure(probe)
+        raise
+    except Exception:
+        breaker.on_success(probe)
+        raise
+    except BaseException:
+        breaker.on_cancel(probe)
+        raise
+    breaker.on_success(probe)
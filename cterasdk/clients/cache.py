@@ -0,0 +1,295 @@
+import time
+import fnmatch
+import logging
+from collections import OrderedDict
+from http import HTTPStatus
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+
+logger = logging.getLogger('cterasdk.http')
+
+
+class Entry:
+    """
+    Cached Response.
+
+    :ivar int status: Status code
+    :ivar multidict.CIMultiDict headers: Response headers
+    :ivar bytes body: Response body
+    :ivar float ttl: Time to live, in seconds
+    """
+
+    def __init__(self, path, status, headers, body, ttl):
+        self.path = path
+        self.status = status
+        self.headers = CIMultiDict(headers)
+        self.body = body
+        self.ttl = ttl
+        self.stored = time.monotonic()
+
+    @property
+    def etag(self):
+        return self.headers.get('ETag')
+
+    @property
+    def last_modified(self):
+        return self.headers.get('Last-Modified')
+
+    @property
+    def fresh(self):
+        return time.monotonic() - self.stored < self.ttl
+
+    @property
+    def size(self):
+        return len(self.body)
+
+    def refresh(self, headers):
+        """
+        Refresh a Cached Response after a Successful Revalidation.
+
+        :param multidict.CIMultiDictProxy headers: Headers of the ``304 Not Modified`` response.
+        """
+        for header in ('ETag', 'Last-Modified', 'Cache-Control', 'Expires'):
+            if header in headers:
+                self.headers[header] = headers[header]
+        self.stored = time.monotonic()
+
+
+class CachedContent:
+    """Cached Response Content"""
+
+    def __init__(self, body):
+        self._body = body
+        self._offset = 0
+
+    def at_eof(self):
+        return self._offset >= len(self._body)
+
+    async def read(self, n=-1):
+        end = len(self._body) if n < 0 else self._offset + n
+        chunk = self._body[self._offset:end]
+        self._offset = self._offset + len(chunk)
+        return chunk
+
+    async def iter_chunked(self, n):
+        while not self.at_eof():
+            yield await self.read(n)
+
+
+class CachedResponse:
+    """
+    Response Served from a Response Cache.
+
+    Implements the subset of ``aiohttp.ClientResponse`` used by response objects.
+    """
+
+    def __init__(self, request, status, headers, body):
+        self.method = request.method
+        self.url = URL(str(request.url))
+        self.real_url = self.url
+        self.status = status
+        self.reason = HTTPStatus(status).phrase
+        self.headers = CIMultiDictProxy(CIMultiDict(headers))
+        self.content = CachedContent(body)
+        self._body = body
+
+    @property
+    def ok(self):
+        return self.status < 400
+
+    def raise_for_status(self):
+        """Cached responses are successful."""
+
+    async def read(self):
+        return self._body
+
+    async def text(self, encoding='utf-8'):
+        return self._body.decode(encoding)
+
+    def release(self):
+        """Cached responses do not hold a connection."""
+
+    def close(self):
+        """Cached responses do not hold a connection."""
+
+
+class ResponseCache:
+    """
+    HTTP Response Cache.
+
+    Caches successful responses of ``GET`` requests, and of ``POST`` requests that read data, such as ``get-multi``,
+    if their URL path matches a path pattern with a time to live. Responses are served from the cache until their
+    time to live expires, then revalidated using ``If-None-Match`` or ``If-Modified-Since`` if the server returned
+    an ``ETag`` or a ``Last-Modified`` header. ``PUT``, ``POST`` and ``DELETE`` requests invalidate the cached responses
+    of their path, its parents and its children. The least recently used responses are evicted to fit ``max_size``.
+
+    :ivar int hits: Number of responses served from the cache
+    :ivar int misses: Number of responses fetched from the server
+    :ivar int revalidated: Number of cached responses revalidated by the server
+    :ivar int invalidated: Number of cached responses invalidated by writes
+    :ivar int evicted: Number of cached responses evicted to fit the memory cap
+    """
+
+    _safe_methods = ('GET', 'HEAD', 'OPTIONS', 'PROPFIND')
+
+    def __init__(self, configuration):
+        """
+        Initialize a Response Cache.
+
+        :param dict configuration: Cache configuration.
+        """
+        self._configuration = configuration
+        self._entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.invalidated = 0
+        self.evicted = 0
+
+    @property
+    def enabled(self):
+        return self._configuration['enabled']
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def path(url):
+        return URL(str(url)).path.rstrip('/')
+
+    def ttl(self, request):
+        """
+        Get the Time to Live of a Request.
+
+        :param cterasdk.clients.async_requests.BaseRequest request: Request.
+        :returns: Time to live, in seconds, or ``None`` if the request is not cacheable.
+        :rtype: float
+        """
+        if not request.cacheable:
+            return None
+        path = ResponseCache.path(request.url)
+        for pattern, ttl in self._configuration['paths'].items():
+            if fnmatch.fnmatchcase(path, pattern):
+                return ttl
+        return None
+
+    @staticmethod
+    def key(request, cookies):
+        """
+        Create a Cache Key.
+
+        :param cterasdk.clients.async_requests.BaseRequest request: Request, including client headers.
+        :param http.cookies.SimpleCookie cookies: Session cookies.
+        :rtype: str
+        """
+        kwargs = sorted((k, repr(v)) for k, v in request.kwargs.items() if k not in ('headers', 'timeout'))
+        headers = sorted((request.kwargs.get('headers') or {}).items())
+        cookies = sorted((k, v.value) for k, v in (cookies or {}).items())
+        return repr((request.method, str(request.url), kwargs, headers, cookies))
+
+    async def request(self, session, request, on_response):
+        """
+        Send a Request, or Serve its Response from the Cache.
+
+        :param cterasdk.clients.async_requests.Session session: Session.
+        :param cterasdk.clients.async_requests.BaseRequest request: Request, including client headers.
+        :param callable on_response: Response handler.
+        """
+        ttl = self.ttl(request)
+        if ttl is None:
+            response = await session.await_promise(request, on_response=on_response)
+            if request.method not in ResponseCache._safe_methods and not request.cacheable:
+                self.invalidate(request.url)
+            return response
+
+        key = ResponseCache.key(request, session.cookie_jar.filter_cookies(request.url))
+        entry = self._entries.get(key)
+        if entry is not None and entry.fresh:
+            return await on_response(self._hit(key, entry, request))
+        if entry is not None:
+            ResponseCache._conditional(request, entry)
+
+        response = await session.await_promise(request, on_response=ResponseCache._raw)
+        if entry is not None and response.status == HTTPStatus.NOT_MODIFIED:
+            response.release()
+            entry.refresh(response.headers)
+            self.revalidated = self.revalidated + 1
+            logger.debug('Revalidated cached response: %s %s', request.method, request.url)
+            return await on_response(self._hit(key, entry, request))
+
+        self.misses = self.misses + 1
+        self._remove(key)
+        if response.status != HTTPStatus.OK:
+            return await on_response(response)
+        body = await response.read()
+        entry = Entry(ResponseCache.path(request.url), response.status, response.headers, body, ttl)
+        if self._storable(entry):
+            self._store(key, entry)
+        return await on_response(CachedResponse(request, response.status, response.headers, body))
+
+    @staticmethod
+    async def _raw(response):
+        return response
+
+    @staticmethod
+    def _conditional(request, entry):
+        headers = dict(request.kwargs.get('headers') or {})
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        request.kwargs['headers'] = headers
+
+    def _hit(self, key, entry, request):
+        self.hits = self.hits + 1
+        self._entries.move_to_end(key)
+        return CachedResponse(request, entry.status, entry.headers, entry.body)
+
+    def _storable(self, entry):
+        if entry.size > self._configuration['max_entry_size'] or 'no-store' in entry.headers.get('Cache-Control', ''):
+            return False
+        return entry.ttl > 0 or entry.etag is not None or entry.last_modified is not None
+
+    def _store(self, key, entry):
+        self._entries[key] = entry
+        self.size = self.size + entry.size
+        while self.size > self._configuration['max_size']:
+            self._remove(next(iter(self._entries)))
+            self.evicted = self.evicted + 1
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size = self.size - entry.size
+
+    def invalidate(self, url):
+        """
+        Invalidate the Cached Responses of a Path, its Parents and its Children.
+
+        :param str url: URL.
+        """
+        path = ResponseCache.path(url)
+        keys = [
+            key for key, entry in self._entries.items()
+            if entry.path == path or path.startswith(f'{entry.path}/') or entry.path.startswith(f'{path}/')
+        ]
+        for key in keys:
+            self._remove(key)
+        if keys:
+            self.invalidated = self.invalidated + len(keys)
+            logger.debug('Invalidated %s cached responses: %s', len(keys), path)
+
+    def clear(self):
+        """
+        Clear the Cache.
+        """
+        self._entries.clear()
+        self.size = 0
+
+    def to_dict(self):
+        return {
+            'entries': len(self), 'size': self.size, 'hits': self.hits, 'misses': self.misses,
+            'revalidated': self.revalidated, 'invalidated': self.invalidated, 'evicted': self.evicted
+        }
@@ -1,7 +1,8 @@
-import asyncio
+from cterasdk import settings
 from .errors import XMLHandler, JSONHandler
-from .base import BaseClient, BaseResponse, run_threadsafe
+from .base import BaseClient, BaseResponse, EventLoopThread
 from .common import Serializers, Deserializers
+from .streaming import Prefetcher
 from . import async_requests, decorators
 from ..common import Object
 
@@ -36,7 +37,7 @@ class AsyncClient(BaseClient):
 
     async def _request(self, request, *, on_response=None, on_error=None):
         on_response = on_response if on_response else AsyncResponse.new()
-        response = await self._session.await_promise(self.join_headers(request), on_response=on_response)
+        response = await self._send(self.join_headers(request), on_response)
         return response if response.ok else await on_error.a_accept(response)
 
 
@@ -96,6 +97,7 @@ class AsyncWebDAV(AsyncClient):
 
 class AsyncJSON(AsyncClient):
 
+    @decorators.coalesced
     async def get(self, path, **kwargs):
         response = await super().get(path, on_error=JSONHandler(), **kwargs)
         return await response.json()
@@ -128,6 +130,7 @@ class AsyncMigrate(AsyncJSON):
 
 class AsyncXML(AsyncClient):
 
+    @decorators.coalesced
     async def get(self, path, **kwargs):
         response = await super().get(path, on_error=XMLHandler(), **kwargs)
         return await response.xml()
@@ -152,8 +155,9 @@ class AsyncXML(AsyncClient):
 class AsyncExtended(AsyncXML):
     """CTERA Schema"""
 
+    @decorators.coalesced
     async def get_multi(self, path, paths, **kwargs):
-        return await self.database(path, 'get-multi', paths, **kwargs)
+        return await self.database(path, 'get-multi', paths, cacheable=True, **kwargs)
 
     async def execute(self, path, name, param=None, **kwargs):  # schema method
         return await self._execute(path, 'user-defined', name, param, **kwargs)
@@ -185,8 +189,17 @@ class AsyncResponse(BaseResponse):
     """Asynchronous Response Object"""
 
     async def a_iter_content(self, chunk_size=None):
-        async for chunk in self._response.content.iter_chunked(chunk_size if chunk_size else 5120):
-            yield chunk
+        """
+        Iterate over the Response Content.
+
+        :param int, optional chunk_size: Chunk size, in bytes. Defaults to ``cterasdk.settings.io.streaming.chunk_size``
+        """
+        try:
+            async for chunk in self._response.content.iter_chunked(chunk_size if chunk_size else settings.io.streaming.chunk_size):
+                yield chunk
+        finally:
+            if not self._response.content.at_eof():  # Iteration stopped early
+                self._response.close()
 
     async def text(self):
         return await self._response.text()
@@ -252,7 +265,7 @@ class Client(BaseClient):
 
     def _request(self, request, *, on_response=None, on_error=None):
         on_response = on_response if on_response else SyncResponse.new()
-        response = execute(self._session.await_promise, self.join_headers(request), on_response=on_response)
+        response = execute(self._send, self.join_headers(request), on_response)
         return response if response.ok else on_error.accept(response)
 
     def close(self):  # pylint: disable=invalid-overridden-method
@@ -315,6 +328,7 @@ class WebDAV(Client):
 class XML(Client):
     """XML Serializer and Deserializer"""
 
+    @decorators.coalesced
     def get(self, path, **kwargs):
         response = super().get(path, on_error=XMLHandler(), **kwargs)
         return response.xml()
@@ -343,6 +357,7 @@ class XML(Client):
 class JSON(Client):
     """JSON Serializer and Deserializer"""
 
+    @decorators.coalesced
     def get(self, path, **kwargs):
         response = super().get(path, on_error=JSONHandler(), **kwargs)
         return response.json()
@@ -369,8 +384,9 @@ class JSON(Client):
 class Extended(XML):
     """CTERA Schema"""
 
+    @decorators.coalesced
     def get_multi(self, path, paths, **kwargs):
-        return self.database(path, 'get-multi', paths, **kwargs)
+        return self.database(path, 'get-multi', paths, cacheable=True, **kwargs)
 
     def show_multi(self, path, paths, **kwargs):
         print(Serializers.JSON(self.get_multi(path, paths, **kwargs), no_log=False))
@@ -413,27 +429,51 @@ class Migrate(JSON):
         return response.json()
 
 
-event_loop = asyncio.new_event_loop()
+event_loop = EventLoopThread()
 
 
 def execute(target, *args, **kwargs):
-    loop = asyncio.get_event_loop()
-
-    if not loop.is_running():
-        return loop.run_until_complete(target(*args, **kwargs))
-
-    return run_threadsafe(event_loop, target, *args, **kwargs)
+    return event_loop.run(target, *args, **kwargs)
 
 
 class SyncResponse(AsyncResponse):
     """Synchronous Response Object"""
 
-    def iter_content(self, chunk_size=None):
-        while True:
+    def iter_content(self, chunk_size=None, queue_size=None):
+        """
+        Iterate over the Response Content.
+
+        Chunks are read from a single asynchronous iterator on the event loop thread. If ``queue_size`` is set,
+        chunks are read ahead of the consumer into a bounded queue, otherwise a chunk is read on every iteration.
+        Defaults are read from ``cterasdk.settings.io.streaming``.
+
+        :param int, optional chunk_size: Chunk size, in bytes.
+        :param int, optional queue_size: Max number of chunks to read ahead of the consumer, ``0`` to disable read ahead.
+        """
+        queue_size = queue_size if queue_size is not None else settings.io.streaming.queue_size
+        iterator = super().a_iter_content(chunk_size)
+        if queue_size:
+            prefetcher = Prefetcher(iterator, event_loop.loop, queue_size).start()
             try:
-                yield execute(super().a_iter_content(chunk_size).__anext__)
-            except StopAsyncIteration:
-                break
+                yield from prefetcher
+            finally:
+                prefetcher.close()
+            return
+
+        async def next_chunk():
+            return await anext(iterator)
+
+        async def close():
+            await iterator.aclose()
+
+        try:
+            while True:
+                try:
+                    yield execute(next_chunk)
+                except StopAsyncIteration:
+                    break
+        finally:
+            execute(close)
 
     def text(self):  # pylint: disable=invalid-overridden-method
         return execute(super().text)
@@ -0,0 +1,128 @@
+import copy
+import asyncio
+import logging
+import threading
+
+
+logger = logging.getLogger('cterasdk.http')
+
+
+class Call:
+    """
+    Synchronous Request in Flight.
+
+    :ivar threading.Event done: Set once the request completed
+    :ivar object result: Result of the request
+    :ivar BaseException error: Error of the request
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Single-Flight Request Coalescing.
+
+    Identical requests issued while a request is in flight await the same request, and share its result or error.
+    The caller that issued the request receives its result, and callers that awaited it receive a deep copy.
+
+    :ivar bool enabled: Coalesce requests
+    :ivar int requests: Number of requests
+    :ivar int coalesced: Number of requests that awaited a request in flight
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.requests = 0
+        self.coalesced = 0
+
+    @property
+    def in_flight(self):
+        """
+        Number of Requests in Flight.
+        """
+        return len(self._calls)
+
+    @staticmethod
+    def key(name, url, args, kwargs, headers):
+        """
+        Create a Request Key.
+
+        :param str name: Name of the client method.
+        :param str url: URL.
+        :param tuple args: Positional arguments of the client method.
+        :param dict kwargs: Request arguments, such as query parameters and headers.
+        :param dict headers: Client headers, including authorization headers.
+        :rtype: str
+        """
+        return repr((name, str(url), [repr(arg) for arg in args], sorted((k, repr(v)) for k, v in kwargs.items()),
+                     sorted(headers.items())))
+
+    def _join(self, key, new):
+        with self._lock:
+            self.requests = self.requests + 1
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced = self.coalesced + 1
+                logger.debug('Coalescing request with a request in flight.')
+                return call, False
+            call = self._calls[key] = new()
+            return call, True
+
+    def _remove(self, key, call):
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+
+    async def a_run(self, key, factory):
+        """
+        Run a Request, or Await an Identical Request in Flight.
+
+        The request is shielded from cancellation of its callers, so that other callers may await it.
+
+        :param str key: Request key.
+        :param callable factory: Coroutine function that issues the request.
+        :returns: Result of the request.
+        """
+        future, leader = self._join(key, lambda: asyncio.ensure_future(factory()))
+        if leader:
+            future.add_done_callback(lambda f: self._done(key, f))
+        result = await asyncio.shield(future)
+        return result if leader else copy.deepcopy(result)
+
+    def _done(self, key, future):
+        self._remove(key, future)
+        if not future.cancelled():
+            future.exception()  # Mark as retrieved, if all callers were cancelled
+
+    def run(self, key, function):
+        """
+        Run a Request, or Wait for an Identical Request in Flight.
+
+        :param str key: Request key.
+        :param callable function: Function that issues the request.
+        :returns: Result of the request.
+        """
+        call, leader = self._join(key, Call)
+        if leader:
+            try:
+                call.result = function()
+                return call.result
+            except BaseException as error:
+                call.error = error
+                raise
+            finally:
+                self._remove(key, call)
+                call.done.set()
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return copy.deepcopy(call.result)
+
+    def to_dict(self):
+        return {'requests': self.requests, 'coalesced': self.coalesced, 'in_flight': self.in_flight}
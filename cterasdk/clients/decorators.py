@@ -1,3 +1,4 @@
+import inspect
 import logging
 import functools
 
@@ -24,3 +25,28 @@ def authenticated(execute_request):
         logger.error('Not logged in.')
         raise NotLoggedIn()
     return authenticate_then_execute
+
+
+def coalesced(execute_request):
+    def key(self, path, args, kwargs):
+        url = self._builder(path)  # pylint: disable=protected-access
+        return self._single_flight.key(execute_request.__name__, url, args, kwargs, self.headers.all)  # pylint: disable=protected-access
+
+    if inspect.iscoroutinefunction(execute_request):
+        @functools.wraps(execute_request)
+        async def a_coalesce_then_execute(self, path, *args, **kwargs):
+            if not self._single_flight.enabled:  # pylint: disable=protected-access
+                return await execute_request(self, path, *args, **kwargs)
+            return await self._single_flight.a_run(  # pylint: disable=protected-access
+                key(self, path, args, kwargs), lambda: execute_request(self, path, *args, **kwargs)
+            )
+        return a_coalesce_then_execute
+
+    @functools.wraps(execute_request)
+    def coalesce_then_execute(self, path, *args, **kwargs):
+        if not self._single_flight.enabled:  # pylint: disable=protected-access
+            return execute_request(self, path, *args, **kwargs)
+        return self._single_flight.run(  # pylint: disable=protected-access
+            key(self, path, args, kwargs), lambda: execute_request(self, path, *args, **kwargs)
+        )
+    return coalesce_then_execute
@@ -0,0 +1,173 @@
+import time
+import asyncio
+import contextlib
+from yarl import URL
+
+
+class EndpointClass:
+    """Endpoint Classes"""
+    API = 'api'
+    WebDAV = 'webdav'
+    Upload = 'upload'
+    Stats = 'stats'
+
+
+class TokenBucket:
+    """
+    Token Bucket.
+
+    Tokens are added at ``rate`` tokens per second, up to ``burst`` tokens. Every request consumes a token,
+    and waits for a token if the bucket is empty.
+    """
+
+    def __init__(self, rate, burst=None):
+        """
+        Initialize a Token Bucket.
+
+        :param float rate: Requests per second.
+        :param int,optional burst: Max number of requests in a burst, defaults to the rate.
+        """
+        self._rate = rate
+        self._capacity = burst if burst else max(1, rate)
+        self._tokens = float(self._capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """
+        Consume a Token.
+
+        :returns: Time waited for a token, in seconds.
+        :rtype: float
+        """
+        async with self._lock:
+            waited = 0
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens = self._tokens - 1
+                    return waited
+                delay = (1 - self._tokens) / self._rate
+                waited = waited + delay
+                await asyncio.sleep(delay)
+
+
+class Limit:
+    """
+    Request Rate and Concurrency Limit.
+
+    :ivar int requests: Number of requests
+    :ivar int throttled: Number of requests that waited for a token or a slot
+    :ivar float waited: Total time waited, in seconds
+    """
+
+    def __init__(self, rate=None, burst=None, concurrency=None):
+        """
+        Initialize a Limit.
+
+        :param float,optional rate: Requests per second, defaults to unlimited.
+        :param int,optional burst: Max number of requests in a burst, defaults to the rate.
+        :param int,optional concurrency: Max number of concurrent requests, defaults to unlimited.
+        """
+        self._bucket = TokenBucket(rate, burst) if rate else None
+        self._slots = asyncio.Semaphore(concurrency) if concurrency else None
+        self.requests = 0
+        self.throttled = 0
+        self.waited = 0
+
+    async def __aenter__(self):
+        start, throttled = time.monotonic(), False
+        if self._slots is not None:
+            throttled = self._slots.locked()
+            await self._slots.acquire()
+        try:
+            if self._bucket is not None:
+                throttled = await self._bucket.acquire() > 0 or throttled
+        except BaseException:
+            self._release()
+            raise
+        self.requests = self.requests + 1
+        if throttled:
+            self.throttled = self.throttled + 1
+            self.waited = self.waited + time.monotonic() - start
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._release()
+
+    def _release(self):
+        if self._slots is not None:
+            self._slots.release()
+
+    def to_dict(self):
+        return {'requests': self.requests, 'throttled': self.throttled, 'waited': round(self.waited, 3)}
+
+
+class RateLimiter:
+    """
+    Client-Side Rate Limiter.
+
+    Limits the request rate and the number of concurrent requests per host, and per endpoint class of each host.
+    A request holds a slot until its response headers are received. The limits of the endpoint class are awaited
+    before the limits of the host.
+    """
+
+    def __init__(self, configuration):
+        """
+        Initialize a Rate Limiter.
+
+        :param dict configuration: Rate limit configuration, per host and per endpoint class.
+        """
+        self._configuration = {k: v for k, v in configuration.items() if v['rate'] or v['concurrency']}
+        self._limits = {}
+
+    @property
+    def enabled(self):
+        return bool(self._configuration)
+
+    @staticmethod
+    def classify(method, url):
+        """
+        Classify an Endpoint.
+
+        :param str method: HTTP method.
+        :param yarl.URL url: URL.
+        :returns: Endpoint class.
+        :rtype: str
+        """
+        path = url.path
+        if method in ('PROPFIND', 'MKCOL', 'COPY', 'MOVE') or any(s in path for s in ('/webdav', '/localFiles', '/folders/folders')):
+            return EndpointClass.WebDAV
+        if '/upload/' in path:
+            return EndpointClass.Upload
+        if '/stats' in path:
+            return EndpointClass.Stats
+        return EndpointClass.API
+
+    def _limit(self, origin, name):
+        key = (origin, name)
+        limit = self._limits.get(key)
+        if limit is None:
+            limit = self._limits[key] = Limit(**self._configuration[name])
+        return limit
+
+    @contextlib.asynccontextmanager
+    async def limit(self, method, url):
+        """
+        Await the Rate and Concurrency Limits of a Request.
+
+        :param str method: HTTP method.
+        :param str url: URL.
+        """
+        url = URL(str(url))
+        origin = str(url.origin())
+        names = [name for name in (RateLimiter.classify(method, url), 'host') if name in self._configuration]
+        async with contextlib.AsyncExitStack() as stack:
+            for name in names:
+                await stack.enter_async_context(self._limit(origin, name))
+            yield
+
+    def to_dict(self):
+        return {f'{origin} {name}': limit.to_dict() for (origin, name), limit in self._limits.items()}
@@ -0,0 +1,174 @@
+import random
+import logging
+import datetime
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+
+
+logger = logging.getLogger('cterasdk.http')
+
+
+class RetryBudget:
+    """
+    Retry Budget.
+
+    A token bucket that limits retries to a ratio of requests. Every request deposits ``ratio`` tokens,
+    up to ``capacity``, and every retry withdraws a token, so that retries cannot amplify the load on an overloaded server.
+
+    :ivar float balance: Number of retries available
+    """
+
+    def __init__(self, ratio, capacity):
+        """
+        Initialize a Retry Budget.
+
+        :param float ratio: Max ratio of retries to requests.
+        :param int capacity: Max number of retries in a burst.
+        """
+        self._ratio = ratio
+        self._capacity = capacity
+        self.balance = float(capacity)
+
+    def deposit(self):
+        self.balance = min(self._capacity, self.balance + self._ratio)
+
+    def withdraw(self):
+        """
+        Withdraw a Retry.
+
+        :returns: ``True`` if a retry is available, ``False`` otherwise.
+        :rtype: bool
+        """
+        if self.balance < 1:
+            return False
+        self.balance = self.balance - 1
+        return True
+
+
+class RetryPolicy:
+    """
+    Retry Policy.
+
+    Retries requests of idempotent methods on connection errors, timeouts and retryable status codes,
+    using exponential backoff with full jitter, and honoring the ``Retry-After`` header.
+
+    :ivar int retries: Number of retries
+    :ivar int exhausted: Number of retries denied by the retry budget
+    """
+
+    def __init__(self, configuration):
+        """
+        Initialize a Retry Policy.
+
+        :param dict configuration: Retry configuration.
+        """
+        self._max_retries = configuration['max_retries']
+        self._backoff = configuration['backoff']
+        self._max_backoff = configuration['max_backoff']
+        self._jitter = configuration['jitter']
+        self._max_retry_after = configuration['max_retry_after']
+        self._statuses = set(configuration['statuses'])
+        self._methods = {method.upper() for method in configuration['methods']}
+        self._budget = RetryBudget(configuration['budget_ratio'], configuration['budget_capacity'])
+        self.retries = 0
+        self.exhausted = 0
+
+    @property
+    def enabled(self):
+        return self._max_retries > 0
+
+    @property
+    def budget(self):
+        return self._budget
+
+    def on_request(self):
+        self._budget.deposit()
+
+    def retryable(self, request, attempt):
+        """
+        Check if a Request May be Retried.
+
+        :param cterasdk.clients.async_requests.BaseRequest request: Request.
+        :param int attempt: Number of attempts made.
+        :rtype: bool
+        """
+        return (
+            attempt <= self._max_retries and request.method in self._methods
+            and isinstance(request.kwargs.get('data'), (type(None), str, bytes, bytearray))
+        )
+
+    def on_error(self, request, attempt, error):
+        """
+        Get the Delay Before Retrying a Failed Request.
+
+        :param cterasdk.clients.async_requests.BaseRequest request: Request.
+        :param int attempt: Number of attempts made.
+        :param Exception error: Error.
+        :returns: Delay, in seconds, or ``None`` if the request should not be retried.
+        :rtype: float
+        """
+        if not isinstance(error, (ConnectionError, TimeoutError)) or not self.retryable(request, attempt):
+            return None
+        return self._retry(request, attempt, self._delay(attempt), error)
+
+    def on_response(self, request, attempt, response):
+        """
+        Get the Delay Before Retrying a Request.
+
+        :param cterasdk.clients.async_requests.BaseRequest request: Request.
+        :param int attempt: Number of attempts made.
+        :param aiohttp.ClientResponse response: Response.
+        :returns: Delay, in seconds, or ``None`` if the request should not be retried.
+        :rtype: float
+        """
+        if response.status not in self._statuses or not self.retryable(request, attempt):
+            return None
+        delay = self._delay(attempt)
+        if response.status in (HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE):
+            retry_after = RetryPolicy.retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                if retry_after > self._max_retry_after:
+                    logger.debug('Not retrying. Retry-After of %s seconds exceeds the maximum.', retry_after)
+                    return None
+                delay = retry_after
+        return self._retry(request, attempt, delay, response.status)
+
+    def _retry(self, request, attempt, delay, reason):
+        if not self._budget.withdraw():
+            self.exhausted = self.exhausted + 1
+            logger.warning('Retry budget exhausted. Not retrying: %s %s', request.method, request.url)
+            return None
+        self.retries = self.retries + 1
+        logger.debug('Retrying %s %s in %.3f seconds (attempt %s of %s). Reason: %s',
+                     request.method, request.url, delay, attempt + 1, self._max_retries + 1, reason)
+        return delay
+
+    def _delay(self, attempt):
+        delay = min(self._max_backoff, self._backoff * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self._jitter else delay  # nosec: jitter, not cryptography
+
+    @staticmethod
+    def retry_after(value):
+        """
+        Parse a Retry-After Header.
+
+        :param str value: Number of seconds, or an HTTP date.
+        :returns: Number of seconds, or ``None`` if the header is missing or invalid.
+        :rtype: float
+        """
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=datetime.timezone.utc)
+        return max(0.0, (date - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+    def to_dict(self):
+        return {'retries': self.retries, 'exhausted': self.exhausted, 'budget': self._budget.balance}
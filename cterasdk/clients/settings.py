@@ -1,3 +1,4 @@
+import socket
 from aiohttp import TCPConnector, CookieJar, ClientTimeout
 from pydantic import ValidationError
 from cterasdk import settings
@@ -15,8 +16,7 @@ def get_configuration(transport_settings):
     :rtype: dict
     """
     try:
-        parameters = transport_settings.model_dump()
-        ClientSettings.model_validate(parameters)
+        parameters = ClientSettings.model_validate(transport_settings.model_dump()).model_dump()
 
         audit = settings.audit.model_dump()
         Postman.model_validate(audit)
@@ -37,9 +37,35 @@ def from_configuration(configuration):
     """
     parameters = {}
     parameters['cookie_jar'] = CookieJar(**configuration['cookie_jar'])
-    parameters['connector'] = TCPConnector(**configuration['connector'])
+    connector = dict(configuration['connector'])
+    parameters['connector'] = TCPConnector(socket_factory=socket_factory(connector), **connector)
     parameters['timeout'] = ClientTimeout(**configuration['timeout'])
     parameters['trace_configs'] = [requests.tracer(), session.tracer()]
     if configuration['audit']['enabled']:
         parameters['trace_configs'].append(postman.tracer())
     return parameters
+
+
+def socket_factory(connector):
+    """
+    Create a Socket Factory.
+
+    Removes the socket options from the connector configuration.
+
+    :param dict connector: Connector configuration.
+    :returns: Socket factory that applies the socket buffer sizes, or ``None`` to use the default socket factory
+    :rtype: callable
+    """
+    options = [(socket.SO_RCVBUF, connector.pop('rcvbuf', None)), (socket.SO_SNDBUF, connector.pop('sndbuf', None))]
+    options = [(option, value) for option, value in options if value]
+    if not options:
+        return None
+
+    def create(addr_info):
+        family, type_, proto, _, _ = addr_info
+        sock = socket.socket(family=family, type=type_, proto=proto)
+        for option, value in options:
+            sock.setsockopt(socket.SOL_SOCKET, option, value)
+        return sock
+
+    return create
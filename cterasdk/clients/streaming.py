@@ -0,0 +1,67 @@
+import queue
+import asyncio
+import logging
+
+
+logger = logging.getLogger('cterasdk.http')
+
+
+class Prefetcher:
+    """
+    Read Chunks Ahead of a Synchronous Consumer.
+
+    Chunks are read from an asynchronous iterator on an event loop thread, into a bounded queue
+    that is consumed by the calling thread.
+    """
+
+    _end = object()
+
+    def __init__(self, iterator, loop, queue_size):
+        """
+        Initialize a Prefetcher.
+
+        :param object iterator: Asynchronous iterator of chunks.
+        :param asyncio.AbstractEventLoop loop: Event loop, running on another thread.
+        :param int queue_size: Max number of chunks to read ahead of the consumer.
+        """
+        self._iterator = iterator
+        self._loop = loop
+        self._queue_size = queue_size
+        self._queue = queue.Queue()
+        self._slots = None
+        self._future = None
+
+    def start(self):
+        self._future = asyncio.run_coroutine_threadsafe(self._produce(), self._loop)
+        return self
+
+    async def _produce(self):
+        self._slots = asyncio.Semaphore(self._queue_size)
+        try:
+            async for chunk in self._iterator:
+                await self._slots.acquire()
+                self._queue.put(chunk)
+            self._queue.put(Prefetcher._end)
+        except BaseException as error:
+            self._queue.put(error)
+            raise
+        finally:
+            await self._iterator.aclose()
+
+    def __iter__(self):
+        while True:
+            item = self._queue.get()
+            if item is Prefetcher._end:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            self._loop.call_soon_threadsafe(self._slots.release)
+            yield item
+
+    def close(self):
+        """
+        Stop Reading Ahead.
+        """
+        if self._future is not None and not self._future.done():
+            logger.debug('Cancelling read ahead.')
+            self._future.cancel()
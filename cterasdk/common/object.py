@@ -2,7 +2,7 @@ import re
 import json
 import logging
 from datetime import datetime
-from collections.abc import MutableMapping
+from collections.abc import Mapping, MutableMapping
 
 
 logger = logging.getLogger('cterasdk.common')
@@ -13,7 +13,9 @@ class ObjectEncoder(json.JSONEncoder):
     def default(self, o):
         if isinstance(o, datetime):
             return o.isoformat()
-        if o.get('__dict__', None):
+        if callable(getattr(o, 'to_dict', None)):
+            return o.to_dict()
+        if isinstance(o, Mapping) and o.get('__dict__', None):
             return o.__dict__
         return super().default(o)
 
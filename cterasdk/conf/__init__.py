@@ -17,6 +17,15 @@ class ClientCookieJar(BaseSettings):
 
 class ClientConnector(BaseSettings):
     ssl: bool = True
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: Optional[float] = 15
+    use_dns_cache: bool = True
+    ttl_dns_cache: Optional[int] = 10
+    happy_eyeballs_delay: Optional[float] = 0.25
+    interleave: Optional[int] = None
+    rcvbuf: Optional[int] = None
+    sndbuf: Optional[int] = None
 
 
 class ClientTimeout(BaseSettings):
@@ -24,10 +33,58 @@ class ClientTimeout(BaseSettings):
     sock_read: int
 
 
+class ClientRetries(BaseSettings):
+    max_retries: int = 0
+    backoff: float = 0.5
+    max_backoff: float = 30
+    jitter: bool = True
+    max_retry_after: float = 120
+    statuses: list[int] = Field(default_factory=lambda: [429, 502, 503, 504])
+    methods: list[str] = Field(default_factory=lambda: ['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'PROPFIND'])
+    budget_ratio: float = 0.2
+    budget_capacity: int = 10
+
+
+class ClientRateLimit(BaseSettings):
+    rate: Optional[float] = None
+    burst: Optional[int] = None
+    concurrency: Optional[int] = None
+
+
+class ClientRateLimits(BaseSettings):
+    host: ClientRateLimit = Field(default_factory=ClientRateLimit)
+    api: ClientRateLimit = Field(default_factory=ClientRateLimit)
+    webdav: ClientRateLimit = Field(default_factory=ClientRateLimit)
+    upload: ClientRateLimit = Field(default_factory=ClientRateLimit)
+    stats: ClientRateLimit = Field(default_factory=ClientRateLimit)
+
+
+class ClientCircuitBreaker(BaseSettings):
+    threshold: int = 0
+    cooldown: float = 60
+    probes: int = 1
+
+
+class ClientCache(BaseSettings):
+    enabled: bool = False
+    paths: dict[str, float] = Field(default_factory=lambda: {
+        '*/api/settings': 30,
+        '*/api/settings/*': 30,
+        '*/api/defaults/*': 300,
+        '*/api/portalLicenses': 30,
+    })
+    max_size: int = 32 * 1024 * 1024
+    max_entry_size: int = 1024 * 1024
+
+
 class ClientSettings(BaseSettings):
     cookie_jar: ClientCookieJar = Field(default_factory=ClientCookieJar)
     connector: ClientConnector = Field(default_factory=ClientConnector)
     timeout: ClientTimeout = Field(default_factory=ClientTimeout)
+    retries: ClientRetries = Field(default_factory=ClientRetries)
+    rate_limits: ClientRateLimits = Field(default_factory=ClientRateLimits)
+    circuit_breaker: ClientCircuitBreaker = Field(default_factory=ClientCircuitBreaker)
+    cache: ClientCache = Field(default_factory=ClientCache)
 
 
 class SynchronousClient(BaseSettings):
@@ -69,16 +126,87 @@ class Portal(BaseSettings):
 
 class Streamer(BaseSettings):
     max_workers: int = 20
+    max_blocks: int = 40
+    max_bytes: Optional[int] = 256 * 1024 * 1024
+
+
+class AdaptiveConcurrency(BaseSettings):
+    enabled: bool = False
+    min_workers: int = 1
+    max_workers: int = 64
+    tolerance: float = 2.0
+    backoff: float = 0.5
+
+
+class Hedging(BaseSettings):
+    enabled: bool = False
+    percentile: float = 95
+    min_samples: int = 20
+    max_ratio: float = 0.05
+    min_delay: float = 0.05
+
+
+class Pipeline(BaseSettings):
+    incremental: bool = False
+    chunk_size: int = 256 * 1024
+
+
+class Batch(BaseSettings):
+    max_files: int = 64
+    max_workers_per_file: int = 4
+    max_bytes: Optional[int] = 256 * 1024 * 1024
+
+
+class MetadataCache(BaseSettings):
+    max_size: int = 1024
+    max_ttl: int = 300
+    margin: int = 30
+
+
+class Reader(BaseSettings):
+    cache_size: int = 32
+    prefetch: int = 4
+
+
+class BlockExecutor(BaseSettings):
+    type: Literal["thread", "process", "inline"] = 'thread'
+    max_workers: Optional[int] = None
+
+
+class Writer(BaseSettings):
+    mmap: bool = False
+    fsync_interval: Optional[int] = 64 * 1024 * 1024
+
+
+class Uploader(BaseSettings):
+    block_size: int = 4 * 1024 * 1024
+    compression: Literal["SNAPPY", "GZIP"] = 'SNAPPY'
+    max_workers: int = 20
 
 
 class DirectIO(BaseSettings):
     api: AsynchronousClient = Field(default_factory=AsynchronousClient)
     storage: AsynchronousClient = Field(default_factory=AsynchronousClient)
     streamer: Streamer = Field(default_factory=Streamer)
+    concurrency: AdaptiveConcurrency = Field(default_factory=AdaptiveConcurrency)
+    hedging: Hedging = Field(default_factory=Hedging)
+    pipeline: Pipeline = Field(default_factory=Pipeline)
+    batch: Batch = Field(default_factory=Batch)
+    cache: MetadataCache = Field(default_factory=MetadataCache)
+    reader: Reader = Field(default_factory=Reader)
+    executor: BlockExecutor = Field(default_factory=BlockExecutor)
+    writer: Writer = Field(default_factory=Writer)
+    uploader: Uploader = Field(default_factory=Uploader)
+
+
+class Streaming(BaseSettings):
+    chunk_size: int = 1024 * 1024
+    queue_size: int = 0
 
 
 class IO(BaseSettings):
     direct: DirectIO = Field(default_factory=DirectIO)
+    streaming: Streaming = Field(default_factory=Streaming)
     downloads: str = '~/Downloads'
 
 
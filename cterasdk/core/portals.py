@@ -134,6 +134,7 @@ class Portals(BaseCommand):
         :param str tenant: Name of the tenant to browse
         """
         self._core.api.put('/currentPortal', tenant)
+        self._core.api.cache.clear()
 
     def browse_global_admin(self):
         """
@@ -0,0 +1,134 @@
+import time
+import logging
+from datetime import datetime, timezone
+from collections import OrderedDict
+
+import yarl
+
+
+logger = logging.getLogger('cterasdk.direct')
+
+
+def signed_url_expiry(url):
+    """
+    Get the Expiry of a Signed URL.
+
+    Supports AWS Signature Version 4 and 2, Google Cloud Storage and Azure Shared Access Signature URLs.
+
+    :param str url: Signed URL.
+    :returns: Expiry, in seconds since the epoch, or ``None`` if could not be determined.
+    :rtype: float
+    """
+    try:
+        query = dict(yarl.URL(url).query)
+        for date, expires in [('X-Amz-Date', 'X-Amz-Expires'), ('X-Goog-Date', 'X-Goog-Expires')]:
+            if date in query and expires in query:
+                signed = datetime.strptime(query[date], '%Y%m%dT%H%M%SZ').replace(tzinfo=timezone.utc)
+                return signed.timestamp() + int(query[expires])
+        if 'Expires' in query:
+            return float(query['Expires'])
+        if 'se' in query:
+            expiry = datetime.fromisoformat(query['se'].replace('Z', '+00:00'))
+            return (expiry if expiry.tzinfo is not None else expiry.replace(tzinfo=timezone.utc)).timestamp()
+    except ValueError as error:
+        logger.debug('Could not determine signed URL expiry. %s', error)
+    return None
+
+
+def signed_url_expired(url):
+    """
+    Check if a Signed URL Expired.
+
+    :param str url: Signed URL.
+    :returns: ``True`` if the signed URL expired, ``False`` if not or if its expiry could not be determined.
+    :rtype: bool
+    """
+    expiry = signed_url_expiry(url)
+    return expiry is not None and expiry <= time.time()
+
+
+class MetadataCache:
+    """
+    LRU Cache of Direct IO File Metadata.
+
+    Entries expire before the earliest signed URL of the file expires. Metadata, including decrypted
+    encryption keys, is held in memory only.
+    """
+
+    def __init__(self, max_size, max_ttl, margin=0):
+        """
+        Initialize a Metadata Cache.
+
+        :param int max_size: Max number of files.
+        :param int max_ttl: Max time to live, in seconds. Used as is if the signed URL expiry could not be determined.
+        :param int, optional margin: Evict entries this many seconds before the signed URLs expire, defaults to ``0``
+        """
+        self._max_size = max_size
+        self._max_ttl = max_ttl
+        self._margin = margin
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def ttl(self, metadata):
+        """
+        Get the Time to Live of File Metadata.
+
+        :param cterasdk.direct.types.Metadata metadata: Direct I/O file metadata.
+        :returns: Time to live, in seconds.
+        :rtype: float
+        """
+        expiry = [signed_url_expiry(chunk.url) for chunk in metadata.chunks]
+        if None in expiry:
+            return self._max_ttl
+        return max(0, min(self._max_ttl, min(expiry) - time.time() - self._margin))
+
+    def get(self, file_id):
+        """
+        Get File Metadata.
+
+        :param int file_id: File ID.
+        :returns: Direct I/O file metadata, or ``None`` if not found or expired.
+        :rtype: cterasdk.direct.types.Metadata
+        """
+        entry = self._entries.get(file_id)
+        if entry is not None:
+            deadline, metadata = entry
+            if time.monotonic() < deadline:
+                self._entries.move_to_end(file_id)
+                self.hits = self.hits + 1
+                return metadata
+            logger.debug('Metadata expired for file ID: %s', file_id)
+            del self._entries[file_id]
+        self.misses = self.misses + 1
+        return None
+
+    def put(self, metadata):
+        """
+        Add File Metadata.
+
+        :param cterasdk.direct.types.Metadata metadata: Direct I/O file metadata.
+        """
+        if not self._max_size:
+            return
+        ttl = self.ttl(metadata)
+        if ttl <= 0:
+            return
+        self._entries[metadata.file_id] = (time.monotonic() + ttl, metadata)
+        self._entries.move_to_end(metadata.file_id)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, file_id=None):
+        """
+        Invalidate File Metadata.
+
+        :param int, optional file_id: File ID, defaults to invalidating all files.
+        """
+        if file_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(file_id, None)
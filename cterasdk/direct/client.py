@@ -1,14 +1,32 @@
+import logging
 import asyncio
+import functools
+from contextlib import nullcontext
 import cterasdk.settings
 
 from . import filters
 from .credentials import KeyPair, Bearer
-from .lib import get_chunks, decrypt_encryption_key, process_chunks
-from .types import ByteRange
+from .lib import get_chunks, decrypt_encryption_key, process_chunk, process_chunks, schedule_chunks, upload_chunks
+from .types import ByteRange, Metadata, CompressionLib
 from .stream import Streamer
+from .scheduler import ByteBudget
+from .concurrency import AdaptiveConcurrency
+from .hedging import Hedging
+from .executor import BlockExecutor
+from .telemetry import Timings
+from .writer import FileWriter
+from .source import FileSource
+from .journal import Journal
+from .cache import MetadataCache
+from .reader import DirectIOFile
 
 from ..objects.endpoints import DefaultBuilder, EndpointBuilder
 from ..clients.clients import AsyncClient, AsyncJSON
+from ..common import Object
+from ..exceptions.direct import SignedURLExpired
+
+
+logger = logging.getLogger('cterasdk.direct')
 
 
 class DirectIO:
@@ -16,7 +34,7 @@ class DirectIO:
     async def __aenter__(self):
         return self
 
-    def __init__(self, baseurl=None, access_key_id=None, secret_access_key=None, bearer=None):
+    def __init__(self, baseurl=None, access_key_id=None, secret_access_key=None, bearer=None, executor=None):
         """
         Initialize a CTERA Direct IO Client.
 
@@ -24,22 +42,140 @@ class DirectIO:
         :param str, optional access_key_id: Access key.
         :param str, optional secret_access_key: Secret key.
         :param str, optional bearer: Bearer token.
+        :param object, optional executor: CPU executor for decryption and decompression: ``thread``, ``process``, ``inline``,
+         or a ``concurrent.futures.Executor`` object. Defaults to ``cterasdk.settings.io.direct.executor``
         """
         self._api = AsyncJSON(EndpointBuilder.new(baseurl, '/directio'), settings=cterasdk.settings.io.direct.api.settings,
                               authenticator=lambda *_: True)
         self._client = AsyncClient(DefaultBuilder(), settings=cterasdk.settings.io.direct.storage.settings, authenticator=lambda *_: True)
         self._credentials = Bearer(bearer) if bearer else KeyPair(access_key_id, secret_access_key)
+        config = cterasdk.settings.io.direct
+        self._executor = BlockExecutor.create(executor if executor is not None else config.executor.type, config.executor.max_workers)
+        self._timings = Timings()
+        self._cache = MetadataCache(config.cache.max_size, config.cache.max_ttl, config.cache.margin)
+        self._refreshing = {}
+        self._concurrency = AdaptiveConcurrency(
+            config.streamer.max_workers, config.concurrency.min_workers, config.concurrency.max_workers,
+            config.concurrency.tolerance, config.concurrency.backoff
+        ) if config.concurrency.enabled else None
+        self._hedging = Hedging(
+            config.hedging.percentile, config.hedging.min_samples, config.hedging.max_ratio, config.hedging.min_delay
+        ) if config.hedging.enabled else None
+        self._chunk_size = config.pipeline.chunk_size if config.pipeline.incremental else None
+
+    @property
+    def cache(self):
+        """
+        File Metadata Cache.
+
+        :rtype: cterasdk.direct.cache.MetadataCache
+        """
+        return self._cache
+
+    @property
+    def timings(self):
+        """
+        Per-Stage Timing of the Block Pipeline.
+
+        :rtype: cterasdk.direct.telemetry.Timings
+        """
+        return self._timings
+
+    @property
+    def concurrency(self):
+        """
+        Adaptive Concurrency Controller, if enabled in ``cterasdk.settings.io.direct.concurrency``.
+
+        :rtype: cterasdk.direct.concurrency.AdaptiveConcurrency
+        """
+        return self._concurrency
+
+    @property
+    def hedging(self):
+        """
+        Hedged Requests, if enabled in ``cterasdk.settings.io.direct.hedging``.
+
+        :rtype: cterasdk.direct.hedging.Hedging
+        """
+        return self._hedging
+
+    def _semaphore(self, max_workers, default=None):
+        """
+        Limit Concurrent Block Retrieval.
+
+        The adaptive concurrency controller, if enabled, replaces the default limit,
+        and an explicit limit is used as a ceiling for the adaptive limits.
+
+        :param int max_workers: Max concurrent tasks, or ``None`` to use the default.
+        :param int, optional default: Default max concurrent tasks.
+        """
+        if self._concurrency is not None:
+            return self._concurrency.bounded(max_workers) if max_workers else self._concurrency
+        max_workers = max_workers if max_workers is not None else default
+        return asyncio.Semaphore(max_workers) if max_workers else None
+
+    def _workers(self, max_workers, default):
+        """
+        Get the Number of Workers Retrieving Blocks of a File.
+
+        :param int max_workers: Max concurrent tasks, or ``None`` to use the default.
+        :param int default: Default max concurrent tasks.
+        """
+        if max_workers:
+            return max_workers
+        if self._concurrency is not None:
+            return cterasdk.settings.io.direct.concurrency.max_workers
+        return default
 
     async def _chunks(self, file_id):
-        metadata = await get_chunks(self._api, self._credentials.bearer, file_id)
+        metadata = self._cache.get(file_id)
+        if metadata is not None:
+            return metadata
+        metadata = await get_chunks(self._api, self._credentials.bearer, file_id, timings=self._timings)
         if metadata.encrypted:
             metadata.encryption_key = decrypt_encryption_key(
                 metadata.file_id,
                 metadata.encryption_key,
                 self._credentials.secret_access_key
             )
+        self._cache.put(metadata)
         return metadata
 
+    def _refresh(self, file_id):
+        """
+        Get a Coroutine Function Renewing the Signed URL of a Chunk of a File.
+
+        :param int file_id: File ID.
+        """
+        return functools.partial(self._renew, file_id) if file_id is not None else None
+
+    async def _renew(self, file_id, chunk):
+        """
+        Renew the Signed URL of a Chunk.
+
+        File metadata is invalidated and retrieved once for all chunks of the file whose signed URL expired.
+
+        :param int file_id: File ID.
+        :param cterasdk.direct.types.Chunk chunk: Chunk whose signed URL expired.
+        :returns: Chunk with a new signed URL.
+        :rtype: cterasdk.direct.types.Chunk
+        :raises: cterasdk.exceptions.direct.SignedURLExpired: If the blocks of the file changed.
+        """
+        metadata = self._cache.get(file_id)
+        if metadata is None or len(metadata.chunks) < chunk.number or metadata.chunks[chunk.number - 1].url == chunk.url:
+            task = self._refreshing.get(file_id)
+            if task is None:
+                logger.debug('Signed URL expired. Retrieving metadata for file ID: %s', file_id)
+                self._cache.invalidate(file_id)
+                task = self._refreshing[file_id] = asyncio.ensure_future(self._chunks(file_id))
+                task.add_done_callback(lambda _: self._refreshing.pop(file_id, None))
+            metadata = await asyncio.shield(task)
+        renewed = metadata.chunks[chunk.number - 1] if len(metadata.chunks) >= chunk.number else None
+        if renewed is None or (renewed.offset, renewed.length) != (chunk.offset, chunk.length):
+            logger.error('Blocks of file ID %s changed while reading the file.', file_id)
+            raise SignedURLExpired(file_id, chunk)
+        return renewed
+
     async def metadata(self, file_id):
         """
         Get File Metadata.
@@ -63,19 +199,224 @@ class DirectIO:
         executor = self.executor(await self._chunks(file_id), byte_range=byte_range, max_workers=max_workers)
         return await executor()
 
-    async def streamer(self, file_id, byte_range=None, max_workers=None):
+    async def streamer(self, file_id, byte_range=None, max_workers=None, max_blocks=None, max_bytes=None):
         """
         Stream API.
 
+        Blocks are retrieved ahead of the consumer using a bounded sliding window.
+        Defaults are read from ``cterasdk.settings.io.direct.streamer``.
+
         :param int file_id: File ID.
         :param cterasdk.direct.types.ByteRange, optional byte_range: Byte range.
         :param int, optional max_workers: Max concurrent tasks.
+        :param int, optional max_blocks: Max number of blocks to retrieve ahead of the consumer.
+        :param int, optional max_bytes: Max number of bytes to retrieve ahead of the consumer.
         :returns: Streamer object.
         :rtype: cterasdk.direct.stream.Streamer
         """
-        executor = self.executor(await self._chunks(file_id), byte_range=byte_range, max_workers=max_workers)
+        byte_range = byte_range if byte_range is not None else ByteRange.default()
+        executor = self.scheduler(await self._chunks(file_id), byte_range=byte_range, max_workers=max_workers,
+                                  max_blocks=max_blocks, max_bytes=max_bytes)
         return Streamer(executor, byte_range)
 
+    async def open(self, file_id, cache_size=None, prefetch=None, max_workers=None):
+        """
+        Open a File for Random-Access Reading.
+
+        Defaults are read from ``cterasdk.settings.io.direct.reader``.
+
+        :param int file_id: File ID.
+        :param int, optional cache_size: Max number of decrypted and decompressed blocks to cache.
+        :param int, optional prefetch: Number of blocks to prefetch on sequential access.
+        :param int, optional max_workers: Max concurrent tasks.
+        :returns: Seekable, read-only file object.
+        :rtype: cterasdk.direct.reader.DirectIOFile
+        """
+        config = cterasdk.settings.io.direct
+        metadata = await self._chunks(file_id)
+        semaphore = self._semaphore(max_workers, config.streamer.max_workers)
+
+        async def fetch(number):
+            metadata = await self._chunks(file_id)  # Refresh signed URLs on expiry
+            return await process_chunk(self._client, file_id, metadata.chunks[number - 1], metadata.encryption_key, semaphore,
+                                       self._executor, self._timings, hedging=self._hedging, chunk_size=self._chunk_size,
+                                       refresh=self._refresh(file_id))
+
+        return DirectIOFile(metadata, fetch, asyncio.get_running_loop(),
+                            cache_size if cache_size is not None else config.reader.cache_size,
+                            prefetch if prefetch is not None else config.reader.prefetch)
+
+    async def download(self, file_id, path, max_workers=None, max_bytes=None, resume=False):
+        """
+        Download a File.
+
+        Blocks are written at their offset as they complete, to a preallocated temporary file
+        that is renamed to its destination once all blocks were written. Bytes are reserved from
+        the byte budget until their block is written, so that memory is bounded when the disk is slower than the network.
+        Defaults are read from ``cterasdk.settings.io.direct.streamer``.
+
+        :param int file_id: File ID.
+        :param str path: Destination path.
+        :param int, optional max_workers: Max concurrent tasks.
+        :param int, optional max_bytes: Max number of bytes retrieved and not yet written.
+        :param bool, optional resume: Record completed blocks in a journal next to the destination,
+         and download only the missing blocks if a previous attempt failed. Defaults to ``False``
+        :returns: Destination path.
+        :rtype: str
+        """
+        config = cterasdk.settings.io.direct.streamer
+        max_bytes = max_bytes if max_bytes is not None else config.max_bytes
+        return await self._download(await self._chunks(file_id), path, self._semaphore(max_workers, config.max_workers),
+                                    self._workers(max_workers, config.max_workers), ByteBudget(max_bytes) if max_bytes else None,
+                                    resume)
+
+    async def download_many(self, files, max_workers=None, max_files=None, max_bytes=None, resume=False):
+        """
+        Download Multiple Files.
+
+        Block retrieval of all files shares one concurrency and byte budget. File metadata is retrieved
+        while blocks of other files are downloaded, and the number of blocks each file may have in flight
+        is limited, so that blocks of small files are interleaved with blocks of large files.
+        Defaults are read from ``cterasdk.settings.io.direct``.
+
+        :param dict[int, str] files: Dictionary of destination paths, keyed by file ID.
+        :param int, optional max_workers: Max concurrent tasks, across all files.
+        :param int, optional max_files: Max number of files in progress.
+        :param int, optional max_bytes: Max number of bytes in flight, across all files.
+        :param bool, optional resume: Resume downloads that failed in a previous attempt, defaults to ``False``
+        :returns: Dictionary of destination paths or exceptions, keyed by file ID.
+        :rtype: dict
+        """
+        config = cterasdk.settings.io.direct
+        semaphore = self._semaphore(max_workers, config.streamer.max_workers)
+        max_workers = max_workers if max_workers is not None else config.streamer.max_workers
+        max_files = max_files if max_files is not None else config.batch.max_files
+        max_bytes = max_bytes if max_bytes is not None else config.batch.max_bytes
+        files_semaphore = asyncio.Semaphore(max_files) if max_files else None
+        budget = ByteBudget(max_bytes) if max_bytes else None
+        workers = config.batch.max_workers_per_file or self._workers(max_workers, config.streamer.max_workers)
+
+        async def download_file(file_id, path):
+            async with files_semaphore if files_semaphore else nullcontext():
+                metadata = await self._chunks(file_id)
+                return await self._download(metadata, path, semaphore, workers, budget, resume)
+
+        files = dict(files)
+        logger.debug('Downloading %s files using up to %s workers.', len(files), max_workers or 'unlimited')
+        results = await asyncio.gather(*[download_file(file_id, path) for file_id, path in files.items()], return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+        return dict(zip(files.keys(), results))
+
+    async def _download(self, metadata, path, semaphore, workers, budget=None, resume=False):  # pylint: disable=too-many-arguments
+        """
+        Download a File.
+
+        Blocks are retrieved and written by a pool of workers, so that the number of blocks in flight is bounded.
+
+        :param cterasdk.direct.types.Metadata metadata: Direct I/O file metadata.
+        :param str path: Destination path.
+        :param object semaphore: ``asyncio.Semaphore``, or adaptive concurrency controller, limiting block retrieval.
+        :param int workers: Number of workers, limiting blocks in flight.
+        :param cterasdk.direct.scheduler.ByteBudget, optional budget: Byte budget, limiting bytes retrieved and not yet written.
+        :param bool, optional resume: Resume download from journal.
+        :returns: Destination path.
+        :rtype: str
+        """
+        config = cterasdk.settings.io.direct
+        journal = Journal(path, metadata).open() if resume else None
+        chunks = journal.missing(metadata) if journal else metadata.chunks
+        writer = FileWriter(path, metadata.size, config.writer.mmap, config.writer.fsync_interval, journal)
+        writer.open(truncate=len(chunks) == len(metadata.chunks))
+
+        pending = iter(chunks)
+
+        async def worker():
+            for chunk in pending:
+                async with budget.reserve(chunk.length) if budget else nullcontext():
+                    block = await process_chunk(self._client, metadata.file_id, chunk, metadata.encryption_key, semaphore,
+                                                self._executor, self._timings, writer.buffer(chunk.offset, chunk.length), self._hedging,
+                                                self._chunk_size, self._refresh(metadata.file_id))
+                    await writer.write(block.offset, block.data)
+                if journal:
+                    journal.complete(chunk)
+
+        futures = [asyncio.create_task(worker()) for _ in range(min(workers, len(chunks)))]
+        try:
+            await asyncio.gather(*futures)
+            await writer.commit()
+        except BaseException:
+            self._cache.invalidate(metadata.file_id)
+            for future in futures:
+                future.cancel()
+            await asyncio.gather(*futures, return_exceptions=True)
+            writer.abort(keep=resume)
+            if journal:
+                journal.close()
+            raise
+        if journal:
+            journal.remove()
+        return writer.path
+
+    async def upload(self, path, urls, encryption_key, file_id=None, block_size=None, compression_library=None, max_workers=None):
+        """
+        Upload a File.
+
+        The file is split into blocks, and each block is compressed, encrypted and uploaded to a signed URL.
+        Blocks are read from the source as upload slots become available, so that the number of blocks in memory is bounded.
+        Defaults are read from ``cterasdk.settings.io.direct.uploader``.
+
+        :param str path: Source path.
+        :param object urls: Signed URLs to upload blocks to, either a list ordered by block number,
+         or a callable that accepts a block number, starting at 1, and returns a signed URL.
+        :param object encryption_key: Folder encryption key, or a wrapped folder encryption key to decrypt using the secret access key.
+         A wrapped key requires a client initialized with a key pair.
+        :param int, optional file_id: File ID, for logging and errors.
+        :param int, optional block_size: Block size, in bytes.
+        :param str, optional compression_library: Compression library, ``CompressionLib.Snappy`` or ``CompressionLib.Gzip``.
+         Uncompressed blocks are not supported, since blocks are decompressed when read.
+        :param int, optional max_workers: Max concurrent tasks.
+        :returns: Metadata of the uploaded file, in the format returned by the Direct IO API.
+        :rtype: cterasdk.direct.types.Metadata
+        """
+        config = cterasdk.settings.io.direct.uploader
+        block_size = block_size if block_size is not None else config.block_size
+        compression_library = compression_library if compression_library is not None else config.compression
+        if compression_library not in (CompressionLib.Snappy, CompressionLib.Gzip):
+            raise ValueError(f'Unsupported compression library: {compression_library}. Expected: SNAPPY or GZIP.')
+        if isinstance(encryption_key, str):
+            if not isinstance(self._credentials, KeyPair):
+                raise ValueError('Decrypting a wrapped encryption key requires a secret access key. '
+                                 'Initialize the client with a key pair, or pass the decrypted encryption key.')
+            encryption_key = decrypt_encryption_key(file_id, encryption_key, self._credentials.secret_access_key)
+
+        with FileSource(path) as source:
+            lengths = [min(block_size, source.size - offset) for offset in range(0, source.size, block_size)] or [0]
+            if callable(urls):
+                urls = [urls(number) for number in range(1, len(lengths) + 1)]
+            elif len(urls) < len(lengths):
+                raise ValueError(f'Expected {len(lengths)} signed URLs, received {len(urls)}.')
+            server_object = Object(
+                encrypt_info=Object(data_encrypted=True, wrapped_key=None),
+                compression_type=compression_library,
+                chunks=[Object(url=url, len=length) for url, length in zip(urls, lengths)]
+            )
+            metadata = Metadata(file_id, server_object)
+            metadata.encryption_key = encryption_key
+
+            futures = await upload_chunks(self._client, file_id, metadata.chunks, source, encryption_key, compression_library,
+                                          self._semaphore(max_workers, config.max_workers), self._executor, self._timings)
+            try:
+                await asyncio.gather(*futures)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                await asyncio.gather(*futures, return_exceptions=True)
+                raise
+        logger.debug('Uploaded file: %s', path)
+        return metadata
+
     def executor(self, metadata, file_id=None, byte_range=None, max_workers=None):
         """
         Download Executor.
@@ -96,13 +437,45 @@ class DirectIO:
             Asynchronous Executable of Chunk Retrieval Tasks.
             """
             return await process_chunks(self._client, file_id, chunks, metadata.encryption_key,
-                                        asyncio.Semaphore(max_workers) if max_workers else None)
+                                        self._semaphore(max_workers), self._executor, self._timings, self._hedging,
+                                        self._chunk_size, self._refresh(metadata.file_id))
+
+        return execute
+
+    def scheduler(self, metadata, file_id=None, byte_range=None, max_workers=None, max_blocks=None, max_bytes=None):
+        """
+        Sliding Window Download Executor.
+
+        :param cterasdk.direct.types.Metadata metadata: Direct I/O file metadata.
+        :param int, optional file_id: File ID.
+        :param cterasdk.direct.types.ByteRange, optional byte_range: Byte range.
+        :param int, optional max_workers: Max concurrent tasks.
+        :param int, optional max_blocks: Max number of blocks to retrieve ahead of the consumer.
+        :param int, optional max_bytes: Max number of bytes to retrieve ahead of the consumer.
+        :returns: Callable downloader.
+        :rtype: function
+        """
+        config = cterasdk.settings.io.direct.streamer
+        byte_range = byte_range if byte_range is not None else ByteRange.default()
+        chunks = filters.span(metadata, byte_range)
+        file_id = file_id if file_id is not None else metadata.file_id
+        max_blocks = max_blocks if max_blocks is not None else config.max_blocks
+        max_bytes = max_bytes if max_bytes is not None else config.max_bytes
+
+        async def execute():
+            """
+            Asynchronous Executable of a Sliding Window of Chunk Retrieval Tasks.
+            """
+            return schedule_chunks(self._client, file_id, chunks, metadata.encryption_key,
+                                   self._semaphore(max_workers, config.max_workers), max_blocks, max_bytes,
+                                   self._executor, self._timings, self._hedging, self._chunk_size, self._refresh(metadata.file_id))
 
         return execute
 
     async def close(self):
         await self._api.close()
         await self._client.close()
+        self._executor.shutdown(wait=False)
 
     async def __aexit__(self, exc_type, exc, tb):
         await self.close()
@@ -0,0 +1,29 @@
+import logging
+import gzip
+import snappy
+from .types import CompressionLib
+from ..exceptions.direct import DirectIOError
+
+
+logger = logging.getLogger('cterasdk.direct')
+
+
+def compress(block, compression_library=CompressionLib.Snappy):
+    """
+    Compress a Block.
+
+    :param bytes block: Block
+    :param str,optional compression_library: Compression library, ``CompressionLib.Snappy`` or ``CompressionLib.Gzip``. Defaults to Snappy
+    :returns: Compressed Block
+    :rtype: bytes
+    """
+    try:
+        logger.debug('Compressing Block.')
+        if compression_library == CompressionLib.Snappy:
+            return snappy.compress(block)
+        if compression_library == CompressionLib.Gzip:
+            return gzip.compress(block)
+        raise ValueError(f'Unsupported compression library: {compression_library}')
+    except (TypeError, ValueError) as error:
+        logger.error('Failed to compress block. %s', error)
+    raise DirectIOError()
@@ -0,0 +1,241 @@
+import copy
+import time
+import asyncio
+import logging
+from contextlib import asynccontextmanager, nullcontext
+
+import yarl
+
+from ..exceptions.direct import DownloadTimeout, DownloadConnectionError, UploadTimeout, UploadConnectionError
+
+
+logger = logging.getLogger('cterasdk.direct')
+
+
+MiB = 1024 * 1024
+
+
+class AdaptiveLimit:  # pylint: disable=too-many-instance-attributes
+    """
+    Adaptive Concurrency Limit.
+
+    An additive-increase, multiplicative-decrease (AIMD) limit of requests in flight.
+    The limit grows by one request per window of successful requests whose latency per byte is within
+    ``tolerance`` times the lowest observed latency per byte, and shrinks multiplicatively on timeouts,
+    connection errors or latency above the tolerance. Latency includes decryption and decompression,
+    so that the limit converges to the capacity of the entire block pipeline.
+    Requests that started before a decrease do not trigger another decrease.
+
+    :ivar float limit: Current limit
+    :ivar int in_flight: Requests in flight
+    :ivar int successes: Successful requests
+    :ivar int timeouts: Timed out requests
+    :ivar int errors: Failed connection attempts
+    :ivar int increases: Number of times the limit grew by a request
+    :ivar int decreases: Number of limit decreases
+    :ivar float min_latency: Lowest observed latency, in seconds per MiB
+    :ivar float latency: Exponentially weighted moving average of the latency, in seconds per MiB
+    :ivar int bytes: Bytes retrieved
+    """
+
+    def __init__(self, initial, minimum=1, maximum=64, tolerance=2.0, backoff=0.5, smoothing=0.2):  # pylint: disable=too-many-arguments
+        """
+        Initialize an Adaptive Limit.
+
+        :param int initial: Initial limit.
+        :param int, optional minimum: Min limit, defaults to ``1``
+        :param int, optional maximum: Max limit, defaults to ``64``
+        :param float, optional tolerance: Ratio of latency to lowest observed latency considered congested, defaults to ``2.0``
+        :param float, optional backoff: Multiplier applied to the limit on congestion, defaults to ``0.5``
+        :param float, optional smoothing: Weight of new latency samples in the moving average, defaults to ``0.2``
+        """
+        self._minimum = minimum
+        self._maximum = maximum
+        self._tolerance = tolerance
+        self._backoff = backoff
+        self._smoothing = smoothing
+        self._condition = asyncio.Condition()
+        self._start = time.monotonic()
+        self._decreased = self._start
+        self.limit = float(min(max(initial, minimum), maximum))
+        self.in_flight = 0
+        self.successes = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.increases = 0
+        self.decreases = 0
+        self.min_latency = None
+        self.latency = None
+        self.bytes = 0
+
+    @property
+    def throughput(self):
+        """
+        Average throughput, in bytes per second.
+        """
+        elapsed = time.monotonic() - self._start
+        return self.bytes / elapsed if elapsed > 0 else 0.0
+
+    async def acquire(self):
+        """
+        Wait for a Slot.
+
+        :returns: Start time.
+        :rtype: float
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight = self.in_flight + 1
+        return time.monotonic()
+
+    async def release(self):
+        async with self._condition:
+            self.in_flight = self.in_flight - 1
+            self._condition.notify_all()
+
+    def on_success(self, start, length):
+        """
+        Record a Successful Request.
+
+        :param float start: Start time.
+        :param int length: Bytes retrieved.
+        """
+        self.successes = self.successes + 1
+        self.bytes = self.bytes + length
+        latency = (time.monotonic() - start) * MiB / max(length, 1)
+        self.min_latency = latency if self.min_latency is None else min(self.min_latency, latency)
+        self.latency = latency if self.latency is None else (1 - self._smoothing) * self.latency + self._smoothing * latency
+        if self.min_latency and self.latency > self._tolerance * self.min_latency:
+            self._decrease(start, 'latency')
+        elif self.limit < self._maximum:
+            limit = min(self._maximum, self.limit + 1 / self.limit)
+            if int(limit) > int(self.limit):
+                logger.debug('Increasing concurrency limit from %s to %s.', int(self.limit), int(limit))
+                self.increases = self.increases + 1
+            self.limit = limit
+
+    def on_timeout(self, start):
+        self.timeouts = self.timeouts + 1
+        self._decrease(start, 'timeout')
+
+    def on_error(self, start):
+        self.errors = self.errors + 1
+        self._decrease(start, 'connection error')
+
+    def _decrease(self, start, reason):
+        if start < self._decreased:
+            return
+        self._decreased = time.monotonic()
+        limit = max(self._minimum, self.limit * self._backoff)
+        if int(limit) < int(self.limit):
+            logger.debug('Decreasing concurrency limit from %s to %s due to %s.', int(self.limit), int(limit), reason)
+            self.decreases = self.decreases + 1
+            self.latency = None  # Re-evaluate latency at the new limit
+        self.limit = limit
+
+    def to_dict(self):
+        return {
+            'limit': int(self.limit),
+            'in_flight': self.in_flight,
+            'successes': self.successes,
+            'timeouts': self.timeouts,
+            'errors': self.errors,
+            'increases': self.increases,
+            'decreases': self.decreases,
+            'min_latency': self.min_latency,
+            'latency': self.latency,
+            'bytes': self.bytes,
+            'throughput': self.throughput
+        }
+
+
+class AdaptiveConcurrency:
+    """
+    Adaptive Concurrency Controller for Block Retrieval.
+
+    Maintains an adaptive limit per storage host.
+    """
+
+    def __init__(self, initial, minimum=1, maximum=64, tolerance=2.0, backoff=0.5):  # pylint: disable=too-many-arguments
+        """
+        Initialize an Adaptive Concurrency Controller.
+
+        :param int initial: Initial limit, per storage host.
+        :param int, optional minimum: Min limit, per storage host, defaults to ``1``
+        :param int, optional maximum: Max limit, per storage host, defaults to ``64``
+        :param float, optional tolerance: Ratio of latency to lowest observed latency considered congested, defaults to ``2.0``
+        :param float, optional backoff: Multiplier applied to the limit on congestion, defaults to ``0.5``
+        """
+        self._parameters = {'initial': initial, 'minimum': minimum, 'maximum': maximum, 'tolerance': tolerance, 'backoff': backoff}
+        self._hosts = {}
+        self._ceiling = None
+
+    def bounded(self, max_workers):
+        """
+        Limit Concurrent Transfers to a Ceiling, in Addition to the Adaptive Limits.
+
+        :param int max_workers: Max concurrent transfers, across all storage hosts.
+        :returns: Adaptive concurrency controller sharing the adaptive limits of this controller.
+        :rtype: cterasdk.direct.concurrency.AdaptiveConcurrency
+        """
+        bounded = copy.copy(self)
+        bounded._ceiling = asyncio.Semaphore(max_workers)  # pylint: disable=protected-access
+        return bounded
+
+    def host(self, host):
+        """
+        Get the Adaptive Limit of a Storage Host.
+
+        :param str host: Host name.
+        :rtype: cterasdk.direct.concurrency.AdaptiveLimit
+        """
+        limit = self._hosts.get(host)
+        if limit is None:
+            limit = self._hosts[host] = AdaptiveLimit(**self._parameters)
+        return limit
+
+    @asynccontextmanager
+    async def acquire(self, chunk):
+        """
+        Acquire a Slot for Transferring a Chunk, and Record the Outcome.
+
+        :param cterasdk.direct.types.Chunk chunk: Chunk.
+        """
+        async with self._ceiling if self._ceiling is not None else nullcontext():
+            limit = self.host(yarl.URL(chunk.url).host)
+            start = await limit.acquire()
+            try:
+                yield
+                limit.on_success(start, chunk.length)
+            except (DownloadTimeout, UploadTimeout):
+                limit.on_timeout(start)
+                raise
+            except (DownloadConnectionError, UploadConnectionError):
+                limit.on_error(start)
+                raise
+            finally:
+                await limit.release()
+
+    @asynccontextmanager
+    async def slot(self, chunk):
+        """
+        Acquire a Slot for Transferring a Chunk, Without Recording the Outcome.
+
+        :param cterasdk.direct.types.Chunk chunk: Chunk.
+        """
+        async with self._ceiling if self._ceiling is not None else nullcontext():
+            limit = self.host(yarl.URL(chunk.url).host)
+            await limit.acquire()
+            try:
+                yield
+            finally:
+                await limit.release()
+
+    def to_dict(self):
+        """
+        Snapshot of Adaptive Limits.
+
+        :returns: Dictionary of adaptive limit metrics, keyed by storage host.
+        :rtype: dict
+        """
+        return {host: limit.to_dict() for host, limit in self._hosts.items()}
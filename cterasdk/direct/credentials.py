@@ -35,7 +35,7 @@ class Bearer(BaseCredentials):
 
     def __init__(self, bearer):
         logger.debug('Initializing client using Bearer token.')
-        self.bearer = bearer if bearer else os.getenv('cterasdk.io.direct.bearer')
+        self.token = bearer if bearer else os.getenv('cterasdk.io.direct.bearer')
 
     def _bearer(self):
-        return self.bearer
+        return self.token
@@ -1,6 +1,8 @@
+import os
 import base64
 import logging
 import binascii
+from cryptography.hazmat.primitives import padding
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.exceptions import UnsupportedAlgorithm
 from ..common.utils import utf8_decode
@@ -26,15 +28,112 @@ def decrypt_key(wrapped_key, secret):
 
 
 def decrypt_block(block, encryption_key):
+    """
+    Decrypt a Block.
+
+    Decrypts into a preallocated buffer, without copying the encrypted block.
+
+    :param bytes block: Encrypted Block
+    :param bytes encryption_key: Encryption Key
+    :returns: Decrypted Block
+    :rtype: memoryview
+    """
     try:
+        block = memoryview(block)
         initialization_vector = block[1:17]
         encrypted_data = block[17:]
         logger.debug('Decrypting Block.')
         decryptor = Cipher(algorithms.AES(encryption_key), modes.CBC(initialization_vector)).decryptor()
-        decrypted_data = decryptor.update(encrypted_data)
+        decrypted_data = bytearray(len(encrypted_data) + algorithms.AES.block_size // 8 - 1)
+        decrypted_data = memoryview(decrypted_data)[:decryptor.update_into(encrypted_data, decrypted_data)]
         return decrypted_data[:-decrypted_data[-1]]  # Remove CBC Padding
     except ValueError as error:
         logger.error('Failed to decrypt block. Key error. %s', error)
     except UnsupportedAlgorithm as error:
         logger.error('Failed to decrypt block. Unsupported algorithm. %s', error)
     raise DirectIOError()
+
+
+def encrypt_block(block, encryption_key):
+    """
+    Encrypt a Block.
+
+    :param bytes block: Block
+    :param bytes encryption_key: Encryption Key
+    :returns: Encrypted Block, prefixed with a version byte and the initialization vector
+    :rtype: bytes
+    """
+    try:
+        initialization_vector = os.urandom(16)
+        logger.debug('Encrypting Block.')
+        padder = padding.PKCS7(algorithms.AES.block_size).padder()
+        padded_data = padder.update(block) + padder.finalize()
+        encryptor = Cipher(algorithms.AES(encryption_key), modes.CBC(initialization_vector)).encryptor()
+        return b'\x00' + initialization_vector + encryptor.update(padded_data) + encryptor.finalize()
+    except (TypeError, ValueError) as error:
+        logger.error('Failed to encrypt block. Key error. %s', error)
+    except UnsupportedAlgorithm as error:
+        logger.error('Failed to encrypt block. Unsupported algorithm. %s', error)
+    raise DirectIOError()
+
+
+class BlockDecryptor:
+    """
+    Incremental Block Decryptor.
+
+    Decrypts a block as it is received. The last cipher block is held back until finalized, to remove the CBC padding.
+    """
+
+    def __init__(self, encryption_key):
+        """
+        Initialize a Block Decryptor.
+
+        :param bytes encryption_key: Encryption Key
+        """
+        self._encryption_key = encryption_key
+        self._header = bytearray()
+        self._decryptor = None
+        self._tail = b''
+
+    def update(self, data):
+        """
+        Decrypt Data.
+
+        :param bytes data: Encrypted data
+        :returns: Decrypted data
+        :rtype: bytes
+        """
+        try:
+            if self._decryptor is None:
+                remaining = 17 - len(self._header)  # Version byte and initialization vector
+                self._header.extend(data[:remaining])
+                data = data[remaining:]
+                if len(self._header) < 17:
+                    return b''
+                self._decryptor = Cipher(algorithms.AES(self._encryption_key), modes.CBC(bytes(self._header[1:]))).decryptor()
+            decrypted_data = self._tail + self._decryptor.update(data)
+            self._tail = decrypted_data[-16:]
+            return decrypted_data[:-16]
+        except ValueError as error:
+            logger.error('Failed to decrypt block. Key error. %s', error)
+        except UnsupportedAlgorithm as error:
+            logger.error('Failed to decrypt block. Unsupported algorithm. %s', error)
+        raise DirectIOError()
+
+    def finalize(self):
+        """
+        Finalize Decryption.
+
+        :returns: Remaining decrypted data, without CBC padding
+        :rtype: bytes
+        """
+        try:
+            if self._decryptor is None:
+                raise ValueError('Incomplete block header.')
+            decrypted_data = self._tail + self._decryptor.finalize()
+            if not decrypted_data or not 0 < decrypted_data[-1] <= 16:
+                raise ValueError('Invalid padding.')
+            return decrypted_data[:-decrypted_data[-1]]  # Remove CBC Padding
+        except ValueError as error:
+            logger.error('Failed to decrypt block. %s', error)
+        raise DirectIOError()
@@ -1,52 +1,261 @@
 import logging
 import gzip
+import zlib
+import struct
 import snappy
 from ..exceptions.direct import DirectIOError
 
+try:
+    import cramjam
+except ImportError:
+    cramjam = None
+
 
 logger = logging.getLogger('cterasdk.direct')
 
 
-def decompress(compressed_block):
+def decompress(compressed_block, length=None, output=None):
     """
     Decompress a Block.
 
-    :param bytes block: Compressed Block
+    If an output buffer or the decompressed length is provided, the block is decompressed into a preallocated buffer.
+
+    :param bytes compressed_block: Compressed Block
+    :param int,optional length: Decompressed block length
+    :param memoryview,optional output: Writable buffer to decompress into
     :returns: Decompressed Block
-    :rtype: bytes
+    :rtype: memoryview
     """
-    if compressed_block.startswith(b'\x1f\x8b'):  # Gzip Standard Declaration.
+    compressed_block = memoryview(compressed_block)
+    if output is None and length is not None:
+        output = memoryview(bytearray(length))
+
+    if compressed_block[:2] == b'\x1f\x8b':  # Gzip Standard Declaration.
         try:
-            return gzip.decompress(compressed_block)
+            return copy_into(gzip.decompress(compressed_block), output)
         except gzip.BadGzipFile:
             logger.error('Failed to Decompress Block. Bad Gzip.')
             raise DirectIOError()
 
     try:
-        return decompress_with_magic_header(compressed_block) \
-            if compressed_block.startswith(b'\x82SNAPPY\x00') else snappy.uncompress(compressed_block)  # Snappy Magic
-    except snappy.UncompressError:
-        logger.error('Failed to Decompress Block.')
+        if compressed_block[:8] == b'\x82SNAPPY\x00':  # Snappy Magic
+            return decompress_with_magic_header(compressed_block, output)
+        return decompress_into(compressed_block, output)
+    except (snappy.UncompressError, ValueError) as error:
+        logger.error('Failed to Decompress Block. %s', error)
         raise DirectIOError()
 
 
-def decompress_with_magic_header(compressed_block):
+def decompress_with_magic_header(compressed_block, output=None):
     """
     Decompress a Block.
 
-    :param bytes block: Compressed Block
+    The decompressed length is computed from the frame headers, and frames are decompressed into a preallocated buffer.
+
+    :param bytes compressed_block: Compressed Block
+    :param memoryview,optional output: Writable buffer to decompress into
     :returns: Decompressed Block
-    :rtype: bytes
+    :rtype: memoryview
     """
     logger.debug('Decompressing Block.')
-    decompressed_block = bytearray()
-    size_of_data = len(compressed_block)
-    chunk_size, chunk_start = 4, 16
-    while chunk_start < size_of_data:
-        chunk_end = chunk_start + chunk_size + int.from_bytes(compressed_block[chunk_start:chunk_start + chunk_size], byteorder='big')
-        chunk_start = chunk_start + chunk_size
-        if chunk_end > size_of_data:
+    compressed_block = memoryview(compressed_block)
+    frames = [compressed_block[start:end] for start, end in frame_spans(compressed_block)]
+    if cramjam is None:
+        return decompress_frames(frames, output)
+    try:
+        lengths = [cramjam.snappy.decompress_raw_len(frame) for frame in frames]
+    except cramjam.DecompressionError as error:
+        raise snappy.UncompressError() from error
+    if output is None:
+        output = memoryview(bytearray(sum(lengths)))
+    elif sum(lengths) > len(output):
+        raise ValueError(f'Decompressed data length {sum(lengths)} exceeds buffer length {len(output)}.')
+    position = 0
+    for frame, length in zip(frames, lengths):
+        decompress_into(frame, output[position:position + length])
+        position = position + length
+    return output[:position]
+
+
+def frame_spans(compressed_block):
+    """
+    Locate the Frames of a Framed Snappy Block.
+
+    :param memoryview compressed_block: Compressed Block
+    :returns: Start and end offset of each frame, excluding the frame header
+    :rtype: list[tuple(int, int)]
+    """
+    spans, size, start = [], len(compressed_block), 16
+    while start + 4 <= size:
+        end = start + 4 + struct.unpack_from('>I', compressed_block, start)[0]
+        if end > size:
             break
-        decompressed_block.extend(snappy.decompress(compressed_block[chunk_start:chunk_end]))
-        chunk_start = chunk_end
-    return decompressed_block
+        spans.append((start + 4, end))
+        start = end
+    return spans
+
+
+def decompress_frames(frames, output=None):
+    """
+    Decompress Snappy Frames, One at a Time.
+
+    :param list[memoryview] frames: Compressed Frames
+    :param memoryview,optional output: Writable buffer to decompress into
+    :returns: Decompressed Block
+    :rtype: memoryview
+    """
+    if output is None:
+        decompressed_block = bytearray()
+        for frame in frames:
+            decompressed_block.extend(snappy.uncompress(frame))
+        return memoryview(decompressed_block)
+    position = 0
+    for frame in frames:
+        position = position + len(decompress_into(frame, output[position:]))
+    return output[:position]
+
+
+def decompress_into(compressed_frame, output=None):
+    """
+    Decompress a Snappy Frame.
+
+    :param memoryview compressed_frame: Compressed Frame
+    :param memoryview,optional output: Writable buffer to decompress into
+    :returns: Decompressed Frame
+    :rtype: memoryview
+    """
+    if output is None:
+        return memoryview(snappy.uncompress(compressed_frame))
+    if cramjam is None:
+        return copy_into(snappy.uncompress(compressed_frame), output)
+    try:
+        return output[:cramjam.snappy.decompress_raw_into(compressed_frame, output)]
+    except cramjam.DecompressionError as error:
+        raise snappy.UncompressError() from error
+
+
+class StreamDecompressor:
+    """
+    Incremental Block Decompressor.
+
+    Decompresses gzip and framed snappy blocks as they are received.
+    Raw snappy blocks are not framed, and are decompressed once received.
+    """
+
+    def __init__(self, length=None, output=None):
+        """
+        Initialize a Block Decompressor.
+
+        :param int,optional length: Decompressed block length
+        :param memoryview,optional output: Writable buffer to decompress into
+        """
+        if output is None and length is not None:
+            output = memoryview(bytearray(length))
+        self._output = output
+        self._decompressed = bytearray() if output is None else None
+        self._position = 0
+        self._buffer = bytearray()
+        self._format = None
+        self._header = 0
+        self._gzip = None
+
+    def update(self, data):
+        """
+        Decompress Data.
+
+        :param bytes data: Compressed data
+        """
+        self._buffer.extend(data)
+        try:
+            if self._format is None and len(self._buffer) >= 8:
+                self._detect()
+            if self._format == 'gzip':
+                self._inflate(bytes(self._buffer))
+                self._buffer.clear()
+            elif self._format == 'snappy':
+                self._frames()
+        except (zlib.error, snappy.UncompressError, ValueError) as error:
+            logger.error('Failed to Decompress Block. %s', error)
+            raise DirectIOError()
+
+    def _detect(self):
+        if self._buffer[:2] == b'\x1f\x8b':  # Gzip Standard Declaration.
+            self._format, self._gzip = 'gzip', zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif self._buffer[:8] == b'\x82SNAPPY\x00':  # Snappy Magic
+            self._format, self._header = 'snappy', 16
+        else:
+            self._format = 'raw'
+
+    def _inflate(self, data):
+        while data:
+            if self._gzip.eof:  # Concatenated gzip members
+                self._gzip = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            self._write(self._gzip.decompress(data))
+            data = self._gzip.unused_data
+
+    def _frames(self):
+        if self._header:
+            if len(self._buffer) < self._header:
+                return
+            del self._buffer[:self._header]
+            self._header = 0
+        position = 0
+        with memoryview(self._buffer) as buffer:
+            while len(buffer) - position >= 4:
+                end = position + 4 + int.from_bytes(buffer[position:position + 4], byteorder='big')
+                if end > len(buffer):
+                    break
+                self._decompress(buffer[position + 4:end])
+                position = end
+        del self._buffer[:position]
+
+    def _decompress(self, frame):
+        if self._output is not None:
+            self._position = self._position + len(decompress_into(frame, self._output[self._position:]))
+        else:
+            self._decompressed.extend(snappy.uncompress(frame))
+
+    def _write(self, data):
+        if self._output is not None:
+            self._position = self._position + len(copy_into(data, self._output[self._position:]))
+        else:
+            self._decompressed.extend(data)
+
+    def finalize(self):
+        """
+        Finalize Decompression.
+
+        :returns: Decompressed Block
+        :rtype: memoryview
+        """
+        try:
+            if self._format is None:
+                self._detect()
+            if self._format == 'gzip':
+                self._write(self._gzip.flush())
+            elif self._format == 'raw':
+                with memoryview(self._buffer) as buffer:
+                    self._decompress(buffer)
+        except (zlib.error, snappy.UncompressError, ValueError) as error:
+            logger.error('Failed to Decompress Block. %s', error)
+            raise DirectIOError()
+        if self._output is not None:
+            return self._output[:self._position]
+        return memoryview(self._decompressed)
+
+
+def copy_into(data, output=None):
+    """
+    Copy Data to a Buffer.
+
+    :param bytes data: Data
+    :param memoryview,optional output: Writable buffer
+    :returns: Data
+    :rtype: memoryview
+    """
+    if output is None:
+        return memoryview(data)
+    if len(data) > len(output):
+        raise ValueError(f'Decompressed data length {len(data)} exceeds buffer length {len(output)}.')
+    output[:len(data)] = data
+    return output[:len(data)]
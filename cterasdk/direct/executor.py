@@ -0,0 +1,115 @@
+import asyncio
+import logging
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+
+
+logger = logging.getLogger('cterasdk.direct')
+
+
+class ExecutorType:
+    """
+    CPU Executor Type
+
+    :ivar str Thread: Thread pool, suitable since ``cryptography`` and ``snappy`` release the GIL
+    :ivar str Process: Process pool
+    :ivar str Inline: Run on the event loop
+    """
+    Thread = 'thread'
+    Process = 'process'
+    Inline = 'inline'
+
+
+def invoke(func, *args, **kwargs):
+    """
+    Invoke a Callable in a Worker Process.
+
+    Memory views cannot be pickled, and are returned to the calling process as bytes.
+    """
+    result = func(*args, **kwargs)
+    return bytes(result) if isinstance(result, memoryview) else result
+
+
+class BlockExecutor:
+    """
+    CPU Executor for the Direct IO Block Pipeline.
+
+    Runs CPU-bound block processing, such as decryption and decompression, off the event loop.
+    """
+
+    def __init__(self, executor_type=None, max_workers=None, executor=None):
+        """
+        Initialize a Block Executor.
+
+        :param str, optional executor_type: Executor type, defaults to ``thread``
+        :param int, optional max_workers: Max number of workers.
+        :param concurrent.futures.Executor, optional executor: Use an existing executor, not owned by this object.
+        """
+        self._type = executor_type if executor_type is not None else ExecutorType.Thread
+        self._max_workers = max_workers
+        self._executor = executor
+        self._owner = executor is None
+
+    @property
+    def type(self):
+        return self._type
+
+    @property
+    def shared_memory(self):
+        """
+        Whether workers share the memory of the calling process.
+        """
+        if self._executor is not None and not self._owner:
+            return not isinstance(self._executor, ProcessPoolExecutor)
+        return self._type != ExecutorType.Process
+
+    @staticmethod
+    def create(executor, max_workers=None):
+        """
+        Create a Block Executor.
+
+        :param object executor: An executor type, a ``concurrent.futures.Executor`` or a ``BlockExecutor`` object.
+        :param int, optional max_workers: Max number of workers.
+        :returns: Block executor.
+        :rtype: cterasdk.direct.executor.BlockExecutor
+        """
+        if isinstance(executor, BlockExecutor):
+            return executor
+        if isinstance(executor, Executor):
+            return BlockExecutor(executor=executor)
+        if executor not in (None, ExecutorType.Thread, ExecutorType.Process, ExecutorType.Inline):
+            raise ValueError(f'Unsupported executor type: {executor}')
+        return BlockExecutor(executor, max_workers)
+
+    def _pool(self):
+        if self._executor is None:
+            logger.debug('Starting %s pool executor. Max workers: %s', self._type, self._max_workers or 'default')
+            if self._type == ExecutorType.Process:
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix='cterasdk.direct')
+        return self._executor
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Run a Callable.
+
+        :param callable func: Callable.
+        :returns: Return value of the callable.
+        """
+        if self._type == ExecutorType.Inline:
+            return func(*args, **kwargs)
+        if not self.shared_memory:
+            args = [bytes(arg) if isinstance(arg, memoryview) else arg for arg in args]
+            return await asyncio.wrap_future(self._pool().submit(invoke, func, *args, **kwargs))
+        return await asyncio.wrap_future(self._pool().submit(func, *args, **kwargs))
+
+    def shutdown(self, wait=True):
+        """
+        Shutdown Executor.
+
+        :param bool, optional wait: Wait for pending tasks to complete, defaults to ``True``
+        """
+        if self._owner and self._executor is not None:
+            logger.debug('Shutting down %s pool executor.', self._type)
+            self._executor.shutdown(wait=wait)
+            self._executor = None
@@ -1,4 +1,6 @@
 import logging
+from array import array
+from bisect import bisect_right
 
 
 logger = logging.getLogger('cterasdk.direct')
@@ -13,19 +15,30 @@ def span(file, byte_range):
     :returns: List of Chunks.
     :rtype: list[cterasdk.direct.types.Chunk]
     """
-    if validate_byte_range(file, byte_range):
-        start, end = None, None
-        for index, chunk in enumerate(file.chunks):
-            if byte_range.start < chunk.offset + chunk.length:
-                start = index
-                break
-        if not byte_range.eof:
-            for index, chunk in enumerate(file.chunks):
-                if byte_range.end < chunk.offset + chunk.length:
-                    end = index + 1
-                    break
-        return file.chunks[start:end]
-    return file.chunks
+    return spans(file, [byte_range])[0]
+
+
+def spans(file, byte_ranges):
+    """
+    Filter Blocks by Multiple Byte Ranges, in One Pass.
+
+    Byte ranges are resolved in order of their start offset, using a binary search over the chunk end offsets,
+    each search starting at the first chunk of the previous byte range.
+
+    :param list[cterasdk.direct.types.File] file: File Object.
+    :param list[cterasdk.direct.types.ByteRange] byte_ranges: List of Byte Ranges.
+    :returns: List of Chunks, per byte range, in the order of the byte ranges.
+    :rtype: list[list[cterasdk.direct.types.Chunk]]
+    """
+    ends = getattr(file.chunks, 'ends', None) or array('q', (chunk.offset + chunk.length for chunk in file.chunks))
+    results, low = [file.chunks] * len(byte_ranges), 0
+    for position in sorted(range(len(byte_ranges)), key=lambda position: byte_ranges[position].start):
+        byte_range = byte_ranges[position]
+        if validate_byte_range(file, byte_range):
+            start = low = bisect_right(ends, byte_range.start, low)
+            end = None if byte_range.eof else bisect_right(ends, byte_range.end, start) + 1
+            results[position] = file.chunks[start:end]
+    return results
 
 
 def validate_byte_range(file, byte_range):
@@ -0,0 +1,112 @@
+import time
+import asyncio
+import logging
+from collections import deque
+from contextlib import nullcontext
+
+
+logger = logging.getLogger('cterasdk.direct')
+
+
+class Hedging:  # pylint: disable=too-many-instance-attributes
+    """
+    Hedged Requests.
+
+    If a request did not complete within a percentile of the observed latency, a duplicate request is issued
+    and the first to complete successfully is used. The other request is cancelled.
+    The number of duplicate requests is capped as a ratio of all requests, and duplicate requests
+    wait for a slot of the same concurrency limit as the requests they duplicate.
+
+    :ivar int requests: Requests
+    :ivar int hedged: Duplicate requests issued
+    :ivar int wins: Duplicate requests that completed first
+    """
+
+    def __init__(self, percentile=95, min_samples=20, max_ratio=0.05, min_delay=0.05, window=1000):
+        """
+        Initialize Hedged Requests.
+
+        :param float, optional percentile: Latency percentile after which a duplicate request is issued, defaults to ``95``
+        :param int, optional min_samples: Min number of latency samples before issuing duplicate requests, defaults to ``20``
+        :param float, optional max_ratio: Max ratio of duplicate requests to requests, defaults to ``0.05``
+        :param float, optional min_delay: Min delay before issuing a duplicate request, in seconds, defaults to ``0.05``
+        :param int, optional window: Number of recent latency samples, defaults to ``1000``
+        """
+        self._percentile = percentile
+        self._min_samples = min_samples
+        self._max_ratio = max_ratio
+        self._min_delay = min_delay
+        self._samples = deque(maxlen=window)
+        self._delay = None
+        self.requests = 0
+        self.hedged = 0
+        self.wins = 0
+
+    @property
+    def delay(self):
+        """
+        Delay before issuing a duplicate request, in seconds, or ``None`` if there are not enough latency samples.
+        """
+        return self._delay
+
+    def record(self, latency):
+        """
+        Record Latency.
+
+        :param float latency: Latency, in seconds.
+        """
+        self._samples.append(latency)
+        if len(self._samples) >= self._min_samples and len(self._samples) % max(self._min_samples // 4, 1) == 0:
+            samples = sorted(self._samples)
+            index = min(len(samples) - 1, int(len(samples) * self._percentile / 100))
+            self._delay = max(self._min_delay, samples[index])
+
+    def _admit(self):
+        return self.hedged < self.requests * self._max_ratio
+
+    async def run(self, factory, slot=None):
+        """
+        Run a Hedged Request.
+
+        :param callable factory: Coroutine function that issues the request.
+        :param callable, optional slot: Callable returning an asynchronous context manager that holds a concurrency slot
+         while the duplicate request is in flight. Defaults to issuing the duplicate request without a slot.
+        :returns: Result of the first request to complete successfully.
+        """
+        async def duplicate():
+            async with slot() if slot is not None else nullcontext():
+                return await factory()
+
+        self.requests = self.requests + 1
+        start = time.monotonic()
+        primary = asyncio.ensure_future(factory())
+        tasks = {primary}
+        try:
+            if self._delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=self._delay)
+                if not done and self._admit():
+                    logger.debug('Request did not complete within %.3f seconds. Issuing a duplicate request.', self._delay)
+                    self.hedged = self.hedged + 1
+                    tasks.add(asyncio.ensure_future(duplicate()))
+            while True:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    tasks.discard(task)
+                    if task.exception() is None:
+                        self.record(time.monotonic() - start)
+                        if task is not primary:
+                            self.wins = self.wins + 1
+                        return task.result()
+                    if not tasks:
+                        return task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def to_dict(self):
+        return {
+            'requests': self.requests,
+            'hedged': self.hedged,
+            'wins': self.wins,
+            'delay': self._delay
+        }
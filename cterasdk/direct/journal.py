@@ -0,0 +1,178 @@
+import os
+import json
+import hashlib
+import logging
+import threading
+from urllib.parse import urlsplit
+
+from . import filters
+from .types import ByteRange
+
+
+logger = logging.getLogger('cterasdk.direct')
+
+
+class Journal:
+    """
+    Block-Level Checkpoint Journal.
+
+    A sidecar file, next to the destination, recording blocks that were written and synchronized to disk.
+    The first line is a header identifying the file and its content, followed by one ``number offset length`` line per block.
+    """
+
+    version = 2
+
+    def __init__(self, path, metadata):
+        """
+        Initialize a Journal.
+
+        :param str path: Destination path.
+        :param cterasdk.direct.types.Metadata metadata: Direct I/O file metadata.
+        """
+        self._path = f'{path}.journal'
+        self._temporary_path = f'{path}.part'
+        self._header = {
+            'version': Journal.version,
+            'file_id': metadata.file_id,
+            'size': metadata.size,
+            'blocks': len(metadata.chunks),
+            'identity': Journal.identity(metadata)
+        }
+        self._completed = set()
+        self._pending = []
+        self._lock = threading.Lock()
+        self._fd = None
+
+    @staticmethod
+    def identity(metadata):
+        """
+        Identify the Content of a File.
+
+        Digest of the ordered offset, length and storage object path of each block. The query string of
+        signed URLs is excluded since it changes on each request, while a new version of a file is stored
+        in new objects.
+
+        :param cterasdk.direct.types.Metadata metadata: Direct I/O file metadata.
+        :rtype: str
+        """
+        digest = hashlib.sha256()
+        for chunk in metadata.chunks:
+            digest.update(f'{chunk.offset} {chunk.length} {urlsplit(chunk.url).path}\n'.encode('utf-8'))
+        return digest.hexdigest()
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def completed(self):
+        """
+        Offset and length of blocks recorded in the journal.
+
+        :rtype: set[tuple(int, int)]
+        """
+        return self._completed
+
+    def open(self):
+        """
+        Open the Journal, Loading Blocks Recorded in a Previous Attempt.
+        """
+        if os.path.exists(self._path) and os.path.exists(self._temporary_path) and self._load():
+            logger.debug('Resuming download. Found %s completed blocks in journal: %s', len(self._completed), self._path)
+            self._fd = open(self._path, 'a', encoding='utf-8')  # pylint: disable=consider-using-with
+        else:
+            self._completed.clear()
+            self._fd = open(self._path, 'w', encoding='utf-8')  # pylint: disable=consider-using-with
+            self._fd.write(json.dumps(self._header) + '\n')
+            self._sync()
+        return self
+
+    def _load(self):
+        with open(self._path, 'r', encoding='utf-8') as f:
+            lines = f.read().split('\n')
+        try:
+            if json.loads(lines[0]) != self._header:
+                logger.debug('Journal does not match file. Restarting download.')
+                return False
+        except ValueError:
+            logger.debug('Could not read journal header. Restarting download.')
+            return False
+        for line in lines[1:]:
+            try:
+                _, offset, length = (int(value) for value in line.split())
+                self._completed.add((offset, length))
+            except ValueError:
+                pass  # Skip an incomplete last entry
+        return True
+
+    def missing(self, metadata):
+        """
+        Get Chunks Not Recorded in the Journal.
+
+        :param cterasdk.direct.types.Metadata metadata: Direct I/O file metadata.
+        :returns: List of chunks.
+        :rtype: list[cterasdk.direct.types.Chunk]
+        """
+        byte_ranges, start, end = [], None, None
+        for chunk in metadata.chunks:
+            if (chunk.offset, chunk.length) in self._completed:
+                if start is not None:
+                    byte_ranges.append(ByteRange(start, end))
+                start = None
+            else:
+                start = chunk.offset if start is None else start
+                end = chunk.offset + chunk.length - 1
+        if start is not None:
+            byte_ranges.append(ByteRange(start, end))
+        chunks = [chunk for chunks in filters.spans(metadata, byte_ranges) for chunk in chunks]
+        logger.debug('Blocks missing: %s out of %s', len(chunks), len(metadata.chunks))
+        return chunks
+
+    def complete(self, chunk):
+        """
+        Mark a Block as Written. The block is recorded on the next checkpoint.
+
+        :param cterasdk.direct.types.Chunk chunk: Chunk.
+        """
+        with self._lock:
+            self._pending.append(chunk)
+
+    def pending(self):
+        """
+        Take Blocks Marked as Written Since the Last Checkpoint.
+
+        :rtype: list[cterasdk.direct.types.Chunk]
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        return pending
+
+    def checkpoint(self, chunks):
+        """
+        Record Blocks Synchronized to Disk.
+
+        :param list[cterasdk.direct.types.Chunk] chunks: Chunks.
+        """
+        if not chunks:
+            return
+        with self._lock:
+            self._fd.write(''.join(f'{chunk.number} {chunk.offset} {chunk.length}\n' for chunk in chunks))
+            self._sync()
+            self._completed.update((chunk.offset, chunk.length) for chunk in chunks)
+
+    def _sync(self):
+        self._fd.flush()
+        os.fsync(self._fd.fileno())
+
+    def close(self):
+        if self._fd is not None:
+            self._fd.close()
+            self._fd = None
+
+    def remove(self):
+        """
+        Close and Remove the Journal.
+        """
+        self.close()
+        if os.path.exists(self._path):
+            os.remove(self._path)
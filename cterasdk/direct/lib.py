@@ -1,28 +1,196 @@
+import time
 import logging
 import asyncio
+from contextlib import nullcontext
+
+import yarl
+import aiohttp
 
 from ..lib.retries import execute_with_retries
 from .types import Metadata, Block
-from .crypto import decrypt_key, decrypt_block
-from .decompressor import decompress
-from ..exceptions.transport import BadRequest, Unauthorized, Unprocessable, InternalServerError, HTTPError
+from .scheduler import SlidingWindow
+from .concurrency import AdaptiveConcurrency
+from .telemetry import Stage, Measurement
+from .crypto import decrypt_key, decrypt_block, encrypt_block, BlockDecryptor
+from .decompressor import decompress, copy_into, StreamDecompressor
+from .compressor import compress
+from .cache import signed_url_expired
+from ..exceptions.transport import BadRequest, Unauthorized, Forbidden, Unprocessable, InternalServerError, HTTPError
 from ..exceptions.direct import (
     AuthorizationError, BlockListConnectionError, BlockListTimeout, BlockValidationException, BlocksNotFoundError,
-    DecompressBlockError, DecryptBlockError, DecryptKeyError, DirectIOError, DownloadConnectionError,
-    DownloadError, DownloadTimeout, InvalidRequest, ObjectNotFoundError, UnsupportedStorageError
+    CompressBlockError, DecompressBlockError, DecryptBlockError, DecryptKeyError, DirectIOError, DownloadConnectionError,
+    DownloadError, DownloadTimeout, EncryptBlockError, InvalidRequest, ObjectNotFoundError, SignedURLExpired,
+    UnsupportedStorageError, UploadConnectionError, UploadError, UploadTimeout
 )
 
 
 logger = logging.getLogger('cterasdk.direct')
 
 
-@execute_with_retries(retries=3, backoff=1, max_backoff=10)
-async def get_object(client, file_id, chunk):
+def count_retries(stage):
+    """
+    Count Retries of a Stage.
+
+    :param str stage: Stage name.
+    :returns: Callback recording a retry in the ``timings`` argument of the call, passed by position or keyword.
+    :rtype: callable
+    """
+    def on_retry(error, arguments):  # pylint: disable=unused-argument
+        timings = arguments.arguments.get('timings')
+        if timings is not None:
+            timings.retry(stage)
+    return on_retry
+
+
+async def read_object(client, chunk, measurement):
+    """
+    Read Object from a Signed URL.
+
+    :param cterasdk.clients.clients.AsyncClient client: Asynchronous HTTP Client.
+    :param cterasdk.direct.types.Chunk chunk: Chunk.
+    :param cterasdk.direct.telemetry.Measurement measurement: Measurement.
+    :returns: Object
+    :rtype: bytes
+    """
+    response = await client.get(chunk.url)
+    data = await response.read()
+    measurement.bytes = len(data)
+    return data
+
+
+class BlockDecoder:
+    """
+    Incremental Block Decryptor and Decompressor.
+
+    Data is decoded in the executor if its workers share memory with the event loop, and on the event loop otherwise.
+
+    :ivar dict[str, float] elapsed: Elapsed time of the decrypt and decompress stages, in seconds
+    :ivar float wall: Wall time of decoding, in seconds
+    """
+
+    def __init__(self, file_id, chunk, encryption_key, output=None, executor=None):
+        """
+        Initialize a Block Decoder.
+
+        :param int file_id: File ID.
+        :param cterasdk.direct.types.Chunk chunk: Chunk.
+        :param bytes encryption_key: Encryption key.
+        :param memoryview,optional output: Writable buffer of the block length to decompress into.
+        :param cterasdk.direct.executor.BlockExecutor,optional executor: CPU executor.
+        """
+        self._file_id = file_id
+        self._chunk = chunk
+        self._executor = executor if executor is not None and executor.shared_memory else None
+        self._decryptor = BlockDecryptor(encryption_key)
+        self._decompressor = StreamDecompressor(chunk.length, output)
+        self.elapsed = {Stage.Decrypt: 0, Stage.Decompress: 0}
+        self.wall = 0
+
+    async def a_decode(self, data, final=False):
+        """
+        Decrypt and Decompress Data, in the Executor if its Workers Share Memory with the Event Loop.
+
+        :param bytes data: Encrypted data.
+        :param bool,optional final: Finalize decryption and decompression, defaults to ``False``
+        :returns: Decompressed block if final, ``None`` otherwise.
+        :rtype: memoryview
+        """
+        start = time.perf_counter()
+        try:
+            return await run(self._executor, self.decode, data, final)
+        finally:
+            self.wall = self.wall + time.perf_counter() - start
+
+    def record(self, timings):
+        """
+        Record the Elapsed Time of the Decrypt and Decompress Stages.
+
+        :param cterasdk.direct.telemetry.Timings timings: Per-stage timings.
+        """
+        for stage, elapsed in self.elapsed.items():
+            timings.record(stage, elapsed)
+
+    def decode(self, data, final=False):
+        """
+        Decrypt and Decompress Data.
+
+        :param bytes data: Encrypted data.
+        :param bool,optional final: Finalize decryption and decompression, defaults to ``False``
+        :returns: Decompressed block if final, ``None`` otherwise.
+        :rtype: memoryview
+        """
+        start = time.perf_counter()
+        try:
+            data = self._decryptor.update(data) if not final else self._decryptor.finalize()
+        except DirectIOError:
+            raise DecryptBlockError(self._file_id, self._chunk)
+        decrypted = time.perf_counter()
+        try:
+            self._decompressor.update(data)
+            if final:
+                return self._decompressor.finalize()
+            return None
+        except DirectIOError:
+            raise DecompressBlockError(self._file_id, self._chunk)
+        finally:
+            self.elapsed[Stage.Decrypt] = self.elapsed[Stage.Decrypt] + decrypted - start
+            self.elapsed[Stage.Decompress] = self.elapsed[Stage.Decompress] + time.perf_counter() - decrypted
+
+
+async def decode_object(client, file_id, chunk, encryption_key, chunk_size, output=None, timings=None, measurement=None,
+                        executor=None):
+    """
+    Read, Decrypt and Decompress Object from a Signed URL, as it is Received.
+
+    Decryption and decompression run in the executor if its workers share memory with the event loop,
+    and on the event loop otherwise. Their time is excluded from the time of the measurement.
+
+    :param cterasdk.clients.clients.AsyncClient client: Asynchronous HTTP Client.
+    :param int file_id: File ID.
+    :param cterasdk.direct.types.Chunk chunk: Chunk.
+    :param bytes encryption_key: Encryption key.
+    :param int chunk_size: Number of bytes to read at a time.
+    :param memoryview,optional output: Writable buffer of the block length to decompress into.
+    :param cterasdk.direct.telemetry.Timings,optional timings: Per-stage timings.
+    :param cterasdk.direct.telemetry.Measurement,optional measurement: Measurement, to count the bytes received.
+    :param cterasdk.direct.executor.BlockExecutor,optional executor: CPU executor.
+    :returns: Decompressed Object.
+    :rtype: memoryview
+    """
+    measurement = measurement if measurement is not None else Measurement()
+    decoder = BlockDecoder(file_id, chunk, encryption_key, output, executor)
+    response = await client.get(chunk.url)
+    try:
+        async for data in response.a_iter_content(chunk_size):
+            measurement.bytes = measurement.bytes + len(data)
+            await decoder.a_decode(data)
+        decompressed_object = await decoder.a_decode(b'', final=True)
+    except aiohttp.ClientPayloadError as error:
+        raise IOError(error) from error
+    finally:
+        measurement.excluded = measurement.excluded + decoder.wall
+    if timings is not None:
+        decoder.record(timings)
+    if chunk.length != len(decompressed_object):
+        logger.error('Expected block length does not match decrypted and decompressed block length.')
+        raise BlockValidationException(file_id, chunk)
+    return decompressed_object
+
+
+@execute_with_retries(retries=3, backoff=1, max_backoff=10, on_retry=count_retries(Stage.Download),
+                      giveup=(SignedURLExpired, DecryptBlockError, DecompressBlockError, BlockValidationException))
+async def get_object(client, file_id, chunk, hedging=None, reader=None, timings=None, slot=None):
     """
     Get Object from a Signed URL.
 
     :param int file_id: File ID.
     :param cterasdk.direct.types.Chunk chunk: Chunk.
+    :param cterasdk.direct.hedging.Hedging,optional hedging: Issue a duplicate request if the request is slow.
+    :param callable,optional reader: Coroutine function that accepts a client, a chunk and a measurement, and reads the object.
+     Defaults to reading the entire object
+    :param cterasdk.direct.telemetry.Timings,optional timings: Per-stage timings.
+    :param callable,optional slot: Callable returning an asynchronous context manager that holds a concurrency slot
+     for a duplicate request.
     :returns: Object
     :rtype: bytes
     """
@@ -37,9 +205,14 @@ async def get_object(client, file_id, chunk):
     error_message, exception = None, None
 
     logger.debug(message)
+    reader = reader if reader is not None else read_object
     try:
-        response = await client.get(chunk.url)
-        return await response.read()
+        with measure(timings, Stage.Download, yarl.URL(chunk.url).host) as measurement:
+            if hedging is not None:
+                return await read_hedged(hedging, reader, client, chunk, measurement, slot)
+            return await reader(client, chunk, measurement)
+    except DirectIOError:
+        raise
     except ConnectionError:
         error_message = 'connection'
         exception = DownloadConnectionError(file_id, chunk)
@@ -50,13 +223,18 @@ async def get_object(client, file_id, chunk):
         error_message = 'io'
         exception = DownloadError(error, file_id, chunk)
     except HTTPError as error:
-        error_message = 'unknown'
-        exception = DownloadError(error.error, file_id, chunk)
+        if isinstance(error, Forbidden) or signed_url_expired(chunk.url):
+            error_message = 'expired'
+            exception = SignedURLExpired(file_id, chunk)
+        else:
+            error_message = 'unknown'
+            exception = DownloadError(error.error, file_id, chunk)
 
     error_messages = {
         "connection": "Connection error",
         "timeout": "Timed out",
         "io": "I/O error",
+        "expired": "Signed URL expired or access denied",
         "unknown": "Unknown error"
     }
 
@@ -72,44 +250,127 @@ async def get_object(client, file_id, chunk):
     raise exception
 
 
-async def decrypt_object(file_id, encrypted_object, encryption_key, chunk):
+async def read_hedged(hedging, reader, client, chunk, measurement, slot=None):  # pylint: disable=too-many-arguments
+    """
+    Read an Object Using Hedged Requests.
+
+    Each request is measured separately, and only the measurement of the first to complete is recorded.
+
+    :param cterasdk.direct.hedging.Hedging hedging: Hedged requests.
+    :param callable reader: Coroutine function that accepts a client, a chunk and a measurement, and reads the object.
+    :param cterasdk.clients.clients.AsyncClient client: Asynchronous HTTP Client.
+    :param cterasdk.direct.types.Chunk chunk: Chunk.
+    :param cterasdk.direct.telemetry.Measurement measurement: Measurement to record the first request to complete.
+    :param callable,optional slot: Callable returning an asynchronous context manager that holds a concurrency slot
+     for a duplicate request.
+    :returns: Object
+    """
+    async def attempt():
+        own = Measurement()
+        return await reader(client, chunk, own), own
+
+    result, winner = await hedging.run(attempt, slot)
+    measurement.bytes, measurement.excluded = winner.bytes, winner.excluded
+    return result
+
+
+def measure(timings, stage, host=None):
+    """
+    Measure a Pipeline Stage.
+
+    :param cterasdk.direct.telemetry.Timings timings: Timings, or ``None`` to skip measurement.
+    :param str stage: Stage name.
+    :param str, optional host: Storage host name.
+    """
+    return timings.measure(stage, host) if timings is not None else nullcontext(Measurement())
+
+
+def hold(semaphore, chunk):
+    """
+    Hold a Concurrency Slot Without Recording the Outcome of the Transfer.
+
+    :param object semaphore: ``asyncio.Semaphore``, adaptive concurrency controller, or ``None`` for no limit.
+    :param cterasdk.direct.types.Chunk chunk: Chunk.
+    """
+    if semaphore is None:
+        return nullcontext()
+    if isinstance(semaphore, AdaptiveConcurrency):
+        return semaphore.slot(chunk)
+    return semaphore
+
+
+def limit(semaphore, chunk):
+    """
+    Limit Concurrent Block Retrieval.
+
+    :param object semaphore: ``asyncio.Semaphore``, adaptive concurrency controller, or ``None`` for no limit.
+    :param cterasdk.direct.types.Chunk chunk: Chunk.
+    """
+    if semaphore is None:
+        return nullcontext()
+    if isinstance(semaphore, AdaptiveConcurrency):
+        return semaphore.acquire(chunk)
+    return semaphore
+
+
+async def run(executor, func, *args):
+    """
+    Run a CPU-Bound Callable.
+
+    :param cterasdk.direct.executor.BlockExecutor executor: Executor, or ``None`` to run on the event loop.
+    :param callable func: Callable.
+    :returns: Return value of the callable.
+    """
+    if executor is None:
+        return func(*args)
+    return await executor.run(func, *args)
+
+
+async def decrypt_object(file_id, encrypted_object, encryption_key, chunk, executor=None):
     """
     Decrypt Encrypted Object.
 
     :param bytes encrypted_object: Encrypted object.
     :param bytes encryption_key: Encryption key.
     :param cterasdk.direct.types.Chunk chunk: Chunk.
+    :param cterasdk.direct.executor.BlockExecutor,optional executor: CPU executor.
     :returns: Decrypted Object.
-    :rtype: bytes
+    :rtype: memoryview
     """
     try:
-        return decrypt_block(encrypted_object, encryption_key)
+        return await run(executor, decrypt_block, encrypted_object, encryption_key)
     except DirectIOError:
         logger.error('Failed to decrypt block.')
         raise DecryptBlockError(file_id, chunk)
 
 
-async def decompress_object(file_id, compressed_object, chunk):
+async def decompress_object(file_id, compressed_object, chunk, executor=None, output=None):
     """
     Decompress Object.
 
     :param bytes compressed_object: Compressed object.
     :param cterasdk.direct.types.Chunk chunk: Chunk.
+    :param cterasdk.direct.executor.BlockExecutor,optional executor: CPU executor.
+    :param memoryview,optional output: Writable buffer of the block length to decompress into.
     :returns: Decompressed Object.
-    :rtype: bytes
+    :rtype: memoryview
     """
     try:
-        decompressed_object = decompress(compressed_object)
+        if executor is None or executor.shared_memory:
+            decompressed_object = await run(executor, decompress, compressed_object, chunk.length, output)
+        else:
+            decompressed_object = copy_into(await run(executor, decompress, compressed_object, chunk.length), output)
         if chunk.length != len(decompressed_object):
             logger.error('Expected block length does not match decrypted and decompressed block length.')
             raise BlockValidationException(file_id, chunk)
         return decompressed_object
-    except DirectIOError:
+    except (DirectIOError, ValueError):
         logger.error('Failed to decompress block.')
         raise DecompressBlockError(file_id, chunk)
 
 
-async def process_chunk(client, file_id, chunk, encryption_key, semaphore):
+async def process_chunk(client, file_id, chunk, encryption_key, semaphore,  # pylint: disable=too-many-arguments
+                        executor=None, timings=None, output=None, hedging=None, chunk_size=None, refresh=None):
     """
     Process a Chunk.
 
@@ -117,7 +378,15 @@ async def process_chunk(client, file_id, chunk, encryption_key, semaphore):
     :param int file_id: File ID.
     :param cterasdk.direct.types.Chunk chunk: Chunk.
     :param str encryption_key: Encryption key.
-    :param asyncio.Semaphore semaphore: Semaphore.
+    :param object semaphore: ``asyncio.Semaphore``, or adaptive concurrency controller.
+    :param cterasdk.direct.executor.BlockExecutor,optional executor: CPU executor.
+    :param cterasdk.direct.telemetry.Timings,optional timings: Per-stage timings.
+    :param memoryview,optional output: Writable buffer of the block length to decompress into.
+    :param cterasdk.direct.hedging.Hedging,optional hedging: Hedged requests.
+    :param int,optional chunk_size: Decrypt and decompress the object as it is received, this number of bytes at a time.
+     Defaults to decrypting and decompressing the object once received.
+    :param callable,optional refresh: Coroutine function that accepts a chunk whose signed URL expired,
+     and returns the chunk with a new signed URL. The block is retried once using the new signed URL.
 
     :returns: Block
     :rtype: cterasdk.direct.types.Block
@@ -130,18 +399,37 @@ async def process_chunk(client, file_id, chunk, encryption_key, semaphore):
         if file_id:
             message = message + f" for file ID {file_id}"
         logger.debug(message)
-        encrypted_object = await get_object(client, file_id, chunk)
-        decrypted_object = await decrypt_object(file_id, encrypted_object, encryption_key, chunk)
-        decompressed_object = await decompress_object(file_id, decrypted_object, chunk)
+        if chunk_size:
+            return Block(file_id, chunk.number, chunk.offset, await decode(client, chunk, encryption_key), chunk.length)
+        encrypted_object = await get_object(client, file_id, chunk, hedging, timings=timings, slot=lambda: hold(semaphore, chunk))
+        with measure(timings, Stage.Decrypt):
+            decrypted_object = await decrypt_object(file_id, encrypted_object, encryption_key, chunk, executor)
+        with measure(timings, Stage.Decompress):
+            decompressed_object = await decompress_object(file_id, decrypted_object, chunk, executor, output)
         return Block(file_id, chunk.number, chunk.offset, decompressed_object, chunk.length)
 
-    if semaphore is not None:
-        async with semaphore:
+    async def decode(client, chunk, encryption_key):
+        shared = output if hedging is None else None  # Hedged requests decompress into buffers of their own
+
+        def reader(client, chunk, measurement):
+            return decode_object(client, file_id, chunk, encryption_key, chunk_size, shared, timings, measurement, executor)
+
+        decompressed_object = await get_object(client, file_id, chunk, hedging, reader, timings=timings,
+                                               slot=lambda: hold(semaphore, chunk))
+        return decompressed_object if shared is not None or output is None else copy_into(decompressed_object, output)
+
+    async with limit(semaphore, chunk):
+        try:
             return await process(client, chunk, encryption_key)
-    return await process(client, chunk, encryption_key)
+        except SignedURLExpired:
+            if refresh is None:
+                raise
+            logger.debug('Signed URL expired. Retrying block #%s using a new signed URL.', chunk.number)
+            return await process(client, await refresh(chunk), encryption_key)
 
 
-async def process_chunks(client, file_id, chunks, encryption_key, semaphore=None):
+async def process_chunks(client, file_id, chunks, encryption_key, semaphore=None, executor=None, timings=None, hedging=None,
+                         chunk_size=None, refresh=None):
     """
     Process Chunks Asynchronously.
 
@@ -149,22 +437,218 @@ async def process_chunks(client, file_id, chunks, encryption_key, semaphore=None
     :param int file_id: File ID.
     :param list[cterasdk.direct.types.Chunk] chunks: Chunk.
     :param str encryption_key: Encryption key.
-    :param asyncio.Semaphore,optional semaphore: Semaphore.
+    :param object,optional semaphore: ``asyncio.Semaphore``, or adaptive concurrency controller.
+    :param cterasdk.direct.executor.BlockExecutor,optional executor: CPU executor.
+    :param cterasdk.direct.telemetry.Timings,optional timings: Per-stage timings.
+    :param cterasdk.direct.hedging.Hedging,optional hedging: Hedged requests.
+    :param int,optional chunk_size: Decrypt and decompress objects as they are received, this number of bytes at a time.
+    :param callable,optional refresh: Coroutine function that accepts a chunk whose signed URL expired, and returns the chunk
+     with a new signed URL.
     :returns: List of futures.
     :rtype: list[asyncio.Task]
     """
     message = [f"Processing {len(chunks)} blocks"]
     if file_id:
         message.append(f"for file ID {file_id}")
-    if semaphore:
+    if isinstance(semaphore, AdaptiveConcurrency):
+        message.append("using adaptive concurrency")
+    elif semaphore:
         message.append(f"using up to {semaphore._value} workers")  # pylint: disable=protected-access
     logger.debug(' '.join(message))
     futures = []
     for chunk in chunks:
-        futures.append(asyncio.create_task(process_chunk(client, file_id, chunk, encryption_key, semaphore)))
+        futures.append(asyncio.create_task(process_chunk(client, file_id, chunk, encryption_key, semaphore, executor, timings,
+                                                         hedging=hedging, chunk_size=chunk_size, refresh=refresh)))
     return futures
 
 
+def schedule_chunks(client, file_id, chunks, encryption_key, semaphore=None,  # pylint: disable=too-many-arguments
+                    max_blocks=None, max_bytes=None, executor=None, timings=None, hedging=None, chunk_size=None, refresh=None):
+    """
+    Schedule Chunks Using a Bounded Sliding Window.
+
+    :param cterasdk.clients.clients.AsyncClient client: Asynchronous HTTP Client.
+    :param int file_id: File ID.
+    :param list[cterasdk.direct.types.Chunk] chunks: Chunk.
+    :param str encryption_key: Encryption key.
+    :param object,optional semaphore: ``asyncio.Semaphore``, or adaptive concurrency controller.
+    :param int,optional max_blocks: Max number of blocks to retrieve ahead of the consumer.
+    :param int,optional max_bytes: Max number of bytes to retrieve ahead of the consumer.
+    :param cterasdk.direct.executor.BlockExecutor,optional executor: CPU executor.
+    :param cterasdk.direct.telemetry.Timings,optional timings: Per-stage timings.
+    :param cterasdk.direct.hedging.Hedging,optional hedging: Hedged requests.
+    :param int,optional chunk_size: Decrypt and decompress objects as they are received, this number of bytes at a time.
+    :param callable,optional refresh: Coroutine function that accepts a chunk whose signed URL expired, and returns the chunk
+     with a new signed URL.
+    :returns: Sliding window of blocks, in order.
+    :rtype: cterasdk.direct.scheduler.SlidingWindow
+    """
+    message = [f"Scheduling {len(chunks)} blocks"]
+    if file_id:
+        message.append(f"for file ID {file_id}")
+    message.append(f"with a window of up to {max_blocks or len(chunks)} blocks")
+    if max_bytes:
+        message.append(f"and {max_bytes} bytes")
+    logger.debug(' '.join(message))
+
+    async def factory(chunk):
+        return await process_chunk(client, file_id, chunk, encryption_key, semaphore, executor, timings, hedging=hedging,
+                                   chunk_size=chunk_size, refresh=refresh)
+
+    return SlidingWindow(factory, chunks, max_blocks, max_bytes)
+
+
+@execute_with_retries(retries=3, backoff=1, max_backoff=10, on_retry=count_retries(Stage.Upload))
+async def put_object(client, file_id, chunk, encrypted_object, timings=None):
+    """
+    Put Object to a Signed URL.
+
+    :param cterasdk.clients.clients.AsyncClient client: Asynchronous HTTP Client.
+    :param int file_id: File ID.
+    :param cterasdk.direct.types.Chunk chunk: Chunk.
+    :param bytes encrypted_object: Encrypted object.
+    :param cterasdk.direct.telemetry.Timings,optional timings: Per-stage timings.
+    :returns: Chunk
+    :rtype: cterasdk.direct.types.Chunk
+    """
+    message = (
+        f"Uploading block #{chunk.number} "
+        f"(offset={chunk.offset}, length={chunk.length})"
+    )
+    if file_id:
+        message += f" for file ID {file_id}"
+    logger.debug(message)
+
+    error_message, exception = None, None
+    try:
+        with measure(timings, Stage.Upload, yarl.URL(chunk.url).host) as measurement:
+            await client.put(chunk.url, encrypted_object, data_serializer=bytes)
+            measurement.bytes = len(encrypted_object)
+            return chunk
+    except DirectIOError:
+        raise
+    except ConnectionError:
+        error_message, exception = 'Connection error', UploadConnectionError(file_id, chunk)
+    except asyncio.TimeoutError:
+        error_message, exception = 'Timed out', UploadTimeout(file_id, chunk)
+    except IOError as error:
+        error_message, exception = 'I/O error', UploadError(error, file_id, chunk)
+    except HTTPError as error:
+        error_message, exception = 'Unknown error', UploadError(error.error, file_id, chunk)
+
+    message = (
+        f"Failed to upload block #{chunk.number} "
+        f"(offset={chunk.offset}, length={chunk.length})"
+    )
+    if file_id:
+        message = message + f" for file ID {file_id}"
+
+    message = message + f": {error_message}."
+    logger.error(message)
+    raise exception
+
+
+async def compress_object(file_id, block, chunk, compression_library, executor=None):
+    """
+    Compress Object.
+
+    :param bytes block: Block.
+    :param cterasdk.direct.types.Chunk chunk: Chunk.
+    :param str compression_library: Compression library.
+    :param cterasdk.direct.executor.BlockExecutor,optional executor: CPU executor.
+    :returns: Compressed Object.
+    :rtype: bytes
+    """
+    try:
+        return await run(executor, compress, block, compression_library)
+    except DirectIOError:
+        logger.error('Failed to compress block.')
+        raise CompressBlockError(file_id, chunk)
+
+
+async def encrypt_object(file_id, compressed_object, encryption_key, chunk, executor=None):
+    """
+    Encrypt Object.
+
+    :param bytes compressed_object: Compressed object.
+    :param bytes encryption_key: Encryption key.
+    :param cterasdk.direct.types.Chunk chunk: Chunk.
+    :param cterasdk.direct.executor.BlockExecutor,optional executor: CPU executor.
+    :returns: Encrypted Object.
+    :rtype: bytes
+    """
+    try:
+        return await run(executor, encrypt_block, compressed_object, encryption_key)
+    except DirectIOError:
+        logger.error('Failed to encrypt block.')
+        raise EncryptBlockError(file_id, chunk)
+
+
+async def upload_chunk(client, file_id, chunk, source, encryption_key, compression_library, semaphore,
+                       executor=None, timings=None):
+    """
+    Upload a Chunk.
+
+    The block is read from the source, compressed, encrypted and uploaded while holding a concurrency slot,
+    so that the number of blocks in memory is bounded.
+
+    :param cterasdk.clients.clients.AsyncClient client: Asynchronous HTTP Client.
+    :param int file_id: File ID.
+    :param cterasdk.direct.types.Chunk chunk: Chunk.
+    :param cterasdk.direct.source.FileSource source: Source file.
+    :param bytes encryption_key: Encryption key.
+    :param str compression_library: Compression library.
+    :param object semaphore: ``asyncio.Semaphore``, or adaptive concurrency controller.
+    :param cterasdk.direct.executor.BlockExecutor,optional executor: CPU executor.
+    :param cterasdk.direct.telemetry.Timings,optional timings: Per-stage timings.
+    :returns: Chunk
+    :rtype: cterasdk.direct.types.Chunk
+    """
+    async with limit(semaphore, chunk):
+        with measure(timings, Stage.Read) as measurement:
+            block = await source.read(chunk.offset, chunk.length)
+            measurement.bytes = len(block)
+        if len(block) != chunk.length:
+            logger.error('Expected block length does not match the length read from the source.')
+            raise BlockValidationException(file_id, chunk)
+        with measure(timings, Stage.Compress):
+            compressed_object = await compress_object(file_id, block, chunk, compression_library, executor)
+        with measure(timings, Stage.Encrypt):
+            encrypted_object = await encrypt_object(file_id, compressed_object, encryption_key, chunk, executor)
+        return await put_object(client, file_id, chunk, encrypted_object, timings=timings)
+
+
+async def upload_chunks(client, file_id, chunks, source, encryption_key, compression_library,
+                        semaphore=None, executor=None, timings=None):
+    """
+    Upload Chunks Asynchronously.
+
+    :param cterasdk.clients.clients.AsyncClient client: Asynchronous HTTP Client.
+    :param int file_id: File ID.
+    :param list[cterasdk.direct.types.Chunk] chunks: Chunks.
+    :param cterasdk.direct.source.FileSource source: Source file.
+    :param bytes encryption_key: Encryption key.
+    :param str compression_library: Compression library.
+    :param object,optional semaphore: ``asyncio.Semaphore``, or adaptive concurrency controller.
+    :param cterasdk.direct.executor.BlockExecutor,optional executor: CPU executor.
+    :param cterasdk.direct.telemetry.Timings,optional timings: Per-stage timings.
+    :returns: List of futures.
+    :rtype: list[asyncio.Task]
+    """
+    message = [f"Uploading {len(chunks)} blocks"]
+    if file_id:
+        message.append(f"for file ID {file_id}")
+    if isinstance(semaphore, AdaptiveConcurrency):
+        message.append("using adaptive concurrency")
+    elif semaphore:
+        message.append(f"using up to {semaphore._value} workers")  # pylint: disable=protected-access
+    logger.debug(' '.join(message))
+    return [
+        asyncio.create_task(upload_chunk(client, file_id, chunk, source, encryption_key, compression_library, semaphore, executor, timings))
+        for chunk in chunks
+    ]
+
+
 def decrypt_encryption_key(file_id, wrapped_key, secret_access_key):
     """
     Decrypt Encryption Key.
@@ -182,20 +666,22 @@ def decrypt_encryption_key(file_id, wrapped_key, secret_access_key):
         raise DecryptKeyError(file_id)
 
 
-@execute_with_retries(retries=3, backoff=1, max_backoff=10)
-async def get_chunks(api, bearer, file_id):
+@execute_with_retries(retries=3, backoff=1, max_backoff=10, on_retry=count_retries(Stage.Metadata))
+async def get_chunks(api, bearer, file_id, timings=None):
     """
     Get Chunks.
 
     :param cterasdk.clients.clients.AsyncJSON api: Asynchronous JSON Client.
     :param str bearer: Bearer Token.
     :param int file_id: File ID.
+    :param cterasdk.direct.telemetry.Timings,optional timings: Per-stage timings.
     :returns: Wrapped key and file chunks.
     :rtype: cterasdk.direct.types.Metadata
     """
     logger.debug('Listing blocks for file ID: %s', file_id)
     try:
-        response = await api.get(f'{file_id}', headers={'Authorization': bearer})
+        with measure(timings, Stage.Metadata):
+            response = await api.get(f'{file_id}', headers={'Authorization': bearer})
         if not response.chunks:
             logger.error('Could not find blocks for file ID: %s.', file_id)
             raise BlocksNotFoundError(file_id)
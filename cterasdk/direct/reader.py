@@ -0,0 +1,196 @@
+import io
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+
+from . import filters
+from .types import ByteRange
+
+
+logger = logging.getLogger('cterasdk.direct')
+
+
+class BlockCache:
+    """
+    LRU Cache of Block Retrieval Tasks.
+
+    Holds decrypted and decompressed blocks, and blocks that are being retrieved.
+    Blocks that are being retrieved are never evicted.
+    """
+
+    def __init__(self, max_blocks):
+        """
+        Initialize a Block Cache.
+
+        :param int max_blocks: Max number of blocks.
+        """
+        self._max_blocks = max_blocks
+        self._tasks = OrderedDict()
+
+    def __contains__(self, number):
+        return number in self._tasks
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def get(self, number, factory):
+        """
+        Get a Block Retrieval Task, Creating it if Not Found.
+
+        :param int number: Block number.
+        :param callable factory: Callable returning a coroutine that retrieves the block.
+        :rtype: asyncio.Task
+        """
+        task = self._tasks.get(number)
+        if task is None or (task.done() and (task.cancelled() or task.exception() is not None)):
+            task = asyncio.ensure_future(factory())
+            self._tasks[number] = task
+        self._tasks.move_to_end(number)
+        self._evict()
+        return task
+
+    def _evict(self):
+        for number in list(self._tasks):
+            if len(self._tasks) <= self._max_blocks:
+                break
+            if self._tasks[number].done():
+                del self._tasks[number]
+
+    def clear(self):
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+
+
+class DirectIOFile(io.RawIOBase):
+    """
+    Random-Access, Read-Only File Object over CTERA Direct IO.
+
+    Reads are mapped to blocks, served from an LRU cache of decrypted and decompressed blocks,
+    and the next blocks are prefetched on sequential access.
+
+    Use the ``aread`` coroutine from the event loop thread. The blocking ``read``, ``readinto`` and
+    ``readall`` methods must be called from a different thread, e.g. using ``asyncio.to_thread``.
+    """
+
+    def __init__(self, metadata, fetch, loop, cache_size=32, prefetch=4):
+        """
+        Initialize a Direct IO File.
+
+        :param cterasdk.direct.types.Metadata metadata: Direct I/O file metadata.
+        :param callable fetch: Coroutine function that accepts a block number and returns a block.
+        :param asyncio.AbstractEventLoop loop: Event loop that runs block retrieval.
+        :param int, optional cache_size: Max number of cached blocks, defaults to ``32``
+        :param int, optional prefetch: Number of blocks to prefetch on sequential access, defaults to ``4``
+        """
+        super().__init__()
+        self._metadata = metadata
+        self._fetch = fetch
+        self._loop = loop
+        self._thread = threading.get_ident()
+        self._cache = BlockCache(max(cache_size, prefetch + 1))
+        self._prefetch = prefetch
+        self._position = 0
+        self._last = 0
+
+    @property
+    def name(self):
+        return self._metadata.file_id
+
+    @property
+    def size(self):
+        return self._metadata.size
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        self._checkClosed()
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        self._checkClosed()
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._metadata.size + offset
+        else:
+            raise ValueError(f'Invalid whence value: {whence}')
+        if position < 0:
+            raise ValueError(f'Negative seek position: {position}')
+        self._position = position
+        return self._position
+
+    def readinto(self, b):
+        if self._loop.is_closed() or not self._loop.is_running():
+            raise ValueError('I/O operation on closed event loop.')
+        if threading.get_ident() == self._thread:
+            raise RuntimeError('Blocking read called from the event loop thread. Use aread() or read from a different thread.')
+        return asyncio.run_coroutine_threadsafe(self.areadinto(b), self._loop).result()
+
+    def readall(self):
+        return self.read(max(0, self._metadata.size - self._position))
+
+    async def aread(self, size=-1):
+        """
+        Read Bytes.
+
+        :param int, optional size: Max number of bytes to read, defaults to reading to the end of the file
+        :returns: Data.
+        :rtype: bytes
+        """
+        self._checkClosed()
+        size = size if size is not None and size > -1 else max(0, self._metadata.size - self._position)
+        buffer = bytearray(min(size, max(0, self._metadata.size - self._position)))
+        return bytes(memoryview(buffer)[:await self.areadinto(buffer)])
+
+    async def areadinto(self, b):
+        """
+        Read Bytes Into a Buffer.
+
+        :param bytearray b: Writable buffer.
+        :returns: Number of bytes read.
+        :rtype: int
+        """
+        self._checkClosed()
+        b = memoryview(b).cast('B')
+        start, length = self._position, min(len(b), max(0, self._metadata.size - self._position))
+        if length == 0:
+            return 0
+        byte_range = ByteRange(start, start + length - 1)
+        chunks = filters.span(self._metadata, byte_range)
+        tasks = [self._cache.get(chunk.number, self._factory(chunk.number)) for chunk in chunks]
+        if start == self._last:
+            self._schedule_prefetch(chunks[-1].number)
+        position = 0
+        for task in tasks:
+            fragment = (await task).fragment(byte_range)
+            b[position:position + fragment.length] = fragment.data
+            position = position + fragment.length
+        self._position = start + position
+        self._last = self._position
+        return position
+
+    def _schedule_prefetch(self, number):
+        if self._prefetch:
+            for following in range(number + 1, min(number + self._prefetch, len(self._metadata.chunks)) + 1):
+                if following not in self._cache:
+                    logger.debug('Prefetching block #%s of file ID %s', following, self._metadata.file_id)
+                    self._cache.get(following, self._factory(following))
+
+    def _factory(self, number):
+        return lambda: self._fetch(number)
+
+    def close(self):
+        if not self.closed:
+            if self._loop.is_running() and threading.get_ident() != self._thread:
+                self._loop.call_soon_threadsafe(self._cache.clear)
+            else:
+                self._cache.clear()
+        super().close()
@@ -0,0 +1,126 @@
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+
+
+logger = logging.getLogger('cterasdk.direct')
+
+
+class SlidingWindow:
+    """
+    Bounded Sliding Window of Block Retrieval Tasks.
+
+    Blocks are retrieved ahead of the consumer and returned in order. New retrieval tasks
+    are scheduled only as the consumer drains earlier blocks, so memory consumption is
+    bounded by the size of the window rather than by the size of the file.
+    """
+
+    def __init__(self, factory, chunks, max_blocks=None, max_bytes=None):
+        """
+        Initialize a Sliding Window.
+
+        :param callable factory: Coroutine function that accepts a chunk and returns a block.
+        :param list[cterasdk.direct.types.Chunk] chunks: Chunks.
+        :param int, optional max_blocks: Max number of blocks scheduled ahead of the consumer.
+        :param int, optional max_bytes: Max number of bytes scheduled ahead of the consumer.
+        """
+        self._factory = factory
+        self._pending = deque(chunks)
+        self._tasks = deque()
+        self._max_blocks = max_blocks
+        self._max_bytes = max_bytes
+        self._buffered = 0
+
+    @property
+    def scheduled(self):
+        """
+        Number of blocks scheduled ahead of the consumer.
+        """
+        return len(self._tasks)
+
+    @property
+    def buffered(self):
+        """
+        Number of bytes scheduled ahead of the consumer.
+        """
+        return self._buffered
+
+    def _admit(self, chunk):
+        if not self._tasks:
+            return True  # Always make progress, even if a single block exceeds the byte limit.
+        if self._max_blocks and len(self._tasks) >= self._max_blocks:
+            return False
+        if self._max_bytes and self._buffered + chunk.length > self._max_bytes:
+            return False
+        return True
+
+    def _fill(self):
+        while self._pending and self._admit(self._pending[0]):
+            chunk = self._pending.popleft()
+            self._tasks.append((chunk, asyncio.create_task(self._factory(chunk))))
+            self._buffered = self._buffered + chunk.length
+        logger.debug('Sliding window. %s', {'blocks': len(self._tasks), 'bytes': self._buffered, 'pending': len(self._pending)})
+
+    def cancel(self):
+        """
+        Cancel all scheduled tasks.
+        """
+        self._pending.clear()
+        while self._tasks:
+            _, task = self._tasks.popleft()
+            task.cancel()
+        self._buffered = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        self._fill()
+        if not self._tasks:
+            raise StopAsyncIteration
+        chunk, task = self._tasks.popleft()
+        self._buffered = self._buffered - chunk.length
+        return await task
+
+
+class ByteBudget:
+    """
+    Budget of Bytes in Flight.
+
+    Limits the number of bytes retrieved concurrently, shared across all files of a batch.
+    """
+
+    def __init__(self, max_bytes):
+        """
+        Initialize a Byte Budget.
+
+        :param int max_bytes: Max number of bytes in flight.
+        """
+        self._max_bytes = max_bytes
+        self._available = max_bytes
+        self._condition = asyncio.Condition()
+
+    @property
+    def available(self):
+        return self._available
+
+    @asynccontextmanager
+    async def reserve(self, length):
+        """
+        Reserve Bytes for the Duration of the Context.
+
+        A reservation larger than the budget waits for the entire budget.
+
+        :param int length: Number of bytes.
+        """
+        length = min(length, self._max_bytes)
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._available >= length)
+            self._available = self._available - length
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._available = self._available + length
+                self._condition.notify_all()
@@ -0,0 +1,84 @@
+import os
+import asyncio
+import logging
+import threading
+
+
+logger = logging.getLogger('cterasdk.direct')
+
+
+class FileSource:
+    """
+    Parallel File Reader.
+
+    Reads blocks at their offset, in any order, from a source file.
+    """
+
+    def __init__(self, path):
+        """
+        Initialize a File Source.
+
+        :param str path: Source path.
+        """
+        self._path = str(path)
+        self._fd = None
+        self._size = None
+        self._lock = threading.Lock()
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def size(self):
+        return self._size
+
+    def open(self):
+        """
+        Open the Source File.
+        """
+        logger.debug('Opening file for reading: %s', self._path)
+        self._fd = os.open(self._path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        self._size = os.fstat(self._fd).st_size
+        return self
+
+    async def read(self, offset, length):
+        """
+        Read Data at Offset.
+
+        :param int offset: Offset.
+        :param int length: Length.
+        :rtype: bytes
+        """
+        return await asyncio.to_thread(self._read, offset, length)
+
+    def _read(self, offset, length):
+        if hasattr(os, 'pread'):
+            data = os.pread(self._fd, length, offset)
+            while len(data) < length:
+                more = os.pread(self._fd, length - len(data), offset + len(data))
+                if not more:
+                    break
+                data = data + more
+            return data
+        with self._lock:
+            os.lseek(self._fd, offset, os.SEEK_SET)
+            chunks, remaining = [], length
+            while remaining > 0:
+                chunk = os.read(self._fd, remaining)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                remaining = remaining - len(chunk)
+            return b''.join(chunks)
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
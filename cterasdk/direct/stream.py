@@ -14,7 +14,7 @@ class Streamer:
         """
         Initialize a Streamer.
 
-        :param callable _executor: Asynchronous Direct IO Callable.
+        :param callable _executor: Asynchronous Direct IO Callable, returning a sliding window of blocks.
         :param cterasdk.direct.types.ByteRange byte_range: Byte Range.
         """
         self._executor = executor
@@ -26,17 +26,16 @@ class Streamer:
         """
         Stop Stream.
         """
-        for download in self._downloads:
-            download.cancel()
+        if self._downloads is not None:
+            self._downloads.cancel()
 
     async def start(self):
         """
-        Stop Stream.
+        Start Stream.
         """
         try:
             self._downloads = await self._executor()
-            for download in self._downloads:
-                block = await download
+            async for block in self._downloads:
                 fragment = block.fragment(self._byte_range)
                 logger.debug('Streamer fragment. %s', {'offset': fragment.offset, 'length': fragment.length})
                 yield fragment
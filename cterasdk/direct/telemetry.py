@@ -0,0 +1,324 @@
+import time
+import bisect
+import logging
+from contextlib import contextmanager
+
+
+logger = logging.getLogger('cterasdk.direct')
+
+
+class Stage:
+    """
+    Direct IO Pipeline Stage
+
+    Stage names used by the block pipeline.
+    """
+    Metadata = 'metadata'
+    Download = 'download'
+    Decrypt = 'decrypt'
+    Decompress = 'decompress'
+    Read = 'read'
+    Compress = 'compress'
+    Encrypt = 'encrypt'
+    Upload = 'upload'
+
+
+class Measurement:
+    """
+    Measurement
+
+    :ivar int bytes: Number of bytes processed
+    :ivar float excluded: Time spent in other stages, excluded from the elapsed time, in seconds
+    """
+
+    def __init__(self):
+        self.bytes = 0
+        self.excluded = 0.0
+
+
+class StageTiming:  # pylint: disable=too-many-instance-attributes
+    """
+    Stage Timing
+
+    :ivar int count: Number of measurements
+    :ivar float elapsed: Total elapsed time, in seconds
+    :ivar float min: Shortest measurement, in seconds
+    :ivar float max: Longest measurement, in seconds
+    :ivar int bytes: Number of bytes processed
+    :ivar int errors: Number of failed measurements
+    :ivar int retries: Number of retries
+    :ivar list[int] buckets: Number of measurements per latency bucket
+    """
+
+    Buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float('inf'))
+
+    def __init__(self):
+        self.count = 0
+        self.elapsed = 0.0
+        self.min = None
+        self.max = None
+        self.bytes = 0
+        self.errors = 0
+        self.retries = 0
+        self.buckets = [0] * len(StageTiming.Buckets)
+
+    @property
+    def average(self):
+        return self.elapsed / self.count if self.count else 0.0
+
+    def record(self, elapsed, length=0):
+        self.count = self.count + 1
+        self.elapsed = self.elapsed + elapsed
+        self.min = elapsed if self.min is None else min(self.min, elapsed)
+        self.max = elapsed if self.max is None else max(self.max, elapsed)
+        self.bytes = self.bytes + length
+        self.buckets[bisect.bisect_left(StageTiming.Buckets, elapsed)] += 1
+
+    def histogram(self):
+        """
+        Cumulative Latency Histogram.
+
+        :returns: List of upper bounds, in seconds, and the number of measurements less than or equal to each bound.
+        :rtype: list[tuple(float, int)]
+        """
+        histogram, count = [], 0
+        for bound, bucket in zip(StageTiming.Buckets, self.buckets):
+            count = count + bucket
+            histogram.append((bound, count))
+        return histogram
+
+    def to_dict(self):
+        return {'count': self.count, 'elapsed': self.elapsed, 'average': self.average, 'min': self.min, 'max': self.max,
+                'bytes': self.bytes, 'errors': self.errors, 'retries': self.retries, 'histogram': self.histogram()}
+
+
+class HostThroughput:
+    """
+    Storage Host Throughput
+
+    :ivar int requests: Number of requests
+    :ivar int bytes: Number of bytes transferred
+    :ivar float elapsed: Total elapsed time of requests, in seconds
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.bytes = 0
+        self.elapsed = 0.0
+
+    @property
+    def throughput(self):
+        """
+        Throughput, in bytes per second of request time.
+        """
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+    def record(self, length, elapsed):
+        self.requests = self.requests + 1
+        self.bytes = self.bytes + length
+        self.elapsed = self.elapsed + elapsed
+
+    def to_dict(self):
+        return {'requests': self.requests, 'bytes': self.bytes, 'elapsed': self.elapsed, 'throughput': self.throughput}
+
+
+class Timings:
+    """
+    Per-Stage Timing of the Direct IO Block Pipeline.
+
+    Records the count, elapsed time, latency histogram, bytes, errors and retries of each stage,
+    and the throughput of each storage host.
+    """
+
+    def __init__(self):
+        self._stages = {}
+        self._hosts = {}
+
+    def __getitem__(self, stage):
+        return self._stages.setdefault(stage, StageTiming())
+
+    @property
+    def stages(self):
+        """
+        Stage Timings, keyed by stage name.
+
+        :rtype: dict[str, cterasdk.direct.telemetry.StageTiming]
+        """
+        return self._stages
+
+    @property
+    def hosts(self):
+        """
+        Storage Host Throughput, keyed by host name.
+
+        :rtype: dict[str, cterasdk.direct.telemetry.HostThroughput]
+        """
+        return self._hosts
+
+    def record(self, stage, elapsed, length=0):
+        """
+        Record a Measurement.
+
+        :param str stage: Stage name.
+        :param float elapsed: Elapsed time, in seconds.
+        :param int, optional length: Number of bytes processed.
+        """
+        self[stage].record(elapsed, length)
+
+    def retry(self, stage):
+        """
+        Record a Retry.
+
+        :param str stage: Stage name.
+        """
+        self[stage].retries += 1
+
+    @contextmanager
+    def measure(self, stage, host=None):
+        """
+        Measure the Elapsed Time of a Stage.
+
+        :param str stage: Stage name.
+        :param str, optional host: Storage host name, to record its throughput.
+        :returns: Measurement, to set the number of bytes processed.
+        :rtype: cterasdk.direct.telemetry.Measurement
+        """
+        measurement = Measurement()
+        start = time.perf_counter()
+        try:
+            yield measurement
+        except BaseException:
+            self[stage].errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start - measurement.excluded
+            self.record(stage, elapsed, measurement.bytes)
+            if host is not None:
+                self._hosts.setdefault(host, HostThroughput()).record(measurement.bytes, elapsed)
+
+    def reset(self):
+        self._stages.clear()
+        self._hosts.clear()
+
+    def export(self, exporter):
+        """
+        Export Metrics.
+
+        :param object exporter: Exporter, e.g. ``cterasdk.direct.telemetry.PrometheusExporter``
+        :returns: Exported metrics.
+        """
+        return exporter.export(self)
+
+    def to_dict(self):
+        """
+        Snapshot of Stage Timings.
+
+        :returns: Dictionary of stage timings, keyed by stage name.
+        :rtype: dict
+        """
+        return {stage: timing.to_dict() for stage, timing in self._stages.items()}
+
+
+class DictExporter:
+    """
+    Export Metrics to a Dictionary.
+    """
+
+    @staticmethod
+    def export(timings):
+        """
+        :param cterasdk.direct.telemetry.Timings timings: Timings.
+        :returns: Dictionary of stage timings and storage host throughput.
+        :rtype: dict
+        """
+        return {'stages': timings.to_dict(), 'hosts': {host: throughput.to_dict() for host, throughput in timings.hosts.items()}}
+
+
+class PrometheusExporter:
+    """
+    Export Metrics in the Prometheus Text Exposition Format.
+    """
+
+    Prefix = 'cterasdk_direct'
+    _openmetrics = False
+
+    def __init__(self, prefix=None):
+        """
+        Initialize a Prometheus Exporter.
+
+        :param str, optional prefix: Metric name prefix, defaults to ``cterasdk_direct``
+        """
+        self._prefix = prefix if prefix is not None else self.Prefix
+
+    def _family(self, lines, name, metric_type, description):
+        family = name[:-len('_total')] if metric_type == 'counter' and self._openmetrics else name
+        lines.append(f'# HELP {family} {description}')
+        lines.append(f'# TYPE {family} {metric_type}')
+
+    @staticmethod
+    def _labels(**labels):
+        escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for value in labels.values())
+        return '{' + ','.join(f'{key}="{value}"' for key, value in zip(labels, escaped)) + '}'
+
+    @staticmethod
+    def _bound(bound):
+        return '+Inf' if bound == float('inf') else repr(bound)
+
+    def export(self, timings):
+        """
+        :param cterasdk.direct.telemetry.Timings timings: Timings.
+        :returns: Metrics text.
+        :rtype: str
+        """
+        lines, stages, hosts = [], timings.stages, timings.hosts
+
+        name = f'{self._prefix}_stage_duration_seconds'
+        self._family(lines, name, 'histogram', 'Duration of Direct IO pipeline stages.')
+        for stage, timing in stages.items():
+            for bound, count in timing.histogram():
+                lines.append(f'{name}_bucket{self._labels(stage=stage, le=self._bound(bound))} {count}')
+            lines.append(f'{name}_sum{self._labels(stage=stage)} {timing.elapsed}')
+            lines.append(f'{name}_count{self._labels(stage=stage)} {timing.count}')
+
+        for metric, description, attribute in [
+            ('stage_bytes_total', 'Bytes processed by Direct IO pipeline stages.', 'bytes'),
+            ('stage_errors_total', 'Failures of Direct IO pipeline stages.', 'errors'),
+            ('stage_retries_total', 'Retries of Direct IO pipeline stages.', 'retries')
+        ]:
+            name = f'{self._prefix}_{metric}'
+            self._family(lines, name, 'counter', description)
+            for stage, timing in stages.items():
+                lines.append(f'{name}{self._labels(stage=stage)} {getattr(timing, attribute)}')
+
+        for metric, description, attribute in [
+            ('host_requests_total', 'Block requests per storage host.', 'requests'),
+            ('host_bytes_total', 'Bytes transferred per storage host.', 'bytes'),
+            ('host_seconds_total', 'Elapsed time of block requests per storage host.', 'elapsed')
+        ]:
+            name = f'{self._prefix}_{metric}'
+            self._family(lines, name, 'counter', description)
+            for host, throughput in hosts.items():
+                lines.append(f'{name}{self._labels(host=host)} {getattr(throughput, attribute)}')
+
+        name = f'{self._prefix}_host_throughput_bytes_per_second'
+        self._family(lines, name, 'gauge', 'Throughput per storage host.')
+        for host, throughput in hosts.items():
+            lines.append(f'{name}{self._labels(host=host)} {throughput.throughput}')
+
+        return self._end(lines)
+
+    @staticmethod
+    def _end(lines):
+        return '\n'.join(lines) + '\n'
+
+
+class OpenMetricsExporter(PrometheusExporter):
+    """
+    Export Metrics in the OpenMetrics Text Format.
+    """
+
+    _openmetrics = True
+
+    @staticmethod
+    def _end(lines):
+        return '\n'.join(lines + ['# EOF']) + '\n'
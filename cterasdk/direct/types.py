@@ -1,5 +1,8 @@
 import copy
 import base64
+import itertools
+from array import array
+from collections.abc import Mapping, Sequence
 from ..common import Object, utils
 
 
@@ -54,7 +57,18 @@ class CompressionLib:
     Off = 'NONE'
 
 
-class Chunk(Object):
+class Chunk(Mapping):
+    """
+    Chunk
+
+    An immutable chunk record. Fields are accessed as attributes, or by key.
+
+    :ivar int number: Chunk number
+    :ivar int offset: Chunk offset
+    :ivar str url: Signed URL
+    :ivar int length: Object length
+    """
+    __slots__ = ('number', 'offset', 'url', 'length')
 
     def __init__(self, number, offset, url, length):
         """
@@ -65,12 +79,78 @@ class Chunk(Object):
         :param str url: Signed URL.
         :param int length: Object length.
         """
-        super().__init__(
-            number=number,
-            offset=offset,
-            url=url,
-            length=length
-        )
+        object.__setattr__(self, 'number', number)
+        object.__setattr__(self, 'offset', offset)
+        object.__setattr__(self, 'url', url)
+        object.__setattr__(self, 'length', length)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Cannot set attribute '{name}'. Chunk is immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Cannot delete attribute '{name}'. Chunk is immutable.")
+
+    def __getitem__(self, key):
+        if key not in Chunk.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(Chunk.__slots__)
+
+    def __len__(self):
+        return len(Chunk.__slots__)
+
+    def __eq__(self, other):
+        if not isinstance(other, Chunk):
+            return NotImplemented
+        return all(getattr(self, k) == getattr(other, k) for k in Chunk.__slots__)
+
+    def __hash__(self):
+        return hash((self.number, self.offset, self.url, self.length))
+
+    def __repr__(self):
+        return f'Chunk(number={self.number}, offset={self.offset}, length={self.length})'
+
+    def to_dict(self):
+        return dict(self)
+
+
+class ChunkTable(Sequence):
+    """
+    Columnar Table of Chunks.
+
+    Stores chunk end offsets in a compact ``array('q')`` column, alongside the signed URLs.
+    Chunk records are created on access.
+
+    :ivar array.array ends: Chunk end offsets, exclusive
+    """
+
+    def __init__(self, lengths, urls):
+        """
+        Initialize a Chunk Table.
+
+        :param iterable[int] lengths: Chunk lengths, ordered by offset.
+        :param list[str] urls: Signed URLs.
+        """
+        self.ends = array('q', itertools.accumulate(lengths))
+        self._urls = urls
+
+    def __len__(self):
+        return len(self.ends)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._chunk(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index = index + len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Chunk index out of range')
+        return self._chunk(index)
+
+    def _chunk(self, index):
+        offset = self.ends[index - 1] if index > 0 else 0
+        return Chunk(index + 1, offset, self._urls[index], self.ends[index] - offset)
 
 
 class Metadata(Object):
@@ -93,39 +173,35 @@ class Metadata(Object):
         )
         self.encryption_key = server_object.encrypt_info.wrapped_key if self.encrypted else None
         self.compression_library = server_object.compression_type if self.compressed else None
-        last_chunk = self.chunks[-1]
-        self.size = last_chunk.offset + last_chunk.length
+        self.size = self.chunks.ends[-1]
 
     @staticmethod
     def _format_chunks(server_object):
         """
         Create Chunks.
 
-        :param int file_id: File ID.
         :param cterasdk.common.object.Object server_object: Server response.
-        :param list[int] blocks: List of block numbers to retrieve.
-        :returns: Chunk objects
-        :rtype: list[cterasdk.direct.types.Chunk]
+        :returns: Chunk table
+        :rtype: cterasdk.direct.types.ChunkTable
         """
-        offset = 0
-        chunks = []
-        for number, chunk in enumerate(server_object, 1):
-            chunks.append(Chunk(number, offset, chunk.url, chunk.len))
-            offset = offset + chunk.len
-        return chunks
+        return ChunkTable([chunk.len for chunk in server_object], [chunk.url for chunk in server_object])
 
     def serialize(self):
         """
         Serialize Direct IO metadata to a dictionary.
         """
-        x = copy.deepcopy(self)
+        x = copy.copy(self)  # Chunks are immutable and shared
         if self.encrypted:
             x.encryption_key = utils.utf8_decode(base64.b64encode(self.encryption_key))
         return x
 
+    def to_dict(self):
+        return {**self.__dict__, 'chunks': [chunk.to_dict() for chunk in self.chunks]}
+
 
 class Block:
     """Block"""
+    __slots__ = ('_file_id', '_number', '_offset', '_data', '_length')
 
     def __init__(self, file_id, number, offset, data, length):
         """
@@ -134,13 +210,13 @@ class Block:
         :param int file_id: File ID.
         :param int number: Block number.
         :param int offset: Block offset.
-        :param bytes data: Bytes
+        :param memoryview data: Bytes
         :param int length: Block length.
         """
         self._file_id = file_id
         self._number = number
         self._offset = offset
-        self._data = data
+        self._data = memoryview(data)
         self._length = length
 
     @property
@@ -164,6 +240,13 @@ class Block:
         return self._length
 
     def fragment(self, byte_range):
+        """
+        Get a Fragment of the Block Within a Byte Range, without copying the block data.
+
+        :param cterasdk.direct.types.ByteRange byte_range: Byte range.
+        :returns: Block fragment.
+        :rtype: cterasdk.direct.types.Block
+        """
         if byte_range.start > self._offset and byte_range.start < self._offset + self._length:
             start = byte_range.start - self._offset
         else:
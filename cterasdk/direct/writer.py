@@ -0,0 +1,171 @@
+import os
+import mmap
+import asyncio
+import logging
+import threading
+
+
+logger = logging.getLogger('cterasdk.direct')
+
+
+class FileWriter:  # pylint: disable=too-many-instance-attributes
+    """
+    Parallel File Writer.
+
+    Writes blocks at their offset, in any order, to a preallocated temporary file
+    that is atomically renamed to its destination on commit.
+    """
+
+    def __init__(self, path, size, use_mmap=False, fsync_interval=None, journal=None):
+        """
+        Initialize a File Writer.
+
+        :param str path: Destination path.
+        :param int size: File size.
+        :param bool, optional use_mmap: Write blocks into a memory-mapped file, defaults to ``False``
+        :param int, optional fsync_interval: Number of bytes to write between file synchronizations, defaults to syncing on commit only
+        :param cterasdk.direct.journal.Journal, optional journal: Checkpoint journal, updated on every file synchronization
+        """
+        self._path = str(path)
+        self._size = size
+        self._use_mmap = use_mmap and size > 0
+        self._fsync_interval = fsync_interval
+        self._fd = None
+        self._mmap = None
+        self._view = None
+        self._journal = journal
+        self._lock = threading.Lock()
+        self._unsynced = 0
+        self._written = 0
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def temporary_path(self):
+        return f'{self._path}.part'
+
+    @property
+    def written(self):
+        """
+        Number of bytes written.
+        """
+        return self._written
+
+    def open(self, truncate=True):
+        """
+        Open and Preallocate the Temporary File.
+
+        :param bool, optional truncate: Discard the contents of an existing temporary file, defaults to ``True``.
+         Set to ``False`` to resume writing to a temporary file.
+        """
+        logger.debug('Opening file for writing: %s', self.temporary_path)
+        flags = os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0) | (os.O_TRUNC if truncate else 0)
+        self._fd = os.open(self.temporary_path, flags, 0o644)
+        self._preallocate()
+        if self._use_mmap:
+            self._mmap = mmap.mmap(self._fd, self._size)
+            self._view = memoryview(self._mmap)
+        return self
+
+    def _preallocate(self):
+        if hasattr(os, 'posix_fallocate') and self._size > 0:
+            try:
+                os.posix_fallocate(self._fd, 0, self._size)
+            except OSError as error:
+                logger.debug('Could not preallocate file, falling back to truncate. %s', error)
+        os.ftruncate(self._fd, self._size)
+
+    def buffer(self, offset, length):
+        """
+        Get a Writable Buffer Mapped to a Region of the File.
+
+        :param int offset: Offset.
+        :param int length: Length.
+        :returns: Writable buffer if the file is memory-mapped, ``None`` otherwise.
+        :rtype: memoryview
+        """
+        return self._view[offset:offset + length] if self._view is not None else None
+
+    async def write(self, offset, data):
+        """
+        Write Data at Offset.
+
+        :param int offset: Offset.
+        :param memoryview data: Data.
+        """
+        await asyncio.to_thread(self._write, offset, data)
+
+    def _write(self, offset, data):
+        data = memoryview(data)
+        if self._view is not None:
+            if data.obj is not self._mmap:  # Data was not decompressed into the memory-mapped file
+                self._view[offset:offset + len(data)] = data
+        elif hasattr(os, 'pwrite'):
+            position = 0
+            while position < len(data):
+                position = position + os.pwrite(self._fd, data[position:], offset + position)
+        else:
+            with self._lock:
+                os.lseek(self._fd, offset, os.SEEK_SET)
+                position = 0
+                while position < len(data):
+                    position = position + os.write(self._fd, data[position:])
+        self._synchronize(len(data))
+
+    def _synchronize(self, length):
+        with self._lock:
+            self._written = self._written + length
+            self._unsynced = self._unsynced + length
+            if not self._fsync_interval or self._unsynced < self._fsync_interval:
+                return
+            self._unsynced = 0
+        self._fsync()
+
+    def _fsync(self):
+        pending = self._journal.pending() if self._journal is not None else None
+        if self._mmap is not None:
+            self._mmap.flush()
+        os.fsync(self._fd)
+        if pending:
+            self._journal.checkpoint(pending)
+
+    def _close(self):
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                logger.debug('Memory-mapped file is still referenced. Deferring close to garbage collection.')
+            self._mmap = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    async def commit(self):
+        """
+        Synchronize, Close and Rename the Temporary File to its Destination.
+        """
+        await asyncio.to_thread(self._commit)
+
+    def _commit(self):
+        os.ftruncate(self._fd, self._size)  # Discard bytes beyond the file size, left by a previous download
+        self._fsync()
+        self._close()
+        os.replace(self.temporary_path, self._path)
+        logger.debug('Saved file: %s', self._path)
+
+    def abort(self, keep=False):
+        """
+        Close and Remove the Temporary File.
+
+        :param bool, optional keep: Synchronize and keep the temporary file to allow resuming, defaults to ``False``
+        """
+        if keep and self._fd is not None:
+            self._fsync()
+        self._close()
+        if not keep and os.path.exists(self.temporary_path):
+            os.remove(self.temporary_path)
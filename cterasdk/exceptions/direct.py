@@ -101,6 +101,42 @@ class DownloadConnectionError(BlockError):
         super().__init__(errno.ENETRESET, 'Failed to download block. Connection error', file_id, chunk)
 
 
+class SignedURLExpired(BlockError):
+
+    def __init__(self, file_id, chunk):
+        super().__init__(errno.EACCES, 'Failed to download block. Signed URL expired or access denied', file_id, chunk)
+
+
+class UploadError(BlockError):
+
+    def __init__(self, strerror, file_id, chunk):
+        super().__init__(errno.EIO, strerror, file_id, chunk)
+
+
+class UploadTimeout(BlockError):
+
+    def __init__(self, file_id, chunk):
+        super().__init__(errno.ETIMEDOUT, 'Failed to upload block. Timed out', file_id, chunk)
+
+
+class UploadConnectionError(BlockError):
+
+    def __init__(self, file_id, chunk):
+        super().__init__(errno.ENETRESET, 'Failed to upload block. Connection error', file_id, chunk)
+
+
+class EncryptBlockError(BlockError):
+
+    def __init__(self, file_id, chunk):
+        super().__init__(errno.EIO, 'Failed to encrypt block', file_id, chunk)
+
+
+class CompressBlockError(BlockError):
+
+    def __init__(self, file_id, chunk):
+        super().__init__(errno.EIO, 'Failed to compress block', file_id, chunk)
+
+
 class DecryptBlockError(BlockError):
 
     def __init__(self, file_id, chunk):
@@ -102,3 +102,17 @@ class TLSError(CTERAException):
         super().__init__(f"TLS handshake to '{host}:{port}' failed.")
         self.host = host
         self.port = port
+
+
+class CircuitOpenError(CTERAException, ConnectionError):
+    """
+    Circuit Open Error, raised without sending a request to an endpoint that failed repeatedly.
+
+    :ivar str url: Base URL
+    :ivar float retry_after: Seconds until a request may be sent to probe the endpoint
+    """
+
+    def __init__(self, url, retry_after):
+        super().__init__(f"Circuit open for '{url}'. Retry after {retry_after:.1f} seconds.")
+        self.url = url
+        self.retry_after = retry_after
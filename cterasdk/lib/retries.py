@@ -1,4 +1,5 @@
 import asyncio
+import inspect
 import logging
 import functools
 
@@ -6,7 +7,7 @@ import functools
 logger = logging.getLogger('cterasdk.common')
 
 
-def execute_with_retries(retries=None, backoff=None, max_backoff=None):
+def execute_with_retries(retries=None, backoff=None, max_backoff=None, on_retry=None, giveup=()):
     """
     A decorator that retries a function or coroutine upon exception, using exponential backoff.
 
@@ -14,8 +15,12 @@ def execute_with_retries(retries=None, backoff=None, max_backoff=None):
 
     :param int retries: The maximum number of attempts before giving up.
     :param int backoff: The initial backoff delay in seconds.
+    :param callable on_retry: Called with the exception and the ``inspect.BoundArguments`` of the call, before backing off.
+    :param tuple giveup: Exception types raised without retrying.
     """
     def decorator(func):
+        signature = inspect.signature(func)
+
         @functools.wraps(func)
         async def a_wrapper(*args, **kwargs):
             delay = backoff
@@ -23,11 +28,15 @@ def execute_with_retries(retries=None, backoff=None, max_backoff=None):
                 try:
                     logger.debug("Try %s out of %s of function: '%s'", try_num + 1, retries, func.__name__)
                     return await func(*args, **kwargs)
+                except giveup:
+                    raise
                 except Exception as e:  # pylint: disable=broad-exception-caught
                     logger.debug("Try %s of %s of function '%s' failed. Backing off for %s second(s).", try_num + 1, retries,
                                  func.__name__, delay)
                     if try_num == retries - 1:
                         raise e
+                    if on_retry is not None:
+                        on_retry(e, signature.bind(*args, **kwargs))
                     await asyncio.sleep(delay)
                     delay = min(max_backoff, delay * 2)
         return a_wrapper
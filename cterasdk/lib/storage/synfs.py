@@ -32,7 +32,7 @@ def overwrite(p, handle):
         if isinstance(handle, bytes):
             fd.write(handle)
         else:
-            for chunk in handle.iter_content(chunk_size=8192):
+            for chunk in handle.iter_content():
                 fd.write(chunk)
         logger.debug('Wrote: %s', p.as_posix())
     return p.as_posix()
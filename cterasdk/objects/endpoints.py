@@ -6,6 +6,10 @@ class DefaultBuilder:
     def __init__(self, base=None):
         self._base = base
 
+    @property
+    def base(self):
+        return self._base
+
     def __call__(self, url):
         return uri.join(self._base, url)
 
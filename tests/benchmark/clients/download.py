@@ -0,0 +1,118 @@
+"""
+Synchronous Download Benchmark.
+
+Measures the throughput of writing a downloaded file to disk using ``SyncResponse.iter_content``,
+the way ``files.download`` does, compared with the legacy iteration of re-creating a chunk iterator for every 8 KiB chunk.
+
+Usage::
+
+    python -m tests.benchmark.clients.download --size 2048
+"""
+import os
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+from cterasdk.conf import SynchronousClient
+from cterasdk.clients.clients import Client, execute
+from cterasdk.lib.storage import synfs
+from cterasdk.objects.endpoints import EndpointBuilder
+
+from .server import Server
+
+
+MiB = 1024 * 1024
+
+
+class LegacyHandle:
+    """
+    Response Handle, Re-Creating a Chunk Iterator for Every Chunk.
+    """
+
+    def __init__(self, response):
+        self._response = response
+
+    def iter_content(self, chunk_size=None):
+        async def next_chunk():
+            return await anext(self._response._response.content.iter_chunked(chunk_size or 8192))  # pylint: disable=protected-access
+
+        while True:
+            try:
+                yield execute(next_chunk)
+            except StopAsyncIteration:
+                break
+
+
+class Handle:
+    """
+    Response Handle, Using a Chunk Size and a Read Ahead Queue Size.
+    """
+
+    def __init__(self, response, chunk_size, queue_size):
+        self._response = response
+        self._chunk_size = chunk_size
+        self._queue_size = queue_size
+
+    def iter_content(self, chunk_size=None):  # pylint: disable=unused-argument
+        return self._response.iter_content(self._chunk_size, self._queue_size)
+
+
+def cases():
+    """
+    Benchmark Cases.
+
+    :returns: List of case names and handle factories.
+    :rtype: list[tuple(str, callable)]
+    """
+    return [
+        ('legacy, 8 KiB', LegacyHandle),
+        ('1 MiB', lambda response: Handle(response, MiB, 0)),
+        ('1 MiB, queue of 4', lambda response: Handle(response, MiB, 4)),
+        ('8 MiB', lambda response: Handle(response, 8 * MiB, 0)),
+        ('8 MiB, queue of 2', lambda response: Handle(response, 8 * MiB, 2)),
+    ]
+
+
+def run(size):
+    """
+    Run the Benchmark.
+
+    :param int size: File size, in bytes.
+    :returns: List of case names, elapsed time and CPU time, in seconds.
+    :rtype: list[tuple(str, float, float)]
+    """
+    server = Server().start_in_thread()
+    client = Client(EndpointBuilder.new(server.baseurl), settings=SynchronousClient().settings, authenticator=lambda *_: True)
+    results = []
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'download.bin'
+            for name, factory in cases():
+                cpu, start = time.process_time(), time.perf_counter()
+                synfs.overwrite(path, factory(client.get(f'/files/{size}')))
+                elapsed, cpu = time.perf_counter() - start, time.process_time() - cpu
+                if os.path.getsize(path) != size:
+                    raise AssertionError(f'Expected {size} bytes, received {os.path.getsize(path)}.')
+                results.append((name, elapsed, cpu))
+    finally:
+        client.close()
+        server.stop_thread()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark synchronous downloads.')
+    parser.add_argument('--size', type=float, default=2048, help='File size, in MiB (default: 2048)')
+    args = parser.parse_args(argv)
+
+    size = int(args.size * MiB)
+    results = run(size)
+    print(f"{'case':>20} {'MiB/s':>10} {'elapsed':>10} {'cpu':>10}")
+    for name, elapsed, cpu in results:
+        print(f'{name:>20} {size / MiB / elapsed:>10.1f} {elapsed:>10.3f} {cpu:>10.3f}')
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""
+Synchronous Client Event Loop Benchmark.
+
+Measures the throughput of small GET requests issued by a synchronous client, using the background event loop thread,
+and using the legacy strategy of running each request to completion on the caller's event loop,
+or on a new thread if the caller's event loop is running.
+
+Usage::
+
+    python -m tests.benchmark.clients.event_loop --requests 2000 --threads 4
+"""
+import time
+import asyncio
+import argparse
+import threading
+from unittest import mock
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+
+from cterasdk.conf import SynchronousClient
+from cterasdk.clients.clients import JSON
+from cterasdk.objects.endpoints import EndpointBuilder
+
+from .server import Server
+
+
+legacy_loop = asyncio.new_event_loop()
+
+
+def legacy_execute(target, *args, **kwargs):
+    """
+    Run a Coroutine Function to Completion on the Caller's Event Loop, or on a New Thread if the Loop is Running.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.get_event_loop_policy().get_event_loop().run_until_complete(target(*args, **kwargs))
+    result = {}
+
+    def run_in_thread():
+        try:
+            result['response'] = legacy_loop.run_until_complete(target(*args, **kwargs))
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            result['error'] = error
+
+    thread = threading.Thread(target=run_in_thread)
+    thread.start()
+    thread.join()
+    if 'error' in result:
+        raise result['error']
+    return result['response']
+
+
+def client(baseurl):
+    return JSON(EndpointBuilder.new(baseurl, '/api'), settings=SynchronousClient().settings, authenticator=lambda *_: True)
+
+
+def sequential(baseurl, requests):
+    """
+    Issue Requests Sequentially, from a Thread without a Running Event Loop.
+
+    :returns: Elapsed time, in seconds.
+    :rtype: float
+    """
+    c = client(baseurl)
+    c.get('/warmup')
+    start = time.perf_counter()
+    for i in range(requests):
+        c.get(f'/{i}')
+    elapsed = time.perf_counter() - start
+    c.close()
+    return elapsed
+
+
+def running(baseurl, requests):
+    """
+    Issue Requests Sequentially, from a Coroutine Running on an Event Loop.
+
+    :returns: Elapsed time, in seconds.
+    :rtype: float
+    """
+    async def issue():
+        return sequential(baseurl, requests)
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(issue())
+    finally:
+        loop.close()
+
+
+def threads(baseurl, requests, workers):
+    """
+    Issue Requests from Multiple Threads, Sharing a Client.
+
+    :returns: Elapsed time, in seconds.
+    :rtype: float
+    """
+    c = client(baseurl)
+    c.get('/warmup')
+    start = time.perf_counter()
+    with ThreadPoolExecutor(workers) as executor:
+        list(executor.map(lambda i: c.get(f'/{i}'), range(requests)))
+    elapsed = time.perf_counter() - start
+    c.close()
+    return elapsed
+
+
+def run(requests, workers):
+    """
+    Run the Benchmark.
+
+    :param int requests: Number of requests per scenario.
+    :param int workers: Number of threads of the multi-threaded scenario.
+    :returns: List of strategy, scenario and requests per second.
+    :rtype: list[tuple(str, str, float)]
+    """
+    server = Server().start_in_thread()
+    results = []
+    try:
+        for strategy in ['legacy', 'event loop thread']:
+            with mock.patch('cterasdk.clients.clients.execute', legacy_execute) if strategy == 'legacy' else nullcontext():
+                results.append((strategy, 'sequential', requests / sequential(server.baseurl, requests)))
+                results.append((strategy, 'running loop', requests / running(server.baseurl, requests)))
+                if strategy != 'legacy':  # Legacy strategy does not support concurrent threads
+                    results.append((strategy, f'{workers} threads', requests / threads(server.baseurl, requests, workers)))
+    finally:
+        server.stop_thread()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark small GET requests of synchronous clients.')
+    parser.add_argument('--requests', type=int, default=2000, help='Requests per scenario (default: 2000)')
+    parser.add_argument('--threads', type=int, default=4, help='Threads of the multi-threaded scenario (default: 4)')
+    args = parser.parse_args(argv)
+
+    results = run(args.requests, args.threads)
+    print(f"{'strategy':>20} {'scenario':>15} {'requests/s':>12}")
+    for strategy, scenario, throughput in results:
+        print(f'{strategy:>20} {scenario:>15} {throughput:>12.1f}')
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+import asyncio
+import threading
+
+from aiohttp import web
+
+
+class Server:
+    """
+    Local HTTP Server Stand-In.
+
+    Serves a small JSON document at ``/api/{name}``, and a file of a given size at ``/files/{size}``,
+    with an optional injected latency per request.
+    """
+
+    def __init__(self, latency=0.0):
+        """
+        Initialize a Server Stand-In.
+
+        :param float, optional latency: Latency injected to each request, in seconds.
+        """
+        self.latency = latency
+        self.requests = 0
+        self._runner = None
+        self._loop = None
+        self._thread = None
+        self.port = None
+
+    @property
+    def baseurl(self):
+        return f'http://127.0.0.1:{self.port}'
+
+    async def _get(self, request):
+        self.requests = self.requests + 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return web.json_response({'name': request.match_info['name']})
+
+    @staticmethod
+    def content(size):
+        """
+        Content of a File.
+
+        :param int size: File size, in bytes.
+        :rtype: bytes
+        """
+        return (bytes(range(256)) * (size // 256 + 1))[:size]
+
+    async def _file(self, request):
+        self.requests = self.requests + 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        size = int(request.match_info['size'])
+        response = web.StreamResponse(headers={'Content-Length': str(size), 'Content-Type': 'application/octet-stream'})
+        await response.prepare(request)
+        block = Server.content(1024 * 1024)
+        for offset in range(0, size, len(block)):
+            await response.write(block[:min(len(block), size - offset)])
+        await response.write_eof()
+        return response
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_get('/api/{name}', self._get)
+        app.router.add_get('/files/{size}', self._file)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    def start_in_thread(self):
+        """
+        Start Serving on an Event Loop of a Background Thread.
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+        return self
+
+    def stop_thread(self):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
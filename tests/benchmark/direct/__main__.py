@@ -0,0 +1,4 @@
+from .harness import main
+
+
+main()
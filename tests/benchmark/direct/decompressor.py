@@ -0,0 +1,90 @@
+"""
+Direct IO Block Decompression Microbenchmark.
+
+Compares the decompression paths of ``cterasdk.direct.decompressor`` on blocks of a given size.
+
+Usage::
+
+    python -m tests.benchmark.direct.decompressor --block-size 4 --repeat 20
+"""
+import os
+import timeit
+import argparse
+
+from cterasdk.direct import decompressor
+
+from .server import compress, Compression
+
+
+MiB = 1024 * 1024
+
+
+def block(size):
+    """
+    Create a Block of Data, Half Random and Half Zero-Filled.
+
+    :param int size: Block size, in bytes.
+    :rtype: bytes
+    """
+    return os.urandom(size // 2) + b'\x00' * (size - size // 2)
+
+
+def frames(compressed_block):
+    return [compressed_block[start:end] for start, end in decompressor.frame_spans(memoryview(compressed_block))]
+
+
+def cases(data):
+    """
+    Benchmark Cases.
+
+    :param bytes data: Block.
+    :returns: List of case names and callables.
+    :rtype: list[tuple(str, callable)]
+    """
+    framed, raw, gzipped = [compress(data, compression) for compression in [Compression.Framed, Compression.Snappy, Compression.Gzip]]
+    output = memoryview(bytearray(len(data)))
+    return [
+        ('framed, frame loop', lambda: decompressor.decompress_frames(frames(framed))),
+        ('framed, frame loop, buffer', lambda: decompressor.decompress_frames(frames(framed), output)),
+        ('framed, preallocated', lambda: decompressor.decompress_with_magic_header(framed)),
+        ('framed, preallocated, buffer', lambda: decompressor.decompress_with_magic_header(framed, output)),
+        ('snappy', lambda: decompressor.decompress(raw)),
+        ('snappy, buffer', lambda: decompressor.decompress(raw, output=output)),
+        ('gzip', lambda: decompressor.decompress(gzipped, len(data))),
+    ]
+
+
+def run(size, repeat):
+    """
+    Run the Microbenchmark.
+
+    :param int size: Block size, in bytes.
+    :param int repeat: Number of repetitions of each case.
+    :returns: List of case names, and the best elapsed time of each case, in seconds.
+    :rtype: list[tuple(str, float)]
+    """
+    data = block(size)
+    results = []
+    for name, function in cases(data):
+        if bytes(function()) != data:
+            raise AssertionError(f'Decompression mismatch: {name}')
+        results.append((name, min(timeit.repeat(function, number=1, repeat=repeat))))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark Direct IO block decompression.')
+    parser.add_argument('--block-size', type=float, default=4, help='Block size, in MiB (default: 4)')
+    parser.add_argument('--repeat', type=int, default=20, help='Repetitions of each case (default: 20)')
+    args = parser.parse_args(argv)
+
+    size = int(args.block_size * MiB)
+    results = run(size, args.repeat)
+    print(f"{'case':>30} {'ms':>10} {'MiB/s':>10}")
+    for name, elapsed in results:
+        print(f'{name:>30} {elapsed * 1000:>10.3f} {size / MiB / elapsed:>10.1f}')
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+"""
+Direct IO Benchmark Harness.
+
+Measures throughput, CPU time and peak RSS of ``DirectIO.blocks``, ``DirectIO.streamer`` and the CLI downloader,
+against a local stand-in of the Direct IO API and the object store.
+
+Usage::
+
+    python -m tests.benchmark.direct --block-sizes 1 4 --workers 4 20 --latency 0 0.02 --modes blocks streamer cli
+"""
+import os
+import sys
+import json
+import time
+import base64
+import asyncio
+import argparse
+import tempfile
+import itertools
+import multiprocessing
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import cterasdk.settings
+from cterasdk.direct.client import DirectIO
+from cterasdk.cli.direct import download_from_object_storage
+
+from .server import ObjectStore, Compression
+
+
+MiB = 1024 * 1024
+
+
+class Mode:
+    """
+    Benchmark Mode
+
+    :ivar str Blocks: ``DirectIO.blocks``
+    :ivar str Streamer: ``DirectIO.streamer``
+    :ivar str CLI: CLI downloader
+    """
+    Blocks = 'blocks'
+    Streamer = 'streamer'
+    CLI = 'cli'
+
+
+class Scenario:
+    """
+    Benchmark Scenario
+
+    :ivar str mode: Benchmark mode
+    :ivar int size: File size, in bytes
+    :ivar int block_size: Block size, in bytes
+    :ivar int workers: Max concurrent block downloads
+    :ivar float latency: Latency injected to each block request, in seconds
+    :ivar str compression: Block compression
+    """
+
+    def __init__(self, mode, size, block_size, workers, latency, compression):  # pylint: disable=too-many-arguments
+        self.mode = mode
+        self.size = size
+        self.block_size = block_size
+        self.workers = workers
+        self.latency = latency
+        self.compression = compression
+
+    def to_dict(self):
+        return dict(self.__dict__)
+
+
+def peak_rss():
+    """
+    Peak Resident Set Size of the Current Process.
+
+    On Linux, ``ru_maxrss`` is inherited from the parent process, so the high water mark of the address space is used instead.
+
+    :returns: Peak RSS, in bytes, or ``None`` if not available.
+    :rtype: int
+    """
+    try:
+        with open('/proc/self/status', 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+async def execute(mode, baseurl, access_key_id, secret_access_key, file_id, workers, directory):  # pylint: disable=too-many-arguments
+    """
+    Download a File.
+
+    :returns: Number of bytes received.
+    :rtype: int
+    """
+    options = {'baseurl': baseurl, 'access_key_id': access_key_id, 'secret_access_key': secret_access_key}
+    if mode == Mode.CLI:
+        path, max_workers = os.path.join(directory, f'{file_id}.bin'), cterasdk.settings.io.direct.streamer.max_workers
+        cterasdk.settings.io.direct.streamer.max_workers = workers
+        try:
+            await download_from_object_storage(options, file_id, path)
+        finally:
+            cterasdk.settings.io.direct.streamer.max_workers = max_workers
+        size = os.path.getsize(path)
+        os.remove(path)
+        return size
+    size = 0
+    async with DirectIO(**options) as client:
+        if mode == Mode.Blocks:
+            for future in await client.blocks(file_id, max_workers=workers):
+                size = size + (await future).length
+        else:
+            async for block in (await client.streamer(file_id, max_workers=workers)).start():
+                size = size + block.length
+    return size
+
+
+def measure(mode, baseurl, access_key_id, secret_access_key, file_id, workers):  # pylint: disable=too-many-arguments
+    """
+    Measure a Download.
+
+    :returns: Dictionary of bytes received, elapsed time and CPU time in seconds, and peak RSS in bytes.
+    :rtype: dict
+    """
+    baseline = peak_rss()
+    with tempfile.TemporaryDirectory() as directory:
+        cpu, start = time.process_time(), time.perf_counter()
+        size = asyncio.run(execute(mode, baseurl, access_key_id, secret_access_key, file_id, workers, directory))
+        elapsed, cpu = time.perf_counter() - start, time.process_time() - cpu
+    return {'bytes': size, 'elapsed': elapsed, 'cpu': cpu, 'baseline_rss': baseline, 'peak_rss': peak_rss()}
+
+
+def run_scenario(scenario, in_process=False):
+    """
+    Run a Benchmark Scenario.
+
+    The object store stand-in runs on a background thread. Unless ``in_process`` is set,
+    the download runs in a new process, so that its CPU time and peak RSS are measured in isolation.
+
+    :param Scenario scenario: Scenario.
+    :param bool, optional in_process: Run the download in the current process, defaults to ``False``
+    :returns: Scenario and its measurements.
+    :rtype: dict
+    """
+    access_key_id, secret_access_key = 'benchmark', base64.b64encode(os.urandom(32)).decode('utf-8')
+    store = ObjectStore(secret_access_key, scenario.latency)
+    store.add(1, scenario.size, scenario.block_size, scenario.compression)
+    store.start_in_thread()
+    try:
+        arguments = (scenario.mode, store.baseurl, access_key_id, secret_access_key, 1, scenario.workers)
+        if in_process:
+            result = measure(*arguments)
+        else:
+            with multiprocessing.get_context('spawn').Pool(1) as pool:
+                result = pool.apply(measure, arguments)
+    finally:
+        store.stop_thread()
+    if result['bytes'] != scenario.size:
+        raise AssertionError(f"Expected {scenario.size} bytes, received {result['bytes']}.")
+    result['throughput'] = result['bytes'] / result['elapsed'] if result['elapsed'] else 0.0
+    result['requests'] = store.requests
+    return {**scenario.to_dict(), **result}
+
+
+def scenarios(modes, size, block_sizes, workers, latencies, compressions):  # pylint: disable=too-many-arguments
+    """
+    Generate the Scenarios of a Benchmark Matrix.
+
+    :rtype: list[Scenario]
+    """
+    return [
+        Scenario(mode, size, block_size, worker_count, latency, compression)
+        for block_size, compression, latency, worker_count, mode in itertools.product(block_sizes, compressions, latencies, workers, modes)
+    ]
+
+
+def report(results=None, file=None):
+    """
+    Print Results as Table Rows, or the Table Header if no results were provided.
+    """
+    if not results:
+        columns = ['mode', 'block', 'compression', 'workers', 'latency', 'MiB/s', 'elapsed', 'cpu', 'peak RSS MiB']
+        print(' '.join(f'{column:>12}' for column in columns), file=file)
+    for result in results or []:
+        row = [
+            result['mode'], f"{result['block_size'] // 1024}K", result['compression'], result['workers'],
+            f"{result['latency'] * 1000:.0f}ms", f"{result['throughput'] / MiB:.1f}", f"{result['elapsed']:.3f}",
+            f"{result['cpu']:.3f}", f"{result['peak_rss'] / MiB:.1f}" if result['peak_rss'] else '-'
+        ]
+        print(' '.join(f'{value:>12}' for value in row), file=file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark CTERA Direct I/O against a local object store stand-in.')
+    parser.add_argument('--size', type=float, default=64, help='File size, in MiB (default: 64)')
+    parser.add_argument('--block-sizes', type=float, nargs='+', default=[1, 4], help='Block sizes, in MiB (default: 1 4)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[4, 20], help='Max concurrent block downloads (default: 4 20)')
+    parser.add_argument('--latency', type=float, nargs='+', default=[0, 0.02], help='Injected latency, in seconds (default: 0 0.02)')
+    parser.add_argument('--compression', nargs='+', default=[Compression.Snappy],
+                        choices=[Compression.Snappy, Compression.Framed, Compression.Gzip], help='Block compression (default: snappy)')
+    parser.add_argument('--modes', nargs='+', default=[Mode.Blocks, Mode.Streamer, Mode.CLI],
+                        choices=[Mode.Blocks, Mode.Streamer, Mode.CLI], help='Benchmark modes (default: all)')
+    parser.add_argument('--in-process', action='store_true', help='Run downloads in the current process')
+    parser.add_argument('--json', help='Write results to a JSON file')
+    args = parser.parse_args(argv)
+
+    results = []
+    report()
+    for scenario in scenarios(args.modes, int(args.size * MiB), [int(block_size * MiB) for block_size in args.block_sizes],
+                              args.workers, args.latency, args.compression):
+        results.append(run_scenario(scenario, args.in_process))
+        report(results[-1:])
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return results
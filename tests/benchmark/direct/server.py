@@ -0,0 +1,228 @@
+import os
+import gzip
+import base64
+import asyncio
+import threading
+
+import snappy
+from aiohttp import web
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+
+class Compression:
+    """
+    Block Compression
+
+    :ivar str Snappy: Raw snappy
+    :ivar str Framed: Snappy, with a magic header and length-prefixed frames
+    :ivar str Gzip: Gzip
+    """
+    Snappy = 'snappy'
+    Framed = 'framed'
+    Gzip = 'gzip'
+
+
+def compress(data, compression, frame_size=64 * 1024):
+    """
+    Compress a Block Using the Direct IO Block Format.
+
+    :param bytes data: Data.
+    :param str compression: Compression, see ``Compression``.
+    :param int, optional frame_size: Frame size of framed snappy blocks, defaults to 64 KiB.
+    :rtype: bytes
+    """
+    if compression == Compression.Gzip:
+        return gzip.compress(data, compresslevel=1)
+    if compression == Compression.Framed:
+        compressed = bytearray(b'\x82SNAPPY\x00' + b'\x00' * 8)
+        for i in range(0, len(data), frame_size):
+            frame = snappy.compress(data[i:i + frame_size])
+            compressed.extend(len(frame).to_bytes(4, byteorder='big') + frame)
+        return bytes(compressed)
+    return snappy.compress(data)
+
+
+def encrypt(data, encryption_key):
+    """
+    Encrypt a Block Using the Direct IO Block Format.
+
+    :param bytes data: Compressed block.
+    :param bytes encryption_key: Encryption key.
+    :rtype: bytes
+    """
+    initialization_vector = os.urandom(16)
+    padder = padding.PKCS7(algorithms.AES.block_size).padder()
+    padded = padder.update(data) + padder.finalize()
+    encryptor = Cipher(algorithms.AES(encryption_key), modes.CBC(initialization_vector)).encryptor()
+    return b'\x00' + initialization_vector + encryptor.update(padded) + encryptor.finalize()
+
+
+def wrap_key(encryption_key, secret_access_key):
+    """
+    Wrap an Encryption Key with a Secret Access Key.
+
+    :param bytes encryption_key: Encryption key.
+    :param str secret_access_key: Base64 encoded secret access key.
+    :returns: Base64 encoded wrapped key.
+    :rtype: str
+    """
+    secret = base64.b64decode(secret_access_key)
+    secret = secret[:32] + b'\0' * (32 - len(secret))
+    padder = padding.PKCS7(algorithms.AES.block_size).padder()
+    padded = padder.update(b'"' + base64.b64encode(encryption_key) + b'"') + padder.finalize()
+    encryptor = Cipher(algorithms.AES(secret), modes.ECB()).encryptor()
+    return base64.b64encode(encryptor.update(padded) + encryptor.finalize()).decode('utf-8')
+
+
+class File:
+    """
+    File Served by the Object Store Stand-In.
+
+    :ivar int file_id: File ID
+    :ivar bytes data: Plaintext
+    :ivar list[bytes] objects: Compressed and encrypted blocks
+    """
+
+    def __init__(self, file_id, size, block_size, compression, encryption_key):
+        """
+        Initialize a File of Random Data.
+
+        Half of each block is random, and half is zero-filled, so that blocks are compressible.
+
+        :param int file_id: File ID.
+        :param int size: File size, in bytes.
+        :param int block_size: Block size, in bytes.
+        :param str compression: Compression, see ``Compression``.
+        :param bytes encryption_key: Encryption key.
+        """
+        self.file_id = file_id
+        self.compression = compression
+        blocks = []
+        for offset in range(0, size, block_size):
+            length = min(block_size, size - offset)
+            blocks.append(os.urandom(length // 2) + b'\x00' * (length - length // 2))
+        self.data = b''.join(blocks)
+        self.lengths = [len(block) for block in blocks]
+        self.objects = [encrypt(compress(block, compression), encryption_key) for block in blocks]
+
+
+class ObjectStore:
+    """
+    Local Stand-In for the Direct IO API and the Object Store.
+
+    Serves a chunk listing at ``/directio/{file_id}``, and encrypted, compressed blocks at ``/objects/{file_id}/{number}``,
+    with an optional injected latency per block request. Blocks uploaded to ``/objects/{file_id}/{number}`` are stored
+    in ``uploads``, and served on subsequent requests.
+    """
+
+    def __init__(self, secret_access_key, latency=0.0):
+        """
+        Initialize an Object Store Stand-In.
+
+        :param str secret_access_key: Base64 encoded secret access key, used to wrap encryption keys.
+        :param float, optional latency: Latency injected to each block request, in seconds.
+        """
+        self.secret_access_key = secret_access_key
+        self.encryption_key = os.urandom(32)
+        self.latency = latency
+        self.files = {}
+        self.uploads = {}
+        self.requests = 0
+        self._runner = None
+        self._loop = None
+        self._thread = None
+        self.port = None
+
+    def add(self, file_id, size, block_size, compression=Compression.Snappy):
+        """
+        Add a File.
+
+        :param int file_id: File ID.
+        :param int size: File size, in bytes.
+        :param int block_size: Block size, in bytes.
+        :param str, optional compression: Compression, defaults to raw snappy.
+        :rtype: File
+        """
+        self.files[file_id] = File(file_id, size, block_size, compression, self.encryption_key)
+        return self.files[file_id]
+
+    @property
+    def baseurl(self):
+        return f'http://127.0.0.1:{self.port}'
+
+    def url(self, file_id, number):
+        """
+        URL of a Block.
+
+        :param int file_id: File ID.
+        :param int number: Block number, starting at 0.
+        :rtype: str
+        """
+        return f'{self.baseurl}/objects/{file_id}/{number}'
+
+    async def _listing(self, request):
+        file = self.files.get(int(request.match_info['file_id']))
+        if file is None:
+            raise web.HTTPBadRequest()
+        return web.json_response({
+            'encrypt_info': {'data_encrypted': True, 'wrapped_key': wrap_key(self.encryption_key, self.secret_access_key)},
+            'compression_type': 'GZIP' if file.compression == Compression.Gzip else 'SNAPPY',
+            'chunks': [
+                {'url': self.url(file.file_id, number), 'len': length}
+                for number, length in enumerate(file.lengths)
+            ]
+        })
+
+    async def _object(self, request):
+        self.requests = self.requests + 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        file_id, number = int(request.match_info['file_id']), int(request.match_info['number'])
+        if (file_id, number) in self.uploads:
+            return web.Response(body=self.uploads[(file_id, number)], content_type='application/octet-stream')
+        return web.Response(body=self.files[file_id].objects[number], content_type='application/octet-stream')
+
+    async def _upload(self, request):
+        self.requests = self.requests + 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.uploads[(int(request.match_info['file_id']), int(request.match_info['number']))] = await request.read()
+        return web.Response()
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_get('/directio/{file_id}', self._listing)
+        app.router.add_get('/objects/{file_id}/{number}', self._object)
+        app.router.add_put('/objects/{file_id}/{number}', self._upload)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def start(self):
+        """
+        Start Serving on the Running Event Loop.
+        """
+        await self._start()
+        return self
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+    def start_in_thread(self):
+        """
+        Start Serving on an Event Loop of a Background Thread.
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+        return self
+
+    def stop_thread(self):
+        asyncio.run_coroutine_threadsafe(self.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
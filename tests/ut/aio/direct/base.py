@@ -1,4 +1,9 @@
+import os
 from unittest import mock
+import munch
+import snappy
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cterasdk import ctera_direct
 from .. import base
 
@@ -11,3 +16,40 @@ class BaseAsyncDirect(base.BaseAsyncTest):
         self._direct._api.get = mock.AsyncMock()  # pylint: disable=protected-access
         self._direct._client.get = mock.AsyncMock()  # pylint: disable=protected-access
         self._authorization_header = {'Authorization': f'Bearer {access}'}
+        self.addCleanup(self._direct._executor.shutdown)  # pylint: disable=protected-access
+
+    @staticmethod
+    def _create_encrypted_object(data, encryption_key):
+        """Compress and encrypt data using the Direct IO block format."""
+        initialization_vector = os.urandom(16)
+        padder = padding.PKCS7(algorithms.AES.block_size).padder()
+        compressed = padder.update(snappy.compress(data)) + padder.finalize()
+        encryptor = Cipher(algorithms.AES(encryption_key), modes.CBC(initialization_vector)).encryptor()
+        return b'\x00' + initialization_vector + encryptor.update(compressed) + encryptor.finalize()
+
+    @staticmethod
+    def _create_metadata(file_id, blocks, encryption_key, baseurl='https://s3.amazonaws.com'):
+        """Create Direct IO file metadata for a list of plaintext blocks, keyed by signed URL."""
+        server_object = munch.Munch({
+            'encrypt_info': munch.Munch({'data_encrypted': True, 'wrapped_key': None}),
+            'compression_type': ctera_direct.types.CompressionLib.Snappy,
+            'chunks': [munch.Munch({'url': f'{baseurl}/{i}', 'len': len(block)}) for i, block in enumerate(blocks)]
+        })
+        metadata = ctera_direct.types.Metadata(file_id, server_object)
+        metadata.encryption_key = encryption_key
+        return metadata
+
+    def _serve_objects(self, blocks, encryption_key, baseurl='https://s3.amazonaws.com'):
+        """Serve encrypted objects from the mocked storage client."""
+        objects = {f'{baseurl}/{i}': self._create_encrypted_object(block, encryption_key) for i, block in enumerate(blocks)}
+
+        async def get(url):
+            async def read():
+                return objects[url]
+
+            async def a_iter_content(chunk_size):
+                for i in range(0, len(objects[url]), chunk_size):
+                    yield objects[url][i:i + chunk_size]
+            return munch.Munch({'read': read, 'a_iter_content': a_iter_content})
+
+        self._direct._client.get.side_effect = get  # pylint: disable=protected-access
@@ -0,0 +1,17 @@
+import unittest
+from ....benchmark.direct import harness, decompressor
+from ....benchmark.direct.server import Compression
+
+
+class TestDirectBenchmark(unittest.TestCase):
+
+    def test_benchmark_harness(self):
+        for scenario in harness.scenarios([harness.Mode.Blocks, harness.Mode.Streamer, harness.Mode.CLI], 100 * 1024, [32 * 1024],
+                                          [4], [0], [Compression.Snappy, Compression.Framed, Compression.Gzip]):
+            result = harness.run_scenario(scenario, in_process=True)
+            self.assertEqual(result['bytes'], 100 * 1024)
+            self.assertEqual(result['requests'], 4)
+
+    def test_decompressor_benchmark(self):
+        results = decompressor.run(256 * 1024, 1)
+        self.assertEqual(len(results), len(decompressor.cases(b'')))
@@ -0,0 +1,71 @@
+import time
+from unittest import mock
+import munch
+from freezegun import freeze_time
+from cterasdk import ctera_direct
+from cterasdk.direct.cache import MetadataCache, signed_url_expiry
+from . import base
+
+
+class TestDirectMetadataCache(base.BaseAsyncDirect):
+
+    def setUp(self):  # pylint: disable=arguments-differ
+        super().setUp()
+        self._file_id = 12345
+
+    def test_signed_url_expiry(self):
+        with freeze_time('2026-01-01T00:00:00Z'):
+            now = time.time()
+        urls = [
+            ('https://bucket.s3.amazonaws.com/x?X-Amz-Date=20260101T000000Z&X-Amz-Expires=3600&X-Amz-Signature=x', now + 3600),
+            ('https://storage.googleapis.com/x?X-Goog-Date=20260101T000000Z&X-Goog-Expires=60', now + 60),
+            (f'https://bucket.s3.amazonaws.com/x?AWSAccessKeyId=x&Expires={int(now) + 10}&Signature=x', now + 10),
+            ('https://account.blob.core.windows.net/x?sv=2020-08-04&se=2026-01-01T00:01:00Z&sig=x', now + 60),
+            ('https://account.blob.core.windows.net/x?sv=2020-08-04&se=2026-01-01T00:02:00&sig=x', now + 120),
+            ('https://storage.local/x', None)
+        ]
+        for url, expiry in urls:
+            self.assertEqual(signed_url_expiry(url), expiry)
+
+    def test_ttl_derived_from_signed_url(self):
+        cache = MetadataCache(10, 300, 30)
+        with freeze_time('2026-01-01T00:00:00Z'):
+            self.assertEqual(cache.ttl(self._create_signed_metadata(self._file_id, 120)), 90)
+            self.assertEqual(cache.ttl(self._create_signed_metadata(self._file_id, 3600)), 300)
+            self.assertEqual(cache.ttl(self._create_signed_metadata(self._file_id, 10)), 0)
+
+    @freeze_time('2026-01-01T00:00:00Z')
+    def test_lru_eviction(self):
+        cache = MetadataCache(2, 300)
+        for file_id in [1, 2]:
+            cache.put(self._create_signed_metadata(file_id, 3600))
+        self.assertIsNotNone(cache.get(1))
+        cache.put(self._create_signed_metadata(3, 3600))
+        self.assertIsNone(cache.get(2))
+        self.assertIsNotNone(cache.get(1))
+        self.assertIsNotNone(cache.get(3))
+        self.assertEqual(len(cache), 2)
+
+    async def test_metadata_cached_until_expiry(self):
+        with freeze_time('2026-01-01T00:00:00Z'):
+            self._direct._api.get.return_value = self._create_server_object(120)  # pylint: disable=protected-access
+            with mock.patch('time.monotonic', return_value=0):
+                await self._direct.metadata(self._file_id)
+                await self._direct.metadata(self._file_id)
+            self._direct._api.get.assert_called_once()  # pylint: disable=protected-access
+            with mock.patch('time.monotonic', return_value=91):
+                await self._direct.metadata(self._file_id)
+            self.assertEqual(self._direct._api.get.call_count, 2)  # pylint: disable=protected-access
+        self.assertEqual(self._direct.cache.hits, 1)
+
+    def _create_signed_metadata(self, file_id, expires):
+        return ctera_direct.types.Metadata(file_id, self._create_server_object(expires))
+
+    @staticmethod
+    def _create_server_object(expires):
+        url = f'https://bucket.s3.amazonaws.com/x?X-Amz-Date=20260101T000000Z&X-Amz-Expires={expires}'
+        return munch.Munch({
+            'encrypt_info': munch.Munch({'data_encrypted': False, 'wrapped_key': None}),
+            'compression_type': ctera_direct.types.CompressionLib.Snappy,
+            'chunks': [munch.Munch({'url': url, 'len': 1024})]
+        })
@@ -0,0 +1,122 @@
+import os
+import asyncio
+from unittest import mock
+import cterasdk.settings
+from cterasdk import exceptions, ctera_direct
+from cterasdk.direct.concurrency import AdaptiveLimit, AdaptiveConcurrency, MiB
+from . import base
+
+
+sleep = asyncio.sleep
+
+
+class TestDirectAdaptiveConcurrency(base.BaseAsyncDirect):
+
+    def setUp(self):  # pylint: disable=arguments-differ
+        super().setUp()
+        self._chunk = ctera_direct.types.Chunk(1, 0, 'https://s3.amazonaws.com/1', MiB)
+
+    @mock.patch('cterasdk.direct.concurrency.time.monotonic', return_value=100)
+    def test_additive_increase(self, _):
+        limit = AdaptiveLimit(4, maximum=5)
+        for _ in range(5):
+            limit.on_success(99, MiB)
+        self.assertEqual(int(limit.limit), 5)
+        for _ in range(10):
+            limit.on_success(99, MiB)
+        self.assertEqual(limit.limit, 5)
+        self.assertEqual(limit.to_dict()['successes'], 15)
+        self.assertEqual(limit.to_dict()['increases'], 1)
+
+    @mock.patch('cterasdk.direct.concurrency.time.monotonic', return_value=100)
+    def test_multiplicative_decrease_on_timeout(self, monotonic):
+        limit = AdaptiveLimit(16, minimum=2)
+        for expected in [8, 4, 2, 2]:
+            monotonic.return_value = monotonic.return_value + 1
+            limit.on_timeout(monotonic.return_value)
+            self.assertEqual(int(limit.limit), expected)
+        self.assertEqual(limit.timeouts, 4)
+        self.assertEqual(limit.decreases, 3)
+
+    @mock.patch('cterasdk.direct.concurrency.time.monotonic', return_value=100)
+    def test_decrease_once_per_congestion_event(self, monotonic):
+        limit = AdaptiveLimit(16)
+        monotonic.return_value = 101
+        limit.on_timeout(100.5)
+        limit.on_timeout(100)
+        limit.on_error(100.5)
+        self.assertEqual(int(limit.limit), 8)
+        self.assertEqual(limit.to_dict()['errors'], 1)
+
+    @mock.patch('cterasdk.direct.concurrency.time.monotonic', return_value=100)
+    def test_decrease_on_latency(self, monotonic):
+        limit = AdaptiveLimit(16, tolerance=2.0, smoothing=1.0)
+        monotonic.return_value = 102
+        limit.on_success(101, MiB)
+        limit.on_success(100, 2 * MiB)
+        self.assertEqual(int(limit.limit), 16)
+        monotonic.return_value = 110
+        limit.on_success(105, MiB)
+        self.assertEqual(int(limit.limit), 8)
+        self.assertEqual(limit.min_latency, 1)
+        self.assertEqual(limit.decreases, 1)
+
+    async def test_limit_in_flight(self):
+        concurrency, in_flight, peak = AdaptiveConcurrency(3, maximum=3), [0], [0]
+
+        async def request():
+            async with concurrency.acquire(self._chunk):
+                in_flight[0] = in_flight[0] + 1
+                peak[0] = max(peak[0], in_flight[0])
+                await sleep(0.01)
+                in_flight[0] = in_flight[0] - 1
+
+        await asyncio.gather(*[request() for _ in range(10)])
+        self.assertEqual(peak[0], 3)
+        metrics = concurrency.to_dict()['s3.amazonaws.com']
+        self.assertEqual(metrics['successes'], 10)
+        self.assertEqual(metrics['in_flight'], 0)
+        self.assertEqual(metrics['bytes'], 10 * MiB)
+
+    async def test_bounded(self):
+        concurrency = AdaptiveConcurrency(8, maximum=8)
+        bounded, in_flight, peak = concurrency.bounded(2), [0], [0]
+
+        async def request():
+            async with bounded.acquire(self._chunk):
+                in_flight[0] = in_flight[0] + 1
+                peak[0] = max(peak[0], in_flight[0])
+                await sleep(0.01)
+                in_flight[0] = in_flight[0] - 1
+
+        await asyncio.gather(*[request() for _ in range(6)])
+        self.assertEqual(peak[0], 2)
+        self.assertEqual(concurrency.to_dict()['s3.amazonaws.com']['successes'], 6)
+
+    async def test_record_timeout_per_host(self):
+        concurrency = AdaptiveConcurrency(8)
+        with self.assertRaises(exceptions.direct.DownloadTimeout):
+            async with concurrency.acquire(self._chunk):
+                raise exceptions.direct.DownloadTimeout(1, self._chunk)
+        other = ctera_direct.types.Chunk(1, 0, 'https://storage.local/1', MiB)
+        async with concurrency.acquire(other):
+            pass
+        metrics = concurrency.to_dict()
+        self.assertEqual(metrics['s3.amazonaws.com']['limit'], 4)
+        self.assertEqual(metrics['s3.amazonaws.com']['timeouts'], 1)
+        self.assertEqual(metrics['storage.local']['limit'], 8)
+
+    async def test_direct_io_adaptive_concurrency(self):
+        settings = cterasdk.settings.io.direct.concurrency.model_copy()
+        self.addCleanup(setattr, cterasdk.settings.io.direct, 'concurrency', settings)
+        cterasdk.settings.io.direct.concurrency.enabled = True
+        direct = ctera_direct.client.DirectIO('')
+        self.addCleanup(direct._executor.shutdown)  # pylint: disable=protected-access
+        encryption_key = os.urandom(32)
+        blocks = [os.urandom(1024) for _ in range(5)]
+        metadata = self._create_metadata(1, blocks, encryption_key)
+        direct._client = self._direct._client  # pylint: disable=protected-access
+        self._serve_objects(blocks, encryption_key)
+        futures = await direct.executor(metadata, max_workers=2)()
+        self.assertEqual(b''.join([bytes((await future).data) for future in futures]), b''.join(blocks))
+        self.assertEqual(direct.concurrency.to_dict()['s3.amazonaws.com']['successes'], 5)
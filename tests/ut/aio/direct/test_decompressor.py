@@ -0,0 +1,119 @@
+import os
+import gzip
+import unittest
+from unittest import mock
+import snappy
+from cterasdk.direct import decompressor
+from cterasdk.direct.crypto import decrypt_block, BlockDecryptor
+from cterasdk.exceptions.direct import DirectIOError
+from . import base
+
+
+class TestDirectDecompressor(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self._frames = [os.urandom(1024), b'a' * 4096, os.urandom(10)]
+        self._data = b''.join(self._frames)
+
+    def test_decompress_snappy(self):
+        self.assertEqual(bytes(decompressor.decompress(snappy.compress(self._data))), self._data)
+
+    def test_decompress_snappy_into_preallocated_buffer(self):
+        output = memoryview(bytearray(len(self._data) + 10))
+        decompressed = decompressor.decompress(snappy.compress(self._data), output=output[5:5 + len(self._data)])
+        self.assertEqual(bytes(decompressed), self._data)
+        self.assertEqual(bytes(output[5:5 + len(self._data)]), self._data)
+        self.assertIs(decompressed.obj, output.obj)
+
+    def test_decompress_gzip(self):
+        self.assertEqual(bytes(decompressor.decompress(gzip.compress(self._data), len(self._data))), self._data)
+
+    def test_decompress_framed_snappy(self):
+        compressed = self._create_framed_snappy(self._frames)
+        self.assertEqual(bytes(decompressor.decompress(compressed)), self._data)
+        self.assertEqual(bytes(decompressor.decompress(compressed, len(self._data))), self._data)
+
+    def test_decompress_framed_snappy_without_cramjam(self):
+        with mock.patch('cterasdk.direct.decompressor.cramjam', None):
+            compressed = self._create_framed_snappy(self._frames)
+            self.assertEqual(bytes(decompressor.decompress(compressed, len(self._data))), self._data)
+
+    def test_decompress_framed_snappy_into_preallocated_buffer(self):
+        output = memoryview(bytearray(len(self._data) + 10))
+        for module in [decompressor.cramjam, None]:
+            with mock.patch('cterasdk.direct.decompressor.cramjam', module):
+                decompressed = decompressor.decompress_with_magic_header(self._create_framed_snappy(self._frames), output)
+                self.assertEqual(bytes(decompressed), self._data)
+                self.assertIs(decompressed.obj, output.obj)
+
+    def test_frame_spans(self):
+        compressed = memoryview(self._create_framed_snappy(self._frames))
+        spans = decompressor.frame_spans(compressed)
+        self.assertEqual([snappy.uncompress(compressed[start:end]) for start, end in spans], self._frames)
+        self.assertEqual(decompressor.frame_spans(compressed[:-1]), spans[:-1])
+
+    def test_decompress_exceeds_buffer(self):
+        with self.assertRaises(DirectIOError):
+            decompressor.decompress(self._create_framed_snappy(self._frames), len(self._data) - 1)
+
+    def test_decompress_error(self):
+        with self.assertRaises(DirectIOError):
+            decompressor.decompress(b'\x00\x01\x02')
+
+    def test_decrypt_block(self):
+        encryption_key = os.urandom(32)
+        encrypted_object = base.BaseAsyncDirect._create_encrypted_object(self._data, encryption_key)  # pylint: disable=protected-access
+        decrypted_object = decrypt_block(encrypted_object, encryption_key)
+        self.assertIsInstance(decrypted_object, memoryview)
+        self.assertEqual(bytes(decompressor.decompress(decrypted_object)), self._data)
+
+    def test_stream_decompress(self):
+        for compressed in [
+            self._create_framed_snappy(self._frames), gzip.compress(self._data), snappy.compress(self._data),
+            gzip.compress(self._data[:2000]) + gzip.compress(self._data[2000:])  # Concatenated gzip members
+        ]:
+            for length, output in [(None, None), (len(self._data), None), (None, memoryview(bytearray(len(self._data))))]:
+                stream = decompressor.StreamDecompressor(length, output)
+                for piece in self._split(compressed, 7):
+                    stream.update(piece)
+                decompressed = stream.finalize()
+                self.assertEqual(bytes(decompressed), self._data)
+                if output is not None:
+                    self.assertIs(decompressed.obj, output.obj)
+
+    def test_stream_decompress_error(self):
+        stream = decompressor.StreamDecompressor()
+        with self.assertRaises(DirectIOError):
+            stream.update(b'\x1f\x8b' + b'\x00' * 16)
+        stream = decompressor.StreamDecompressor()
+        stream.update(b'\x00\x01\x02')
+        with self.assertRaises(DirectIOError):
+            stream.finalize()
+
+    def test_stream_decrypt(self):
+        encryption_key = os.urandom(32)
+        encrypted_object = base.BaseAsyncDirect._create_encrypted_object(self._data, encryption_key)  # pylint: disable=protected-access
+        for size in [1, 16, 1000]:
+            decryptor = BlockDecryptor(encryption_key)
+            decrypted_object = b''.join(decryptor.update(piece) for piece in self._split(encrypted_object, size)) + decryptor.finalize()
+            self.assertEqual(snappy.uncompress(decrypted_object), self._data)
+
+    def test_stream_decrypt_error(self):
+        decryptor = BlockDecryptor(os.urandom(32))
+        decryptor.update(os.urandom(20))
+        with self.assertRaises(DirectIOError):
+            decryptor.finalize()
+
+    @staticmethod
+    def _split(data, size):
+        return [data[i:i + size] for i in range(0, len(data), size)]
+
+    @staticmethod
+    def _create_framed_snappy(frames):
+        compressed = bytearray(b'\x82SNAPPY\x00' + b'\x00' * 8)
+        for frame in frames:
+            frame = snappy.compress(frame)
+            compressed.extend(len(frame).to_bytes(4, byteorder='big'))
+            compressed.extend(frame)
+        return bytes(compressed)
@@ -0,0 +1,221 @@
+import os
+import asyncio
+import shutil
+import tempfile
+import threading
+from unittest import mock
+import aiohttp
+import munch
+from cterasdk import exceptions
+import cterasdk.settings
+from cterasdk.direct.hedging import Hedging
+from cterasdk.direct.decompressor import StreamDecompressor
+from cterasdk.direct.crypto import BlockDecryptor
+from cterasdk.direct.writer import FileWriter
+from cterasdk.direct.telemetry import Stage
+from . import base
+
+
+sleep = asyncio.sleep
+
+
+class TestDirectDownload(base.BaseAsyncDirect):
+
+    def setUp(self):  # pylint: disable=arguments-differ
+        super().setUp()
+        self._file_id = 12345
+        self._encryption_key = os.urandom(32)
+        self._blocks = [os.urandom(1024) for _ in range(10)]
+        self._metadata = self._create_metadata(self._file_id, self._blocks, self._encryption_key)
+        self._direct._chunks = mock.AsyncMock(return_value=self._metadata)  # pylint: disable=protected-access
+        self._serve_objects(self._blocks, self._encryption_key)
+        self._directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self._directory)
+        self._path = os.path.join(self._directory, 'file.bin')
+        self._settings = cterasdk.settings.io.direct.writer.model_copy()
+        self.addCleanup(setattr, cterasdk.settings.io.direct, 'writer', self._settings)
+
+    async def test_download(self):
+        self.assertEqual(await self._direct.download(self._file_id, self._path, max_workers=3), self._path)
+        self._assert_file_content()
+
+    async def test_download_slow_disk(self):
+        get, write = self._direct._client.get.side_effect, FileWriter.write  # pylint: disable=protected-access
+        fetched, written, in_flight, tasks = [0], [0], [], []
+
+        async def fetch(url):
+            fetched[0] = fetched[0] + 1
+            in_flight.append(fetched[0] - written[0])
+            tasks.append(len(asyncio.all_tasks()))
+            return await get(url)
+
+        async def slow_write(writer, offset, data):
+            await sleep(0.01)
+            await write(writer, offset, data)
+            written[0] = written[0] + 1
+
+        self._direct._client.get.side_effect = fetch  # pylint: disable=protected-access
+        with mock.patch.object(FileWriter, 'write', autospec=True, side_effect=slow_write):
+            await self._direct.download(self._file_id, self._path, max_workers=4, max_bytes=2 * 1024)
+        self._assert_file_content()
+        self.assertLessEqual(max(in_flight), 2)
+        self.assertLessEqual(max(tasks), 1 + 4)
+
+    async def test_download_mmap(self):
+        cterasdk.settings.io.direct.writer.mmap = True
+        cterasdk.settings.io.direct.writer.fsync_interval = 2048
+        await self._direct.download(self._file_id, self._path)
+        self._assert_file_content()
+
+    async def test_download_incremental(self):
+        self._direct._chunk_size = 100  # pylint: disable=protected-access
+        await self._direct.download(self._file_id, self._path, max_workers=3)
+        self._assert_file_content()
+        self.assertEqual(self._direct.timings.to_dict()['decrypt']['count'], len(self._blocks))
+
+    async def test_download_incremental_off_event_loop(self):
+        self._direct._chunk_size = 100  # pylint: disable=protected-access
+        threads, update = set(), StreamDecompressor.update
+
+        def record_thread(decompressor, data):
+            threads.add(threading.get_ident())
+            return update(decompressor, data)
+
+        with mock.patch.object(StreamDecompressor, 'update', autospec=True, side_effect=record_thread):
+            await self._direct.download(self._file_id, self._path)
+        self._assert_file_content()
+        self.assertNotIn(threading.get_ident(), threads)
+
+    async def test_download_incremental_payload_error(self):
+        self._direct._chunk_size = 100  # pylint: disable=protected-access
+
+        async def get(url):  # pylint: disable=unused-argument
+            async def a_iter_content(chunk_size):  # pylint: disable=unused-argument
+                yield b'\x00'
+                raise aiohttp.ClientPayloadError('Response payload is not completed')
+            return munch.Munch({'a_iter_content': a_iter_content})
+
+        self._direct._client.get.side_effect = get  # pylint: disable=protected-access
+        with mock.patch('asyncio.sleep'):
+            with self.assertRaises(exceptions.direct.DownloadError):
+                await self._direct.download(self._file_id, self._path)
+
+    async def test_download_incremental_hedged(self):
+        self._direct._chunk_size = 100  # pylint: disable=protected-access
+        self._direct._hedging = Hedging(min_samples=1, max_ratio=1, min_delay=0)  # pylint: disable=protected-access
+        self._direct._hedging.record(0)  # pylint: disable=protected-access
+        get = self._direct._client.get.side_effect  # pylint: disable=protected-access
+
+        async def interleaved(url):
+            response = await get(url)
+            content = response.a_iter_content
+
+            async def a_iter_content(chunk_size):
+                async for data in content(chunk_size):
+                    await sleep(0)
+                    yield data
+            response.a_iter_content = a_iter_content
+            return response
+
+        self._direct._client.get.side_effect = interleaved  # pylint: disable=protected-access
+        await self._direct.download(self._file_id, self._path, max_workers=3)
+        self._assert_file_content()
+        self.assertGreater(self._direct.hedging.hedged, 0)
+        size = sum(len(self._create_encrypted_object(block, self._encryption_key)) for block in self._blocks)
+        self.assertEqual(self._direct.timings[Stage.Download].bytes, size)  # Duplicate requests are not counted
+
+    async def test_download_incremental_decompress_error(self):
+        self._direct._chunk_size = 100  # pylint: disable=protected-access
+        with mock.patch('asyncio.sleep'), mock.patch.object(StreamDecompressor, 'finalize', side_effect=exceptions.direct.DirectIOError()):
+            with self.assertRaises(exceptions.direct.DecompressBlockError):
+                await self._direct.download(self._file_id, self._path)
+        self.assertEqual(self._direct.timings[Stage.Download].retries, 0)
+
+    async def test_download_incremental_decrypt_error(self):
+        self._direct._chunk_size = 100  # pylint: disable=protected-access
+        with mock.patch('asyncio.sleep'), mock.patch.object(BlockDecryptor, 'finalize', side_effect=exceptions.direct.DirectIOError()):
+            with self.assertRaises(exceptions.direct.DecryptBlockError):
+                await self._direct.download(self._file_id, self._path)
+        self.assertEqual(self._direct.timings[Stage.Download].retries, 0)
+
+    async def test_download_failure_removes_temporary_file(self):
+        get = self._direct._client.get.side_effect  # pylint: disable=protected-access
+
+        async def fail_last_block(url):
+            if url.endswith('/9'):
+                raise ConnectionError()
+            return await get(url)
+
+        self._direct._client.get.side_effect = fail_last_block  # pylint: disable=protected-access
+        with mock.patch('asyncio.sleep'):
+            with self.assertRaises(exceptions.direct.DownloadConnectionError):
+                await self._direct.download(self._file_id, self._path)
+        self.assertEqual(os.listdir(self._directory), [])
+
+    async def test_resume_download(self):
+        get = self._direct._client.get.side_effect  # pylint: disable=protected-access
+
+        async def fail_last_block(url):
+            if url.endswith('/9'):
+                await sleep(0.05)
+                raise ConnectionError()
+            return await get(url)
+
+        self._direct._client.get.side_effect = fail_last_block  # pylint: disable=protected-access
+        with mock.patch('asyncio.sleep'):
+            with self.assertRaises(exceptions.direct.DownloadConnectionError):
+                await self._direct.download(self._file_id, self._path, resume=True)
+        self.assertEqual(sorted(os.listdir(self._directory)), ['file.bin.journal', 'file.bin.part'])
+
+        self._direct._client.get.reset_mock()  # pylint: disable=protected-access
+        self._direct._client.get.side_effect = get  # pylint: disable=protected-access
+        await self._direct.download(self._file_id, self._path, resume=True)
+        self._direct._client.get.assert_called_once_with('https://s3.amazonaws.com/9')  # pylint: disable=protected-access
+        self._assert_file_content()
+
+    async def test_resume_download_journal_mismatch(self):
+        with open(f'{self._path}.journal', 'w', encoding='utf-8') as f:
+            f.write('{"file_id": 1, "size": 1, "blocks": 1}\n1 0 1024\n')
+        with open(f'{self._path}.part', 'wb') as f:
+            f.write(b'\x00' * 1024)
+        await self._direct.download(self._file_id, self._path, resume=True)
+        self.assertEqual(self._direct._client.get.call_count, len(self._blocks))  # pylint: disable=protected-access
+        self._assert_file_content()
+
+    async def test_resume_download_file_modified(self):
+        get = self._direct._client.get.side_effect  # pylint: disable=protected-access
+
+        async def fail_last_block(url):
+            if url.endswith('/9'):
+                await sleep(0.05)
+                raise ConnectionError()
+            return await get(url)
+
+        self._direct._client.get.side_effect = fail_last_block  # pylint: disable=protected-access
+        with mock.patch('asyncio.sleep'):
+            with self.assertRaises(exceptions.direct.DownloadConnectionError):
+                await self._direct.download(self._file_id, self._path, resume=True)
+
+        self._blocks = [os.urandom(1024) for _ in range(10)]
+        baseurl = 'https://s3.amazonaws.com/v2'
+        self._direct._chunks.return_value = self._create_metadata(  # pylint: disable=protected-access
+            self._file_id, self._blocks, self._encryption_key, baseurl
+        )
+        self._direct._client.get.reset_mock()  # pylint: disable=protected-access
+        self._serve_objects(self._blocks, self._encryption_key, baseurl)
+        await self._direct.download(self._file_id, self._path, resume=True)
+        self.assertEqual(self._direct._client.get.call_count, len(self._blocks))  # pylint: disable=protected-access
+        self._assert_file_content()
+
+    async def test_download_discards_longer_temporary_file(self):
+        for resume in [False, True]:
+            with open(f'{self._path}.part', 'wb') as f:
+                f.write(b'\xff' * (sum(len(block) for block in self._blocks) + 4096))
+            await self._direct.download(self._file_id, self._path, resume=resume)
+            self._assert_file_content()
+            os.remove(self._path)
+
+    def _assert_file_content(self):
+        with open(self._path, 'rb') as f:
+            self.assertEqual(f.read(), b''.join(self._blocks))
+        self.assertEqual(os.listdir(self._directory), ['file.bin'])
@@ -0,0 +1,69 @@
+import os
+import shutil
+import asyncio
+import tempfile
+from unittest import mock
+from cterasdk import exceptions
+from cterasdk.direct.scheduler import ByteBudget
+from . import base
+
+
+class TestDirectDownloadMany(base.BaseAsyncDirect):
+
+    def setUp(self):  # pylint: disable=arguments-differ
+        super().setUp()
+        self._encryption_key = os.urandom(32)
+        self._files = {
+            1: [os.urandom(1024) for _ in range(8)],
+            2: [os.urandom(100)],
+            3: [os.urandom(512) for _ in range(3)]
+        }
+        objects, metadata = {}, {}
+        for file_id, blocks in self._files.items():
+            metadata[file_id] = self._create_metadata(file_id, blocks, self._encryption_key, f'https://s3.amazonaws.com/{file_id}')
+            for chunk, block in zip(metadata[file_id].chunks, blocks):
+                objects[chunk.url] = self._create_encrypted_object(block, self._encryption_key)
+
+        async def get(url):
+            async def read():
+                return objects[url]
+            return mock.Mock(read=read)
+
+        async def chunks(file_id):
+            if file_id not in metadata:
+                raise exceptions.direct.ObjectNotFoundError(file_id)
+            return metadata[file_id]
+
+        self._direct._client.get.side_effect = get  # pylint: disable=protected-access
+        self._direct._chunks = chunks  # pylint: disable=protected-access
+        self._directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self._directory)
+
+    async def test_download_many(self):
+        paths = {file_id: os.path.join(self._directory, f'{file_id}.bin') for file_id in self._files}
+        results = await self._direct.download_many(paths, max_workers=2, max_files=2, max_bytes=2048)
+        self.assertEqual(results, paths)
+        for file_id, path in paths.items():
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), b''.join(self._files[file_id]))
+
+    async def test_download_many_partial_failure(self):
+        paths = {file_id: os.path.join(self._directory, f'{file_id}.bin') for file_id in [1, 4]}
+        results = await self._direct.download_many(paths)
+        self.assertEqual(results[1], paths[1])
+        self.assertIsInstance(results[4], exceptions.direct.ObjectNotFoundError)
+        self.assertEqual(os.listdir(self._directory), ['1.bin'])
+
+    async def test_byte_budget(self):
+        budget, in_flight, peak = ByteBudget(1000), [0], [0]
+
+        async def reserve(length):
+            async with budget.reserve(length):
+                in_flight[0] = in_flight[0] + min(length, 1000)
+                peak[0] = max(peak[0], in_flight[0])
+                await asyncio.sleep(0)
+                in_flight[0] = in_flight[0] - min(length, 1000)
+
+        await asyncio.gather(*[reserve(length) for length in [400, 400, 400, 5000, 100]])
+        self.assertLessEqual(peak[0], 1000)
+        self.assertEqual(budget.available, 1000)
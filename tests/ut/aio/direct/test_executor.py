@@ -0,0 +1,50 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from cterasdk import ctera_direct
+from cterasdk.direct.executor import BlockExecutor, ExecutorType
+from cterasdk.direct.telemetry import Stage
+from . import base
+
+
+class TestDirectExecutor(base.BaseAsyncDirect):
+
+    def setUp(self):  # pylint: disable=arguments-differ
+        super().setUp()
+        self._file_id = 12345
+        self._encryption_key = os.urandom(32)
+        self._blocks = [os.urandom(1024) for _ in range(4)]
+        self._metadata = self._create_metadata(self._file_id, self._blocks, self._encryption_key)
+        self._serve_objects(self._blocks, self._encryption_key)
+
+    async def test_thread_executor(self):
+        await self._assert_download(ExecutorType.Thread)
+
+    async def test_process_executor(self):
+        await self._assert_download(ExecutorType.Process)
+
+    async def test_inline_executor(self):
+        await self._assert_download(ExecutorType.Inline)
+
+    async def test_external_executor_not_owned(self):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            await self._assert_download(pool)
+            self.assertEqual(pool.submit(sum, [1, 2]).result(), 3)
+
+    def test_unsupported_executor(self):
+        with self.assertRaises(ValueError):
+            BlockExecutor.create('fiber')
+
+    def test_executor_from_settings(self):
+        self.assertEqual(self._direct._executor.type, ctera_direct.executor.ExecutorType.Thread)  # pylint: disable=protected-access
+
+    async def _assert_download(self, executor):
+        self._direct._executor = BlockExecutor.create(executor)  # pylint: disable=protected-access
+        try:
+            futures = await self._direct.executor(self._metadata)()
+            blocks = sorted([await future for future in futures], key=lambda block: block.offset)
+        finally:
+            self._direct._executor.shutdown()  # pylint: disable=protected-access
+        self.assertEqual(b''.join(bytes(block.data) for block in blocks), b''.join(self._blocks))
+        timings = self._direct.timings.to_dict()
+        for stage in [Stage.Download, Stage.Decrypt, Stage.Decompress]:
+            self.assertEqual(timings[stage]['count'], len(self._blocks))
@@ -0,0 +1,85 @@
+import os
+import asyncio
+import shutil
+import tempfile
+from unittest import mock
+import munch
+from cterasdk import ctera_direct, exceptions
+from . import base
+
+
+class TestDirectSignedURLExpiry(base.BaseAsyncDirect):
+
+    def setUp(self):  # pylint: disable=arguments-differ
+        super().setUp()
+        self._file_id = 12345
+        self._encryption_key = os.urandom(32)
+        self._blocks = [os.urandom(1024) for _ in range(4)]
+        self._objects = [self._create_encrypted_object(block, self._encryption_key) for block in self._blocks]
+        self._signature = 0
+        for target, side_effect in [('get_chunks', self._get_chunks), ('decrypt_encryption_key', lambda *_: self._encryption_key)]:
+            patcher = mock.patch(f'cterasdk.direct.client.{target}', side_effect=side_effect)
+            self.addCleanup(patcher.stop)
+            setattr(self, f'_{target}_mock', patcher.start())
+        self._direct._client.get.side_effect = self._get  # pylint: disable=protected-access
+
+    async def _get_chunks(self, api, bearer, file_id, timings=None):  # pylint: disable=unused-argument
+        self._signature = self._signature + 1
+        return ctera_direct.types.Metadata(file_id, munch.Munch({
+            'encrypt_info': munch.Munch({'data_encrypted': True, 'wrapped_key': 'key'}),
+            'compression_type': ctera_direct.types.CompressionLib.Snappy,
+            'chunks': [
+                munch.Munch({'url': f'https://s3.amazonaws.com/{i}?signature={self._signature}', 'len': len(block)})
+                for i, block in enumerate(self._blocks)
+            ]
+        }))
+
+    async def _get(self, url):
+        path, signature = url.split('?signature=')
+        if int(signature) < 2:
+            raise exceptions.transport.Forbidden(munch.Munch({'request': munch.Munch({'url': url})}))
+        data = self._objects[int(path.rsplit('/', 1)[-1])]
+
+        async def read():
+            return data
+        return munch.Munch({'read': read})
+
+    def _assert_renewed_once(self, expired=None):
+        expired = expired if expired is not None else len(self._blocks)
+        self.assertEqual(self._get_chunks_mock.call_count, 2)
+        self.assertEqual(self._direct._client.get.call_count, len(self._blocks) + expired)  # pylint: disable=protected-access
+
+    async def test_blocks(self):
+        blocks = [await block for block in await self._direct.blocks(self._file_id)]
+        self.assertEqual(b''.join(bytes(block.data) for block in blocks), b''.join(self._blocks))
+        self._assert_renewed_once()
+
+    async def test_streamer(self):
+        streamer = await self._direct.streamer(self._file_id)
+        self.assertEqual(b''.join([bytes(block.data) async for block in streamer.start()]), b''.join(self._blocks))
+        self._assert_renewed_once()
+
+    async def test_open(self):
+        asyncio.get_running_loop.side_effect = asyncio.events.get_running_loop  # Patched by the base test
+        f = await self._direct.open(self._file_id, prefetch=0)
+        self.assertEqual(await f.aread(), b''.join(self._blocks))
+        f.close()
+        self._assert_renewed_once(expired=1)  # Blocks read after the first are fetched using the renewed metadata
+
+    async def test_download(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = await self._direct.download(self._file_id, os.path.join(directory, 'file.bin'))
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), b''.join(self._blocks))
+        self._assert_renewed_once()
+
+    async def test_retried_once(self):
+        self._blocks = self._blocks[:1]
+        self._direct._client.get.side_effect = exceptions.transport.Forbidden(  # pylint: disable=protected-access
+            munch.Munch({'request': munch.Munch({'url': '/'})})
+        )
+        with self.assertRaises(exceptions.direct.SignedURLExpired):
+            await (await self._direct.blocks(self._file_id))[0]
+        self.assertEqual(self._get_chunks_mock.call_count, 2)
+        self.assertEqual(self._direct._client.get.call_count, 2)  # pylint: disable=protected-access
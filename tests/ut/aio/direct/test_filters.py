@@ -0,0 +1,50 @@
+import random
+import unittest
+import munch
+from cterasdk import ctera_direct
+from cterasdk.direct import filters
+
+
+class TestDirectFilters(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        lengths = [random.randint(1, 4096) for _ in range(1000)]
+        self._metadata = ctera_direct.types.Metadata(12345, munch.Munch({
+            'encrypt_info': munch.Munch({'data_encrypted': False, 'wrapped_key': None}),
+            'compression_type': ctera_direct.types.CompressionLib.Snappy,
+            'chunks': [munch.Munch({'url': f'https://s3.amazonaws.com/{i}', 'len': length}) for i, length in enumerate(lengths)]
+        }))
+
+    def test_span(self):
+        for _ in range(200):
+            start = random.randint(0, self._metadata.size - 1)
+            end = random.randint(start, self._metadata.size + 100)
+            self.assertEqual(self._numbers(filters.span(self._metadata, ctera_direct.types.ByteRange(start, end))),
+                             self._expected(start, end))
+
+    def test_span_to_eof(self):
+        start = self._metadata.chunks[10].offset + 1
+        chunks = filters.span(self._metadata, ctera_direct.types.ByteRange(start))
+        self.assertEqual(self._numbers(chunks), list(range(11, 1001)))
+
+    def test_span_chunk_boundaries(self):
+        chunk = self._metadata.chunks[5]
+        byte_range = ctera_direct.types.ByteRange(chunk.offset, chunk.offset + chunk.length - 1)
+        self.assertEqual(self._numbers(filters.span(self._metadata, byte_range)), [chunk.number])
+
+    def test_spans(self):
+        byte_ranges = []
+        for _ in range(100):
+            start = random.randint(0, self._metadata.size - 1)
+            byte_ranges.append(ctera_direct.types.ByteRange(start, random.randint(start, self._metadata.size - 1)))
+        results = filters.spans(self._metadata, byte_ranges)
+        for byte_range, chunks in zip(byte_ranges, results):
+            self.assertEqual(self._numbers(chunks), self._expected(byte_range.start, byte_range.end))
+
+    def _expected(self, start, end):
+        return [chunk.number for chunk in self._metadata.chunks if chunk.offset <= end and start < chunk.offset + chunk.length]
+
+    @staticmethod
+    def _numbers(chunks):
+        return [chunk.number for chunk in chunks]
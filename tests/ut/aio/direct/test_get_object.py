@@ -67,6 +67,16 @@ class BaseDirectMetadata(base.BaseAsyncDirect):
         self.assertEqual(error.exception.filename, self._file_id)
         self.assert_equal_objects(error.exception.block, BaseDirectMetadata._create_block_info(self._file_id, chunk))
 
+    async def test_get_object_forbidden(self):
+        chunk = BaseDirectMetadata._create_chunk()
+        self._direct._client.get.side_effect = exceptions.transport.Forbidden(  # pylint: disable=protected-access
+            BaseDirectMetadata._create_error_object(HTTPStatus.FORBIDDEN.value)
+        )
+        with self.assertRaises(exceptions.direct.SignedURLExpired) as error:
+            await get_object(self._direct._client, self._file_id, chunk)  # pylint: disable=protected-access
+        self.assertEqual(error.exception.errno, errno.EACCES)
+        self._direct._client.get.assert_called_once()  # pylint: disable=protected-access
+
     @staticmethod
     def _create_error_object(status):
         return munch.Munch(
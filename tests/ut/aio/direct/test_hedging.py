@@ -0,0 +1,104 @@
+import asyncio
+import munch
+from cterasdk.direct.hedging import Hedging
+from cterasdk.direct.lib import get_object
+from cterasdk import ctera_direct
+from . import base
+
+
+sleep = asyncio.sleep
+
+
+class TestDirectHedging(base.BaseAsyncDirect):
+
+    def setUp(self):  # pylint: disable=arguments-differ
+        super().setUp()
+        self._file_id = 12345
+        self._cancelled = []
+
+    @staticmethod
+    def _hedging(max_ratio=0.5):
+        hedging = Hedging(percentile=95, min_samples=4, max_ratio=max_ratio, min_delay=0.01)
+        for _ in range(4):
+            hedging.record(0.01)
+        return hedging
+
+    def _factory(self, *responses):
+        responses = list(responses)
+
+        async def request():
+            delay, result = responses.pop(0)
+            try:
+                await sleep(delay)
+            except asyncio.CancelledError:
+                self._cancelled.append(result)
+                raise
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        return request
+
+    def test_delay_percentile(self):
+        hedging = Hedging(percentile=90, min_samples=20, min_delay=0.001)
+        for i in range(19):
+            hedging.record((i + 1) / 100)
+        self.assertIsNone(hedging.delay)
+        hedging.record(0.2)
+        self.assertEqual(hedging.delay, 0.19)
+
+    async def test_no_hedge_without_samples(self):
+        hedging = Hedging(min_samples=4)
+        self.assertEqual(await hedging.run(self._factory((0.05, 'primary'), (0, 'hedge'))), 'primary')
+        self.assertEqual(hedging.to_dict()['hedged'], 0)
+
+    async def test_hedge_slow_request(self):
+        hedging = self._hedging()
+        self.assertEqual(await hedging.run(self._factory((1, 'primary'), (0, 'hedge'))), 'hedge')
+        await sleep(0)
+        self.assertEqual(self._cancelled, ['primary'])
+        metrics = hedging.to_dict()
+        self.assertEqual((metrics['requests'], metrics['hedged'], metrics['wins']), (1, 1, 1))
+
+    async def test_primary_completes_first(self):
+        hedging = self._hedging()
+        self.assertEqual(await hedging.run(self._factory((0.05, 'primary'), (1, 'hedge'))), 'primary')
+        await sleep(0)
+        self.assertEqual(self._cancelled, ['hedge'])
+        self.assertEqual(hedging.wins, 0)
+
+    async def test_hedge_after_primary_failure(self):
+        hedging = self._hedging()
+        self.assertEqual(await hedging.run(self._factory((0.05, ConnectionError()), (0.1, 'hedge'))), 'hedge')
+        with self.assertRaises(ConnectionError):
+            await hedging.run(self._factory((0.05, ConnectionError()), (0.1, ConnectionError())))
+
+    async def test_duplicate_waits_for_slot(self):
+        hedging, semaphore = self._hedging(), asyncio.Semaphore(1)
+        factory = self._factory((0.05, 'primary'), (0, 'hedge'))
+        async with semaphore:  # Held by the primary request
+            self.assertEqual(await hedging.run(factory, lambda: semaphore), 'primary')
+        self.assertEqual((hedging.hedged, hedging.wins), (1, 0))
+        self.assertEqual(await factory(), 'hedge')  # The duplicate request was not issued
+
+    async def test_max_ratio(self):
+        hedging = self._hedging(max_ratio=0)
+        self.assertEqual(await hedging.run(self._factory((0.05, 'primary'), (0, 'hedge'))), 'primary')
+        self.assertEqual(hedging.hedged, 0)
+
+    async def test_get_object_hedged(self):
+        chunk = ctera_direct.types.Chunk(1, 0, 'https://s3.amazonaws.com/1', 4)
+        delays = [1, 0]
+
+        async def get(url):  # pylint: disable=unused-argument
+            delay = delays.pop(0)
+
+            async def read():
+                await sleep(delay)
+                return f'{delay}'.encode()
+            return munch.Munch({'read': read})
+
+        self._direct._client.get.side_effect = get  # pylint: disable=protected-access
+        hedging = self._hedging()
+        self.assertEqual(await get_object(self._direct._client, self._file_id, chunk, hedging), b'0')  # pylint: disable=protected-access
+        self.assertEqual(hedging.wins, 1)
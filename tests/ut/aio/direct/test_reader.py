@@ -0,0 +1,75 @@
+import io
+import os
+import asyncio
+import zipfile
+from unittest import mock
+from . import base
+
+
+class TestDirectReader(base.BaseAsyncDirect):
+
+    def setUp(self):  # pylint: disable=arguments-differ
+        super().setUp()
+        self._file_id = 12345
+        self._encryption_key = os.urandom(32)
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, 'w') as f:
+            f.writestr('a.txt', os.urandom(5000))
+            f.writestr('b.txt', b'CTERA Direct IO')
+        self._content = archive.getvalue()
+        self._blocks = [self._content[i:i + 1024] for i in range(0, len(self._content), 1024)]
+        self._metadata = self._create_metadata(self._file_id, self._blocks, self._encryption_key)
+        self._direct._chunks = mock.AsyncMock(return_value=self._metadata)  # pylint: disable=protected-access
+        self._serve_objects(self._blocks, self._encryption_key)
+        asyncio.get_running_loop.side_effect = asyncio.events.get_running_loop  # Patched by the base test
+
+    async def test_sequential_read_prefetch(self):
+        f = await self._direct.open(self._file_id, cache_size=4, prefetch=2)
+        self.assertEqual(await f.aread(100), self._content[:100])
+        await asyncio.sleep(0)
+        self.assertEqual(self._direct._client.get.call_count, 3)  # pylint: disable=protected-access
+        self.assertEqual(await f.aread(), self._content[100:])
+        self.assertEqual(await f.aread(), b'')
+        f.close()
+
+    async def test_random_access(self):
+        f = await self._direct.open(self._file_id, prefetch=0)
+        f.seek(-100, io.SEEK_END)
+        self.assertEqual(await f.aread(50), self._content[-100:-50])
+        f.seek(1000)
+        self.assertEqual(await f.aread(2000), self._content[1000:3000])
+        self.assertEqual(f.tell(), 3000)
+        call_count = self._direct._client.get.call_count  # pylint: disable=protected-access
+        f.seek(1000)
+        self.assertEqual(await f.aread(10), self._content[1000:1010])
+        self.assertEqual(self._direct._client.get.call_count, call_count)  # pylint: disable=protected-access
+        f.close()
+
+    async def test_blocking_read_from_thread(self):
+        f = await self._direct.open(self._file_id)
+
+        def read_archive():
+            with zipfile.ZipFile(f) as archive:
+                return archive.read('b.txt')
+
+        self.assertEqual(await asyncio.to_thread(read_archive), b'CTERA Direct IO')
+        f.seek(0)
+        self.assertEqual(await asyncio.to_thread(f.read), self._content)
+        f.close()
+
+    async def test_blocking_read_without_event_loop(self):
+        f = await self._direct.open(self._file_id, prefetch=0)
+        loop = asyncio.new_event_loop()
+        f._loop = loop  # pylint: disable=protected-access
+        with self.assertRaises(ValueError):  # stopped
+            await asyncio.wait_for(asyncio.to_thread(f.read, 10), 5)
+        loop.close()
+        with self.assertRaises(ValueError):  # closed
+            await asyncio.wait_for(asyncio.to_thread(f.read, 10), 5)
+        f.close()
+
+    async def test_blocking_read_from_event_loop(self):
+        f = await self._direct.open(self._file_id)
+        with self.assertRaises(RuntimeError):
+            f.read(10)
+        f.close()
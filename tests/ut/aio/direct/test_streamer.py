@@ -0,0 +1,64 @@
+import os
+from cterasdk import ctera_direct
+from cterasdk.direct.scheduler import SlidingWindow
+from . import base
+
+
+class TestDirectStreamer(base.BaseAsyncDirect):
+
+    def setUp(self):  # pylint: disable=arguments-differ
+        super().setUp()
+        self._file_id = 12345
+        self._encryption_key = os.urandom(32)
+        self._blocks = [os.urandom(1024) for _ in range(10)]
+        self._metadata = self._create_metadata(self._file_id, self._blocks, self._encryption_key)
+        self._serve_objects(self._blocks, self._encryption_key)
+
+    async def test_stream_file(self):
+        executor = self._direct.scheduler(self._metadata, max_blocks=3)
+        data = bytearray()
+        async for block in ctera_direct.stream.Streamer(executor, ctera_direct.types.ByteRange.default()).start():
+            self.assertEqual(block.offset, len(data))
+            data.extend(block.data)
+        self.assertEqual(bytes(data), b''.join(self._blocks))
+
+    async def test_stream_byte_range(self):
+        byte_range = ctera_direct.types.ByteRange(1500, 4000)
+        executor = self._direct.scheduler(self._metadata, byte_range=byte_range, max_blocks=2)
+        data = bytearray()
+        async for block in ctera_direct.stream.Streamer(executor, byte_range).start():
+            data.extend(block.data)
+        self.assertEqual(bytes(data), b''.join(self._blocks)[1500:4001])
+
+    async def test_window_max_blocks(self):
+        started = []
+        window = SlidingWindow(self._factory(started), self._metadata.chunks, max_blocks=3)
+        async for block in window:
+            self.assertLessEqual(len(started) - block.number, 2)
+            self.assertLessEqual(window.scheduled, 2)
+        self.assertEqual(len(started), len(self._blocks))
+
+    async def test_window_max_bytes(self):
+        started = []
+        window = SlidingWindow(self._factory(started), self._metadata.chunks, max_blocks=10, max_bytes=2048)
+        async for block in window:
+            self.assertLessEqual(len(started) - block.number, 1)
+            self.assertLessEqual(window.buffered, 1024)
+        self.assertEqual(len(started), len(self._blocks))
+
+    async def test_window_cancel(self):
+        started = []
+        window = SlidingWindow(self._factory(started), self._metadata.chunks, max_blocks=4)
+        await anext(window)
+        window.cancel()
+        self.assertEqual(window.scheduled, 0)
+        self.assertEqual(window.buffered, 0)
+        with self.assertRaises(StopAsyncIteration):
+            await anext(window)
+
+    @staticmethod
+    def _factory(started):
+        async def factory(chunk):
+            started.append(chunk.number)
+            return chunk
+        return factory
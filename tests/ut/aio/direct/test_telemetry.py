@@ -0,0 +1,104 @@
+import os
+from unittest import mock
+from cterasdk import exceptions
+from cterasdk.direct.lib import get_object
+from cterasdk.direct.telemetry import Timings, Stage, StageTiming, DictExporter, PrometheusExporter, OpenMetricsExporter
+from . import base
+
+
+class TestDirectTelemetry(base.BaseAsyncDirect):
+
+    def setUp(self):  # pylint: disable=arguments-differ
+        super().setUp()
+        self._file_id = 12345
+        self._encryption_key = os.urandom(32)
+        self._blocks = [os.urandom(1024) for _ in range(4)]
+        self._metadata = self._create_metadata(self._file_id, self._blocks, self._encryption_key)
+        self._serve_objects(self._blocks, self._encryption_key)
+
+    def test_histogram(self):
+        timing = StageTiming()
+        for elapsed in [0.001, 0.005, 0.3, 20]:
+            timing.record(elapsed, 10)
+        histogram = dict(timing.histogram())
+        self.assertEqual(histogram[0.005], 2)
+        self.assertEqual(histogram[0.25], 2)
+        self.assertEqual(histogram[0.5], 3)
+        self.assertEqual(histogram[float('inf')], 4)
+        self.assertEqual(timing.to_dict()['bytes'], 40)
+
+    def test_measure_error(self):
+        timings = Timings()
+        with self.assertRaises(ConnectionError):
+            with timings.measure(Stage.Download, 'storage.local'):
+                raise ConnectionError()
+        self.assertEqual(timings[Stage.Download].errors, 1)
+        self.assertEqual(timings.hosts['storage.local'].requests, 1)
+
+    def test_measure_excluded(self):
+        timings = Timings()
+        with mock.patch('cterasdk.direct.telemetry.time.perf_counter', side_effect=[10, 15]):
+            with timings.measure(Stage.Download) as measurement:
+                measurement.excluded = 3
+        self.assertEqual(timings[Stage.Download].elapsed, 2)
+
+    async def test_download_metrics(self):
+        futures = await self._direct.executor(self._metadata)()
+        for future in futures:
+            await future
+        metrics = self._direct.timings.export(DictExporter())
+        for stage in [Stage.Download, Stage.Decrypt, Stage.Decompress]:
+            self.assertEqual(metrics['stages'][stage]['count'], len(self._blocks))
+        self.assertEqual(metrics['hosts']['s3.amazonaws.com']['requests'], len(self._blocks))
+        self.assertEqual(metrics['hosts']['s3.amazonaws.com']['bytes'], metrics['stages'][Stage.Download]['bytes'])
+
+    async def test_retries(self):
+        timings = Timings()
+        self._direct._client.get.side_effect = ConnectionError  # pylint: disable=protected-access
+        with mock.patch('asyncio.sleep'):
+            with self.assertRaises(exceptions.direct.DownloadConnectionError):
+                client = self._direct._client  # pylint: disable=protected-access
+                await get_object(client, self._file_id, self._metadata.chunks[0], timings=timings)
+        self.assertEqual(timings[Stage.Download].retries, 2)
+        self.assertEqual(timings[Stage.Download].errors, 3)
+
+    async def test_retries_incremental(self):
+        self._direct._chunk_size = 100  # pylint: disable=protected-access
+        get = self._direct._client.get.side_effect  # pylint: disable=protected-access
+        self._direct._client.get.side_effect = self._fail_once(get)  # pylint: disable=protected-access
+        with mock.patch('asyncio.sleep'):
+            for future in await self._direct.executor(self._metadata)():
+                await future
+        self.assertEqual(self._direct.timings[Stage.Download].retries, 1)
+
+    @staticmethod
+    def _fail_once(get):
+        failed = []
+
+        async def fail_once(url):
+            if not failed:
+                failed.append(url)
+                raise ConnectionError()
+            return await get(url)
+        return fail_once
+
+    def test_prometheus_exporter(self):
+        timings = Timings()
+        with timings.measure(Stage.Download, 'storage.local') as measurement:
+            measurement.bytes = 100
+        text = timings.export(PrometheusExporter())
+        self.assertIn('# TYPE cterasdk_direct_stage_duration_seconds histogram', text)
+        self.assertIn('cterasdk_direct_stage_duration_seconds_bucket{stage="download",le="+Inf"} 1', text)
+        self.assertIn('cterasdk_direct_stage_duration_seconds_count{stage="download"} 1', text)
+        self.assertIn('# TYPE cterasdk_direct_stage_bytes_total counter', text)
+        self.assertIn('cterasdk_direct_stage_bytes_total{stage="download"} 100', text)
+        self.assertIn('cterasdk_direct_host_bytes_total{host="storage.local"} 100', text)
+        self.assertNotIn('# EOF', text)
+
+    def test_openmetrics_exporter(self):
+        timings = Timings()
+        timings.retry(Stage.Metadata)
+        text = timings.export(OpenMetricsExporter(prefix='app'))
+        self.assertIn('# TYPE app_stage_retries counter', text)
+        self.assertIn('app_stage_retries_total{stage="metadata"} 1', text)
+        self.assertTrue(text.endswith('# EOF\n'))
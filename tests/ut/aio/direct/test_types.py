@@ -0,0 +1,76 @@
+import json
+import base64
+import tracemalloc
+import unittest
+import munch
+from cterasdk import ctera_direct, Object
+
+
+class TestDirectTypes(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self._server_object = TestDirectTypes._create_server_object(20000)
+
+    def test_chunk_table(self):
+        metadata = ctera_direct.types.Metadata(12345, self._server_object)
+        self.assertEqual(len(metadata.chunks), 20000)
+        self.assertEqual(metadata.size, 20000 * 4096)
+        self.assertEqual(metadata.chunks[0], ctera_direct.types.Chunk(1, 0, 'https://s3.amazonaws.com/0', 4096))
+        self.assertEqual(metadata.chunks[-1].number, 20000)
+        self.assertEqual(metadata.chunks[-1].offset, 19999 * 4096)
+        self.assertEqual([chunk.number for chunk in metadata.chunks[10:13]], [11, 12, 13])
+        with self.assertRaises(IndexError):
+            metadata.chunks[20000]  # pylint: disable=pointless-statement,expression-not-assigned
+
+    def test_chunk_immutable(self):
+        chunk = ctera_direct.types.Chunk(1, 0, 'https://s3.amazonaws.com/0', 4096)
+        with self.assertRaises(AttributeError):
+            chunk.url = 'https://s3.amazonaws.com/1'
+        with self.assertRaises(AttributeError):
+            chunk.extra = True
+
+    def test_chunk_mapping(self):
+        chunk = ctera_direct.types.Chunk(1, 0, 'https://s3.amazonaws.com/0', 4096)
+        self.assertEqual(chunk['url'], 'https://s3.amazonaws.com/0')
+        self.assertEqual(chunk.get('length'), 4096)
+        self.assertIsNone(chunk.get('missing'))
+        self.assertEqual(dict(chunk), {'number': 1, 'offset': 0, 'url': 'https://s3.amazonaws.com/0', 'length': 4096})
+        with self.assertRaises(KeyError):
+            chunk['missing']  # pylint: disable=pointless-statement
+
+    def test_serialize(self):
+        metadata = ctera_direct.types.Metadata(12345, self._server_object)
+        metadata.encryption_key = b'\x01' * 32
+        serialized = metadata.serialize()
+        self.assertIs(serialized.chunks, metadata.chunks)
+        self.assertEqual(serialized.encryption_key, base64.b64encode(b'\x01' * 32).decode('utf-8'))
+        self.assertEqual(metadata.encryption_key, b'\x01' * 32)
+        small = ctera_direct.types.Metadata(12345, TestDirectTypes._create_server_object(2))
+        small.encryption_key = b'\x01' * 32
+        self.assertEqual(json.loads(str(small.serialize()))['chunks'][1],
+                         {'number': 2, 'offset': 4096, 'url': 'https://s3.amazonaws.com/1', 'length': 4096})
+
+    def test_memory_benchmark(self):
+        """Compare the memory footprint of the chunk table with a list of Object-based chunks."""
+        tracemalloc.start()
+        try:
+            baseline, _ = tracemalloc.get_traced_memory()
+            metadata = ctera_direct.types.Metadata(12345, self._server_object)
+            table = tracemalloc.get_traced_memory()[0] - baseline
+            baseline, _ = tracemalloc.get_traced_memory()
+            objects = [Object(number=i + 1, offset=i * 4096, url=chunk.url, length=chunk.len)
+                       for i, chunk in enumerate(self._server_object.chunks)]
+            legacy = tracemalloc.get_traced_memory()[0] - baseline
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(len(metadata.chunks), len(objects))
+        self.assertLess(table * 10, legacy)
+
+    @staticmethod
+    def _create_server_object(count):
+        return munch.Munch({
+            'encrypt_info': munch.Munch({'data_encrypted': True, 'wrapped_key': 'key'}),
+            'compression_type': ctera_direct.types.CompressionLib.Snappy,
+            'chunks': [munch.Munch({'url': f'https://s3.amazonaws.com/{i}', 'len': 4096}) for i in range(count)]
+        })
@@ -0,0 +1,106 @@
+import os
+import base64
+import tempfile
+import unittest
+from unittest import mock
+from cterasdk.direct.client import DirectIO
+from cterasdk.direct.types import CompressionLib
+from cterasdk.direct.telemetry import Stage
+from cterasdk.direct.compressor import compress
+from cterasdk.direct.decompressor import decompress
+from cterasdk.direct.crypto import encrypt_block, decrypt_block
+from cterasdk.exceptions.direct import UploadError, DirectIOError
+from ....benchmark.direct.server import ObjectStore, wrap_key
+
+
+class TestDirectUpload(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self._store, self._direct = None, None
+        self._secret_access_key = base64.b64encode(os.urandom(32)).decode('utf-8')
+        self._encryption_key = os.urandom(32)
+        self._data = os.urandom(100 * 1024) + b'\x00' * (50 * 1024)
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        self._path = os.path.join(directory.name, 'source.bin')
+        with open(self._path, 'wb') as f:
+            f.write(self._data)
+
+    async def asyncSetUp(self):
+        self._store = await ObjectStore(self._secret_access_key).start()
+        self._direct = DirectIO(self._store.baseurl, 'access', self._secret_access_key)
+
+    async def asyncTearDown(self):
+        await self._direct.close()
+        await self._store.stop()
+
+    def _urls(self, number):
+        return self._store.url(1, number - 1)
+
+    async def _download(self, metadata):
+        blocks = [await future for future in await self._direct.executor(metadata)()]
+        return b''.join(bytes(block.data) for block in sorted(blocks, key=lambda block: block.offset))
+
+    async def test_upload(self):
+        for compression_library in [CompressionLib.Snappy, CompressionLib.Gzip]:
+            self._store.uploads.clear()
+            metadata = await self._direct.upload(self._path, self._urls, self._encryption_key, block_size=32 * 1024,
+                                                 compression_library=compression_library, max_workers=2)
+            self.assertEqual(len(self._store.uploads), 5)
+            self.assertEqual(metadata.size, len(self._data))
+            self.assertEqual(await self._download(metadata), self._data)
+        metrics = self._direct.timings.to_dict()
+        for stage in [Stage.Read, Stage.Compress, Stage.Encrypt, Stage.Upload]:
+            self.assertEqual(metrics[stage]['count'], 10)
+
+    async def test_upload_wrapped_key(self):
+        urls = [self._store.url(1, number) for number in range(2)]
+        metadata = await self._direct.upload(self._path, urls, wrap_key(self._encryption_key, self._secret_access_key))
+        self.assertEqual(metadata.encryption_key, self._encryption_key)
+        self.assertEqual(await self._download(metadata), self._data)
+
+    async def test_upload_missing_urls(self):
+        with self.assertRaises(ValueError):
+            await self._direct.upload(self._path, [], self._encryption_key, block_size=32 * 1024)
+
+    async def test_upload_compression_off(self):
+        with self.assertRaises(ValueError):
+            await self._direct.upload(self._path, self._urls, self._encryption_key, compression_library=CompressionLib.Off)
+        self.assertEqual(len(self._store.uploads), 0)
+
+    async def test_upload_wrapped_key_bearer(self):
+        await self._direct.close()
+        self._direct = DirectIO(self._store.baseurl, bearer='token')
+        with self.assertRaises(ValueError):
+            await self._direct.upload(self._path, self._urls, wrap_key(self._encryption_key, self._secret_access_key))
+        self.assertEqual(len(self._store.uploads), 0)
+
+    async def test_upload_error(self):
+        with mock.patch('asyncio.sleep'):
+            with self.assertRaises(UploadError):
+                await self._direct.upload(self._path, [f'{self._store.baseurl}/missing'], self._encryption_key)
+        self.assertEqual(self._direct.timings[Stage.Upload].retries, 2)
+
+
+class TestDirectBlockEncoding(unittest.TestCase):
+
+    def test_compress(self):
+        data = os.urandom(1024) + b'\x00' * 1024
+        for compression_library in [CompressionLib.Snappy, CompressionLib.Gzip]:
+            self.assertEqual(bytes(decompress(compress(data, compression_library), len(data))), data)
+        for compression_library in [CompressionLib.Off, 'LZ4']:
+            with self.assertRaises(DirectIOError):
+                compress(data, compression_library)
+
+    def test_round_trip(self):
+        encryption_key, data = os.urandom(32), os.urandom(1024) + b'\x00' * 1024
+        for compression_library in [CompressionLib.Snappy, CompressionLib.Gzip]:
+            encoded = encrypt_block(compress(data, compression_library), encryption_key)
+            self.assertEqual(bytes(decompress(decrypt_block(encoded, encryption_key), len(data))), data)
+
+    def test_encrypt_block(self):
+        encryption_key, data = os.urandom(32), os.urandom(1000)
+        self.assertEqual(bytes(decrypt_block(encrypt_block(data, encryption_key), encryption_key)), data)
+        with self.assertRaises(DirectIOError):
+            encrypt_block(data, b'short')
@@ -0,0 +1,168 @@
+import asyncio
+import unittest
+from unittest import mock
+import aiohttp
+from yarl import URL
+from cterasdk.conf import AsynchronousClient, ClientCircuitBreaker
+from cterasdk.clients.breaker import CircuitBreaker, CircuitBreakers, State, guard
+from cterasdk.clients.clients import AsyncClient
+from cterasdk.objects.endpoints import EndpointBuilder, DefaultBuilder
+from cterasdk.exceptions.transport import CircuitOpenError, NotFound, BadGateway, ServiceUnavailable, GatewayTimeout
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self._now = 0
+        patcher = mock.patch('cterasdk.clients.breaker.time.monotonic', lambda: self._now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self._breaker = CircuitBreaker('https://portal.ctera.com/devicecmdnew/acme/edge', threshold=3, cooldown=60, probes=1)
+
+    def _fail(self, times=1):
+        for _ in range(times):
+            with self.assertRaises(ConnectionError), guard(self._breaker):
+                raise ConnectionError()
+
+    def test_opens_after_consecutive_failures(self):
+        self._fail(2)
+        with guard(self._breaker):
+            pass
+        self._fail(2)
+        self.assertEqual(self._breaker.state, State.Closed)
+        self._fail()
+        self.assertEqual(self._breaker.state, State.Open)
+        self._now = 10
+        with self.assertRaises(CircuitOpenError) as error:
+            self._breaker.acquire()
+        self.assertEqual(error.exception.retry_after, 50)
+        self.assertEqual(self._breaker.to_dict(), {'state': State.Open, 'failures': 3, 'trips': 1, 'rejected': 1})
+
+    def test_reachable_endpoint_errors(self):
+        for _ in range(5):
+            with self.assertRaises(ValueError), guard(self._breaker):
+                raise ValueError()
+        self.assertEqual(self._breaker.state, State.Closed)
+
+    def test_timeouts(self):
+        for _ in range(3):
+            with self.assertRaises(TimeoutError), guard(self._breaker):
+                raise TimeoutError()
+        self.assertEqual(self._breaker.state, State.Open)
+
+    def test_half_open_probe_succeeds(self):
+        self._fail(3)
+        self._now = 60
+        self.assertEqual(self._breaker.state, State.HalfOpen)
+        with guard(self._breaker):
+            with self.assertRaises(CircuitOpenError):  # a single probe at a time
+                self._breaker.acquire()
+        self.assertEqual(self._breaker.state, State.Closed)
+        self.assertEqual(self._breaker.failures, 0)
+
+    def test_half_open_probe_fails(self):
+        self._fail(3)
+        self._now = 60
+        self._fail()
+        self.assertEqual(self._breaker.state, State.Open)
+        self.assertEqual(self._breaker.trips, 2)
+        self._now = 119
+        with self.assertRaises(CircuitOpenError):
+            self._breaker.acquire()
+
+    def test_half_open_probe_cancelled(self):
+        self._fail(3)
+        self._now = 60
+        with self.assertRaises(asyncio.CancelledError), guard(self._breaker):
+            raise asyncio.CancelledError()
+        self.assertEqual(self._breaker.state, State.HalfOpen)
+        self.assertTrue(self._breaker.acquire())
+
+
+class TestCircuitBreakers(unittest.IsolatedAsyncioTestCase):
+
+    @staticmethod
+    def _settings(threshold=2):
+        settings = AsynchronousClient().settings
+        settings.circuit_breaker = ClientCircuitBreaker(threshold=threshold)
+        return settings
+
+    def test_disabled_by_default(self):
+        self.assertFalse(CircuitBreakers(AsynchronousClient().settings.circuit_breaker.model_dump()).enabled)
+
+    async def _client(self, builder, settings, side_effect):
+        client = AsyncClient(builder, settings=settings, authenticator=lambda *_: True)
+        client._session.await_promise = mock.AsyncMock(side_effect=side_effect)  # pylint: disable=protected-access
+        self.addAsyncCleanup(client.close)
+        return client
+
+    async def test_per_base_url(self):
+        portal = await self._client(EndpointBuilder.new('https://portal.ctera.com', '/admin/api'), self._settings(), ConnectionError())
+        edge = portal.clone(AsyncClient, EndpointBuilder.new('https://portal.ctera.com/admin/devicecmdnew/acme/edge'))
+        for _ in range(2):
+            with self.assertRaises(ConnectionError):
+                await edge.get('/status')
+        with self.assertRaises(CircuitOpenError):
+            await edge.get('/status')
+        with self.assertRaises(ConnectionError) as error:
+            await portal.get('/users')
+        self.assertNotIsInstance(error.exception, CircuitOpenError)
+        self.assertEqual(portal._session.await_promise.await_count, 3)  # pylint: disable=protected-access
+        self.assertEqual(portal.breakers.urls(State.Open), ['https://portal.ctera.com/admin/devicecmdnew/acme/edge'])
+        self.assertEqual(portal.breakers.urls(), ['https://portal.ctera.com/admin/devicecmdnew/acme/edge', 'https://portal.ctera.com'])
+
+    async def test_per_origin_without_base_url(self):
+        client = await self._client(DefaultBuilder(), self._settings(1), TimeoutError())
+        with self.assertRaises(TimeoutError):
+            await client.get('https://bucket.s3.amazonaws.com/object?signature=a')
+        with self.assertRaises(CircuitOpenError):
+            await client.get('https://bucket.s3.amazonaws.com/object?signature=b')
+        self.assertEqual(client.breakers.urls(), ['https://bucket.s3.amazonaws.com'])
+
+    async def test_http_errors(self):
+        error = NotFound(mock.MagicMock())
+        client = await self._client(EndpointBuilder.new('https://portal.ctera.com'), self._settings(1), error)
+        for _ in range(3):
+            with self.assertRaises(NotFound):
+                await client.get('/missing')
+        self.assertEqual(client.breakers.to_dict()['https://portal.ctera.com']['state'], State.Closed)
+
+    async def _server(self, **kwargs):
+        client = AsyncClient(EndpointBuilder.new('https://portal.ctera.com'), settings=self._settings(1), authenticator=lambda *_: True)
+        self.addAsyncCleanup(client.close)
+        patcher = mock.patch('aiohttp.ClientSession.request', mock.AsyncMock(**kwargs))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return client
+
+    @staticmethod
+    def _response(status, read=None):
+        response = mock.MagicMock(status=status, ok=status < 400, method='GET', real_url=URL('https://portal.ctera.com/status'))
+        response.text = mock.AsyncMock(return_value='')
+        response.read = mock.AsyncMock(side_effect=read, return_value=b'{}')
+        return response
+
+    async def test_os_errors(self):
+        client = await self._server(side_effect=aiohttp.ClientOSError(104, 'Connection reset by peer'))
+        with self.assertRaises(aiohttp.ClientOSError) as error:  # Raised to the caller unchanged
+            await client.get('/status')
+        self.assertNotIsInstance(error.exception, ConnectionError)
+        self.assertEqual(client.breakers.to_dict()['https://portal.ctera.com']['state'], State.Open)
+
+    async def test_body_read_timeouts(self):
+        client = await self._server(return_value=self._response(200, read=asyncio.TimeoutError()))
+
+        async def read(response):
+            return await response.read()
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await client.get('/status', on_response=read)
+        self.assertEqual(client.breakers.to_dict()['https://portal.ctera.com']['state'], State.Open)
+
+    async def test_retryable_statuses(self):
+        for status, error in [(502, BadGateway), (503, ServiceUnavailable), (504, GatewayTimeout)]:
+            client = await self._server(return_value=self._response(status))
+            with self.assertRaises(error):
+                await client.get('/status')
+            self.assertEqual(client.breakers.to_dict()['https://portal.ctera.com']['state'], State.Open)
@@ -0,0 +1,164 @@
+import unittest
+from unittest import mock
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+from cterasdk.conf import AsynchronousClient, ClientCache
+from cterasdk.clients import async_requests
+from cterasdk.clients.cache import ResponseCache
+from cterasdk.clients.clients import AsyncAPI, AsyncClient
+from cterasdk.objects.endpoints import EndpointBuilder
+
+
+class Server:
+
+    def __init__(self):
+        self.requests = []
+        self.responses = {}
+
+    def respond(self, path, body, status=200, **headers):
+        self.responses[path] = (status, headers, body)
+
+    async def __call__(self, request, *, on_response=None):
+        self.requests.append((request.method, request.url, dict(request.kwargs.get('headers') or {})))
+        status, headers, body = self.responses.get(URL(request.url).path, (200, {}, b'{}'))
+        if status == 200 and headers.get('ETag') and request.kwargs['headers'].get('If-None-Match') == headers['ETag']:
+            status, body = 304, b''
+        response = mock.MagicMock(status=status, ok=status < 400, headers=CIMultiDictProxy(CIMultiDict(headers)))
+        response.read = mock.AsyncMock(return_value=body)
+        return await on_response(response)
+
+
+class TestResponseCache(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self._now = 0
+        patcher = mock.patch('cterasdk.clients.cache.time.monotonic', lambda: self._now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self._server = Server()
+        self._server.respond('/admin/api/settings', b'<obj><att id="timezone"><val>UTC</val></att></obj>')
+
+    async def _api(self, **kwargs):
+        settings = AsynchronousClient().settings
+        settings.cache = ClientCache(**{'enabled': True, **kwargs})
+        api = AsyncAPI(EndpointBuilder.new('https://portal.ctera.com', '/admin/api'), settings=settings, authenticator=lambda *_: True)
+        api._session.await_promise = self._server  # pylint: disable=protected-access
+        self.addAsyncCleanup(api.close)
+        return api
+
+    async def test_disabled_by_default(self):
+        api = AsyncAPI(EndpointBuilder.new('https://portal.ctera.com', '/admin/api'), settings=AsynchronousClient().settings)
+        self.assertFalse(api.cache.enabled)
+        await api.close()
+
+    async def test_fresh_response_served_from_cache(self):
+        api = await self._api()
+        first = await api.get('/settings')
+        first.timezone = 'GMT'
+        self.assertEqual((await api.get('/settings')).timezone, 'UTC')
+        self.assertEqual(len(self._server.requests), 1)
+        self.assertEqual(api.cache.to_dict(), {
+            'entries': 1, 'size': 50, 'hits': 1, 'misses': 1, 'revalidated': 0, 'invalidated': 0, 'evicted': 0
+        })
+
+    async def test_uncached_paths(self):
+        api = await self._api()
+        await api.get('/users')
+        await api.get('/users')
+        self.assertEqual(len(self._server.requests), 2)
+        self.assertEqual(len(api.cache), 0)
+
+    async def test_per_path_ttl(self):
+        api = await self._api(paths={'*/api/settings': 30, '*/api/defaults/*': 300})
+        await api.get('/settings')
+        await api.get('/defaults/Alert')
+        self._now = 31
+        await api.get('/settings')
+        await api.get('/defaults/Alert')
+        self.assertEqual([url for _, url, _ in self._server.requests], [
+            'https://portal.ctera.com/admin/api/settings', 'https://portal.ctera.com/admin/api/defaults/Alert',
+            'https://portal.ctera.com/admin/api/settings'
+        ])
+
+    async def test_revalidation(self):
+        last_modified = {'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+        self._server.respond('/admin/api/portalLicenses', b'<val>EV16</val>', ETag='"v1"', **last_modified)
+        api = await self._api(paths={'*/api/portalLicenses': 0})
+        self.assertEqual(await api.get('/portalLicenses'), 'EV16')
+        self.assertEqual(await api.get('/portalLicenses'), 'EV16')
+        _, _, headers = self._server.requests[1]
+        self.assertEqual(headers['If-None-Match'], '"v1"')
+        self.assertEqual(headers['If-Modified-Since'], 'Wed, 21 Oct 2015 07:28:00 GMT')
+        self.assertEqual(api.cache.revalidated, 1)
+        self._server.respond('/admin/api/portalLicenses', b'<val>EV32</val>', ETag='"v2"')
+        self.assertEqual(await api.get('/portalLicenses'), 'EV32')
+        self.assertEqual(api.cache.misses, 2)
+
+    async def test_no_validators_not_stored(self):
+        api = await self._api(paths={'*/api/settings': 0})
+        await api.get('/settings')
+        self.assertEqual(len(api.cache), 0)
+
+    async def test_no_store(self):
+        self._server.respond('/admin/api/settings', b'<val>1</val>', **{'Cache-Control': 'no-store'})
+        api = await self._api()
+        await api.get('/settings')
+        self.assertEqual(len(api.cache), 0)
+
+    async def test_errors_not_cached(self):
+        self._server.respond('/admin/api/settings', b'<obj/>', status=500)
+        api = await self._api()
+        on_error = mock.AsyncMock()
+        await AsyncClient.get(api, '/settings', on_error=on_error)
+        self.assertEqual(on_error.a_accept.await_args.args[0].status, 500)
+        self.assertEqual(len(api.cache), 0)
+
+    async def test_invalidation(self):
+        api = await self._api(paths={'*/api/settings': 30, '*/api/settings/*': 30, '*/api/users/*': 30})
+        for path in ['/settings', '/settings/timezone', '/users/admin']:
+            await api.get(path)
+        await api.put('/settings/timezone', 'GMT')
+        self.assertEqual(len(api.cache), 1)
+        self.assertEqual(api.cache.invalidated, 2)
+        await api.get('/users/admin')
+        await api.delete('/users')
+        self.assertEqual(len(api.cache), 0)
+
+    async def test_get_multi(self):
+        api = await self._api(paths={'*/api': 30})
+        await api.get_multi('', ['timezone', 'hostname'])
+        await api.get_multi('', ['timezone', 'hostname'])
+        await api.get_multi('', ['timezone'])
+        self.assertEqual(len(self._server.requests), 2)
+        await api.execute('', 'reboot')
+        self.assertEqual(len(api.cache), 0)
+
+    async def test_lru_memory_cap(self):
+        api = await self._api(paths={'*/api/*': 30}, max_size=120, max_entry_size=60)
+        for path in ['a', 'b', 'c']:
+            self._server.respond(f'/admin/api/{path}', b'<val>' + path.encode() * 40 + b'</val>')
+        self._server.respond('/admin/api/large', b'<val>' + b'x' * 100 + b'</val>')
+        await api.get('/a')
+        await api.get('/b')
+        await api.get('/a')
+        await api.get('/c')
+        await api.get('/large')
+        self.assertEqual(len(api.cache), 2)
+        self.assertEqual(api.cache.evicted, 1)
+        await api.get('/a')
+        self.assertEqual(api.cache.hits, 2)
+
+    async def test_keyed_by_session_headers(self):
+        api = await self._api()
+        await api.get('/settings')
+        api.headers.persist_headers({'Authorization': 'Bearer token'})
+        await api.get('/settings')
+        self.assertEqual(len(self._server.requests), 2)
+
+    def test_cacheable_requests(self):
+        cache = ResponseCache({'enabled': True, 'paths': {'*/api/*': 30}, 'max_size': 1, 'max_entry_size': 1})
+        self.assertEqual(cache.ttl(async_requests.GetRequest('https://portal.ctera.com/admin/api/settings')), 30)
+        self.assertIsNone(cache.ttl(async_requests.PostRequest('https://portal.ctera.com/admin/api/settings')))
+        self.assertEqual(cache.ttl(async_requests.PostRequest('https://portal.ctera.com/admin/api/settings', cacheable=True)), 30)
+        self.assertIsNone(cache.ttl(async_requests.GetRequest('https://portal.ctera.com/admin/webdav/settings')))
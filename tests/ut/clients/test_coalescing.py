@@ -0,0 +1,158 @@
+import time
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+import munch
+from cterasdk.conf import AsynchronousClient
+from cterasdk.clients.clients import AsyncJSON, AsyncExtended, XML, Extended
+from cterasdk.objects.endpoints import EndpointBuilder
+from cterasdk.exceptions.transport import InternalServerError
+
+
+class TestRequestCoalescing(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self._client = AsyncJSON(EndpointBuilder.new('https://portal.ctera.com', '/admin/api'), settings=AsynchronousClient().settings,
+                                 authenticator=lambda *_: True)
+        self._get = mock.AsyncMock(side_effect=self._response)
+        patcher = mock.patch('cterasdk.clients.clients.AsyncClient.get', self._get)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addAsyncCleanup(self._client.close)
+
+    @staticmethod
+    async def _response(path, **kwargs):  # pylint: disable=unused-argument
+        await asyncio.sleep(0.01)
+
+        async def json():
+            return munch.Munch({'path': path})
+        return munch.Munch({'json': json})
+
+    async def test_coalesce(self):
+        self._client.coalesce()
+        results = await asyncio.gather(*[self._client.get('/settings') for _ in range(5)])
+        self.assertEqual(self._get.await_count, 1)
+        self.assertTrue(all(result == results[0] for result in results))
+        self.assertEqual(self._client.coalescing.to_dict(), {'requests': 5, 'coalesced': 4, 'in_flight': 0})
+        await self._client.get('/settings')
+        self.assertEqual(self._get.await_count, 2)
+
+    async def test_deep_copy(self):
+        self._client.coalesce()
+        results = await asyncio.gather(*[self._client.get('/settings') for _ in range(3)])
+        results[0].path = '/users'
+        self.assertEqual([result.path for result in results], ['/users', '/settings', '/settings'])
+        self.assertIsNot(results[1], results[2])
+
+    async def test_clone(self):
+        clone = self._client.clone(AsyncJSON, EndpointBuilder.new('https://portal.ctera.com', '/admin/api'))
+        self._client.coalesce()
+        await asyncio.gather(self._client.get('/settings'), clone.get('/settings'))
+        self.assertIs(clone.coalescing, self._client.coalescing)
+        self.assertEqual(self._get.await_count, 1)
+        clone.coalesce(False)
+        self.assertIsNone(self._client.coalescing)
+        await asyncio.gather(self._client.get('/settings'), self._client.clone(AsyncJSON).get('/settings'))
+        self.assertEqual(self._get.await_count, 3)
+
+    async def test_distinct_requests(self):
+        self._client.coalesce()
+        await asyncio.gather(self._client.get('/settings'), self._client.get('/settings', params={'a': 1}), self._client.get('/users'))
+        self.assertEqual(self._get.await_count, 3)
+        self.assertEqual(self._client.coalescing.coalesced, 0)
+
+    async def test_disabled(self):
+        await asyncio.gather(*[self._client.get('/settings') for _ in range(3)])
+        self.assertEqual(self._get.await_count, 3)
+        self.assertIsNone(self._client.coalescing)
+
+    async def test_shared_error(self):
+        self._client.coalesce()
+        self._get.side_effect = InternalServerError(munch.Munch({'request': munch.Munch({'url': '/settings'})}))
+        results = await asyncio.gather(*[self._client.get('/settings') for _ in range(3)], return_exceptions=True)
+        self.assertTrue(all(isinstance(result, InternalServerError) for result in results))
+        self.assertEqual(self._get.await_count, 1)
+
+    async def test_cancelled_caller(self):
+        self._client.coalesce()
+        first = asyncio.ensure_future(self._client.get('/settings'))
+        second = asyncio.ensure_future(self._client.get('/settings'))
+        await asyncio.sleep(0)
+        first.cancel()
+        self.assertEqual((await second).path, '/settings')
+        self.assertEqual(self._get.await_count, 1)
+
+
+class TestAsyncGetMultiCoalescing(unittest.IsolatedAsyncioTestCase):
+
+    async def test_get_multi(self):
+        client = AsyncExtended(EndpointBuilder.new('https://portal.ctera.com', '/admin/api'), settings=AsynchronousClient().settings,
+                               authenticator=lambda *_: True)
+        self.addAsyncCleanup(client.close)
+        client.coalesce()
+
+        async def post(path, data, **kwargs):  # pylint: disable=unused-argument
+            await asyncio.sleep(0.01)
+            return munch.Munch({'paths': data.param})
+
+        with mock.patch('cterasdk.clients.clients.AsyncXML.post', mock.AsyncMock(side_effect=post)) as request:
+            results = await asyncio.gather(client.get_multi('', ['timezone']), client.get_multi('', ['timezone']),
+                                           client.get_multi('', ['hostname']))
+        self.assertEqual(request.await_count, 2)
+        self.assertEqual([result.paths for result in results], [['timezone'], ['timezone'], ['hostname']])
+
+
+class TestSyncRequestCoalescing(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self._client = XML(EndpointBuilder.new('https://portal.ctera.com', '/admin/api'), settings=AsynchronousClient().settings,
+                           authenticator=lambda *_: True)
+        self._client.coalesce()
+        self.addCleanup(self._client.close)
+
+    def _await_callers(self, callers):
+        deadline = time.monotonic() + 5
+        while self._client.coalescing.coalesced < callers - 1 and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    @staticmethod
+    def _gather(function, callers=5):
+        with ThreadPoolExecutor(callers) as executor:
+            futures = [executor.submit(function) for _ in range(callers)]
+        return [future.exception() or future.result() for future in futures]
+
+    def test_get(self):
+        def get(path, **kwargs):  # pylint: disable=unused-argument
+            self._await_callers(5)
+            return munch.Munch({'xml': lambda: munch.Munch({'path': path})})
+
+        with mock.patch('cterasdk.clients.clients.Client.get', side_effect=get) as request:
+            results = self._gather(lambda: self._client.get('/settings'))
+        self.assertEqual(request.call_count, 1)
+        self.assertEqual(len([result for result in results if result == munch.Munch({'path': '/settings'})]), 5)
+        self.assertEqual(self._client.coalescing.to_dict(), {'requests': 5, 'coalesced': 4, 'in_flight': 0})
+
+    def test_shared_error(self):
+        def get(path, **kwargs):  # pylint: disable=unused-argument
+            self._await_callers(3)
+            raise InternalServerError(munch.Munch({'request': munch.Munch({'url': path})}))
+
+        with mock.patch('cterasdk.clients.clients.Client.get', side_effect=get) as request:
+            results = self._gather(lambda: self._client.get('/settings'), 3)
+        self.assertEqual(request.call_count, 1)
+        self.assertTrue(all(isinstance(result, InternalServerError) for result in results))
+
+    def test_get_multi(self):
+        client = self._client.clone(Extended)
+
+        def post(path, data, **kwargs):  # pylint: disable=unused-argument
+            self._await_callers(3)
+            return munch.Munch({'paths': data.param})
+
+        with mock.patch('cterasdk.clients.clients.XML.post', side_effect=post) as request:
+            results = self._gather(lambda: client.get_multi('', ['timezone']), 3)
+        self.assertEqual(request.call_count, 1)
+        self.assertTrue(all(result.paths == ['timezone'] for result in results))
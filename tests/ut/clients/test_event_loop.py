@@ -0,0 +1,78 @@
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from cterasdk.conf import SynchronousClient
+from cterasdk.clients.base import EventLoopThread
+from cterasdk.clients.clients import JSON
+from cterasdk.objects.endpoints import EndpointBuilder
+from ...benchmark.clients.server import Server
+
+
+class TestEventLoopThread(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self._event_loop = EventLoopThread()
+        self.addCleanup(self._event_loop.stop)
+
+    @staticmethod
+    async def _thread():
+        await asyncio.sleep(0)
+        return threading.current_thread(), asyncio.get_running_loop()
+
+    def test_run(self):
+        thread, loop = self._event_loop.run(self._thread)
+        self.assertIsNot(thread, threading.current_thread())
+        self.assertEqual(self._event_loop.run(self._thread), (thread, loop))
+
+    def test_run_from_running_loop(self):
+        async def main():
+            return self._event_loop.run(self._thread)
+        _, loop = asyncio.run(main())
+        self.assertIs(loop, self._event_loop.loop)
+
+    def test_run_from_threads(self):
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(lambda _: self._event_loop.run(self._thread), range(20)))
+        self.assertEqual(len(set(results)), 1)
+
+    def test_error(self):
+        async def fail():
+            raise ConnectionError()
+        with self.assertRaises(ConnectionError):
+            self._event_loop.run(fail)
+
+    def test_run_from_event_loop_thread(self):
+        async def nested():
+            return self._event_loop.run(self._thread)
+        with self.assertRaises(RuntimeError):
+            self._event_loop.run(nested)
+
+    def test_restart(self):
+        first, _ = self._event_loop.run(self._thread)
+        self._event_loop.stop()
+        second, _ = self._event_loop.run(self._thread)
+        self.assertIsNot(first, second)
+        self.assertFalse(first.is_alive())
+
+
+class TestSynchronousClient(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self._server = Server().start_in_thread()
+        self.addCleanup(self._server.stop_thread)
+        self._client = JSON(EndpointBuilder.new(self._server.baseurl, '/api'), settings=SynchronousClient().settings,
+                            authenticator=lambda *_: True)
+        self.addCleanup(self._client.close)
+
+    def test_get_from_threads(self):
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(lambda i: self._client.get(f'/{i}').name, range(20)))
+        self.assertEqual(results, [str(i) for i in range(20)])
+
+    def test_get_from_running_loop(self):
+        async def main():
+            return self._client.get('/running').name
+        self.assertEqual(asyncio.run(main()), 'running')
@@ -0,0 +1,135 @@
+import asyncio
+import unittest
+from unittest import mock
+from yarl import URL
+from cterasdk.conf import AsynchronousClient, ClientRateLimits
+from cterasdk.clients import async_requests
+from cterasdk.clients.limiter import RateLimiter, TokenBucket, Limit, EndpointClass
+from cterasdk.clients.settings import get_configuration
+from cterasdk.clients.clients import AsyncClient, AsyncJSON
+from cterasdk.objects.endpoints import EndpointBuilder
+
+
+def configuration(**kwargs):
+    settings = AsynchronousClient().settings
+    settings.rate_limits = ClientRateLimits(**kwargs)
+    return get_configuration(settings)['rate_limits']
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = 0
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.now = self.now + delay
+
+
+class TestTokenBucket(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self._clock = Clock()
+        for target, patch in [('time.monotonic', self._clock.monotonic), ('asyncio.sleep', self._clock.sleep)]:
+            patcher = mock.patch(f'cterasdk.clients.limiter.{target}', patch)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_burst(self):
+        bucket = TokenBucket(2, 4)
+        self.assertEqual([await bucket.acquire() for _ in range(4)], [0, 0, 0, 0])
+        self.assertEqual(self._clock.now, 0)
+
+    async def test_rate(self):
+        bucket = TokenBucket(4)
+        for _ in range(12):
+            await bucket.acquire()
+        self.assertEqual(self._clock.now, 2)
+
+    async def test_fractional_rate(self):
+        bucket = TokenBucket(0.5)
+        await bucket.acquire()
+        self.assertEqual(await bucket.acquire(), 2)
+
+
+class TestLimit(unittest.IsolatedAsyncioTestCase):
+
+    async def test_concurrency(self):
+        limit, active, peak = Limit(concurrency=2), [0], [0]
+
+        async def request():
+            async with limit:
+                active[0] = active[0] + 1
+                peak[0] = max(peak[0], active[0])
+                await asyncio.sleep(0.01)
+                active[0] = active[0] - 1
+
+        await asyncio.gather(*[request() for _ in range(6)])
+        self.assertEqual(peak[0], 2)
+        self.assertEqual(limit.requests, 6)
+        self.assertEqual(limit.throttled, 4)
+
+    async def test_release_on_error(self):
+        limit = Limit(concurrency=1)
+        with self.assertRaises(ConnectionError):
+            async with limit:
+                raise ConnectionError()
+        async with limit:
+            pass
+        self.assertEqual(limit.to_dict(), {'requests': 2, 'throttled': 0, 'waited': 0})
+
+
+class TestRateLimiter(unittest.IsolatedAsyncioTestCase):
+
+    def test_classify(self):
+        for method, url, expected in [
+            ('GET', '/ServicesPortal/api/users', EndpointClass.API),
+            ('POST', '/ServicesPortal/devicecmdnew/acme/edge/status', EndpointClass.API),
+            ('GET', '/ServicesPortal/webdav/My Files/a.txt', EndpointClass.WebDAV),
+            ('PROPFIND', '/ServicesPortal/v2/api/My Files', EndpointClass.WebDAV),
+            ('GET', '/localFiles/cloud/a.txt', EndpointClass.WebDAV),
+            ('POST', '/ServicesPortal/folders/folders/My Files', EndpointClass.WebDAV),
+            ('POST', '/ServicesPortal/upload/folders/1', EndpointClass.Upload),
+            ('GET', '/stats/proc/cpu', EndpointClass.Stats),
+        ]:
+            self.assertEqual(RateLimiter.classify(method, URL(f'https://portal.ctera.com{url}')), expected)
+
+    def test_disabled_by_default(self):
+        self.assertFalse(RateLimiter(configuration()).enabled)
+
+    async def test_per_host_and_endpoint_class(self):
+        limiter = RateLimiter(configuration(host={'concurrency': 10}, upload={'rate': 5}))
+        self.assertTrue(limiter.enabled)
+        for url in ['https://a.ctera.com/admin/api', 'https://a.ctera.com/admin/upload/folders', 'https://b.ctera.com/admin/api']:
+            async with limiter.limit('GET', url):
+                pass
+        self.assertEqual(limiter.to_dict(), {
+            'https://a.ctera.com host': {'requests': 2, 'throttled': 0, 'waited': 0},
+            'https://a.ctera.com upload': {'requests': 1, 'throttled': 0, 'waited': 0},
+            'https://b.ctera.com host': {'requests': 1, 'throttled': 0, 'waited': 0},
+        })
+
+    async def test_shared_by_cloned_clients(self):
+        settings = AsynchronousClient().settings
+        settings.rate_limits.api.concurrency = 1
+        client = AsyncJSON(EndpointBuilder.new('https://portal.ctera.com', '/admin/api'), settings=settings)
+        clone = client.clone(AsyncClient, EndpointBuilder.new('https://portal.ctera.com', '/admin/devicecmdnew'))
+        self.assertIs(clone.limiter, client.limiter)
+        active, peak = [0], [0]
+
+        async def issue(r):  # pylint: disable=unused-argument
+            active[0] = active[0] + 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.01)
+            active[0] = active[0] - 1
+
+        session = client._session  # pylint: disable=protected-access
+        with mock.patch.object(session, '_issue', side_effect=issue):
+            await asyncio.gather(*[
+                session._send(async_requests.GetRequest(c.baseurl)) for c in [client, clone] * 3  # pylint: disable=protected-access
+            ])
+        self.assertEqual(peak[0], 1)
+        await client.close()
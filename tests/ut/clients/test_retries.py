@@ -0,0 +1,158 @@
+import datetime
+import unittest
+from unittest import mock
+from email.utils import format_datetime
+from cterasdk.conf import AsynchronousClient, ClientRetries
+from cterasdk.clients import async_requests
+from cterasdk.clients.retries import RetryPolicy, RetryBudget
+from cterasdk.clients.settings import get_configuration
+from cterasdk.clients.clients import AsyncClient, AsyncJSON
+from cterasdk.objects.endpoints import EndpointBuilder
+
+
+def configuration(**kwargs):
+    settings = AsynchronousClient().settings
+    settings.retries = ClientRetries(**{'max_retries': 3, 'jitter': False, **kwargs})
+    return get_configuration(settings)
+
+
+def response(status, headers=None):
+    return mock.MagicMock(status=status, headers=headers or {})
+
+
+class TestRetryBudget(unittest.TestCase):
+
+    def test_budget(self):
+        budget = RetryBudget(0.5, 2)
+        self.assertTrue(budget.withdraw())
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+        budget.deposit()
+        self.assertFalse(budget.withdraw())
+        budget.deposit()
+        self.assertTrue(budget.withdraw())
+        for _ in range(10):
+            budget.deposit()
+        self.assertEqual(budget.balance, 2)
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self._policy = RetryPolicy(configuration()['retries'])
+        self._get = async_requests.GetRequest('https://portal.ctera.com/admin/api')
+
+    def test_disabled_by_default(self):
+        self.assertFalse(RetryPolicy(get_configuration(AsynchronousClient().settings)['retries']).enabled)
+
+    def test_exponential_backoff(self):
+        self.assertEqual([self._policy.on_error(self._get, attempt, ConnectionError()) for attempt in range(1, 5)], [0.5, 1, 2, None])
+
+    def test_max_backoff(self):
+        policy = RetryPolicy(configuration(max_retries=10, max_backoff=3)['retries'])
+        self.assertEqual(policy.on_error(self._get, 8, TimeoutError()), 3)
+
+    def test_full_jitter(self):
+        policy = RetryPolicy(configuration(jitter=True)['retries'])
+        with mock.patch('cterasdk.clients.retries.random.uniform', return_value=0.25) as uniform:
+            self.assertEqual(policy.on_error(self._get, 2, ConnectionError()), 0.25)
+        uniform.assert_called_once_with(0, 1)
+
+    def test_non_idempotent_methods(self):
+        for request in [async_requests.PostRequest('/'), async_requests.MkcolRequest('/'), async_requests.MoveRequest('/')]:
+            self.assertIsNone(self._policy.on_error(request, 1, ConnectionError()))
+            self.assertIsNone(self._policy.on_response(request, 1, response(503)))
+
+    def test_non_retryable(self):
+        self.assertIsNone(self._policy.on_error(self._get, 1, ValueError()))
+        for status in [200, 400, 404, 500]:
+            self.assertIsNone(self._policy.on_response(self._get, 1, response(status)))
+        stream = async_requests.PutRequest('/', data=async_requests.FormData())
+        self.assertIsNone(self._policy.on_error(stream, 1, ConnectionError()))
+
+    def test_retryable_statuses(self):
+        for status in [429, 502, 503, 504]:
+            self.assertEqual(self._policy.on_response(self._get, 1, response(status)), 0.5)
+
+    def test_retry_after(self):
+        self.assertEqual(self._policy.on_response(self._get, 1, response(503, {'Retry-After': '7'})), 7)
+        self.assertEqual(self._policy.on_response(self._get, 1, response(429, {'Retry-After': '0'})), 0)
+        self.assertEqual(self._policy.on_response(self._get, 1, response(502, {'Retry-After': '7'})), 0.5)
+        self.assertIsNone(self._policy.on_response(self._get, 1, response(503, {'Retry-After': '3600'})))
+
+    def test_parse_retry_after(self):
+        self.assertEqual(RetryPolicy.retry_after('120'), 120)
+        self.assertEqual(RetryPolicy.retry_after('-1'), 0)
+        self.assertIsNone(RetryPolicy.retry_after(None))
+        self.assertIsNone(RetryPolicy.retry_after('soon'))
+        date = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=60)
+        self.assertAlmostEqual(RetryPolicy.retry_after(format_datetime(date, usegmt=True)), 60, delta=2)
+        self.assertEqual(RetryPolicy.retry_after('Wed, 21 Oct 2015 07:28:00 GMT'), 0)
+
+    def test_budget_exhausted(self):
+        policy = RetryPolicy(configuration(budget_capacity=1, budget_ratio=0.5)['retries'])
+        self.assertEqual(policy.on_error(self._get, 1, ConnectionError()), 0.5)
+        self.assertIsNone(policy.on_error(self._get, 1, ConnectionError()))
+        self.assertEqual(policy.to_dict(), {'retries': 1, 'exhausted': 1, 'budget': 0})
+
+
+class TestSessionRetries(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self._sleep = mock.AsyncMock()
+        patcher = mock.patch('cterasdk.clients.async_requests.asyncio.sleep', self._sleep)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _session(side_effect, **kwargs):
+        session = async_requests.Session(configuration(**kwargs))
+        session._send = mock.AsyncMock(side_effect=side_effect)  # pylint: disable=protected-access
+        return session
+
+    @staticmethod
+    async def _on_response(r):
+        return r
+
+    async def test_retry_until_success(self):
+        ok = response(200)
+        unavailable = response(503, {'Retry-After': '2'})
+        session = TestSessionRetries._session([ConnectionError(), unavailable, ok])
+        self.assertIs(await session.await_promise(async_requests.GetRequest('/'), on_response=self._on_response), ok)
+        self.assertEqual(session._send.await_count, 3)  # pylint: disable=protected-access
+        self.assertEqual(self._sleep.await_args_list, [mock.call(0.5), mock.call(2)])
+        unavailable.release.assert_called_once()
+        self.assertEqual(session.retries.retries, 2)
+
+    async def test_retries_exhausted(self):
+        session = TestSessionRetries._session(TimeoutError(), max_retries=2)
+        with self.assertRaises(TimeoutError):
+            await session.await_promise(async_requests.GetRequest('/'), on_response=self._on_response)
+        self.assertEqual(session._send.await_count, 3)  # pylint: disable=protected-access
+
+    async def test_last_response_returned(self):
+        gateway_timeout = response(504)
+        session = TestSessionRetries._session([gateway_timeout] * 4)
+        self.assertIs(await session.await_promise(async_requests.GetRequest('/'), on_response=self._on_response), gateway_timeout)
+        self.assertEqual(session._send.await_count, 4)  # pylint: disable=protected-access
+
+    async def test_post_not_retried(self):
+        session = TestSessionRetries._session(ConnectionError())
+        with self.assertRaises(ConnectionError):
+            await session.await_promise(async_requests.PostRequest('/', data='{}'), on_response=self._on_response)
+        session._send.assert_awaited_once()  # pylint: disable=protected-access
+        self._sleep.assert_not_awaited()
+
+    async def test_disabled(self):
+        session = TestSessionRetries._session(ConnectionError(), max_retries=0)
+        with self.assertRaises(ConnectionError):
+            await session.await_promise(async_requests.GetRequest('/'), on_response=self._on_response)
+        session._send.assert_awaited_once()  # pylint: disable=protected-access
+        self.assertEqual(session.retries.budget.balance, 10)
+
+    async def test_shared_by_cloned_clients(self):
+        client = AsyncJSON(EndpointBuilder.new('https://portal.ctera.com', '/admin/api'), settings=AsynchronousClient().settings)
+        self.assertIs(client.clone(AsyncClient).retries, client.retries)
+        await client.close()
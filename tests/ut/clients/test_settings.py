@@ -0,0 +1,31 @@
+import socket
+import unittest
+from cterasdk.conf import AsynchronousClient
+from cterasdk.clients.settings import get_configuration, from_configuration, socket_factory
+
+
+class TestClientSettings(unittest.IsolatedAsyncioTestCase):
+
+    async def test_connector(self):
+        settings = AsynchronousClient().settings
+        settings.connector.limit_per_host = 8
+        settings.connector.keepalive_timeout = 30
+        settings.connector.ttl_dns_cache = 300
+        settings.connector.happy_eyeballs_delay = None
+        parameters = from_configuration(get_configuration(settings))
+        connector = parameters['connector']
+        self.addAsyncCleanup(connector.close)
+        self.assertEqual(connector.limit_per_host, 8)
+        self.assertEqual(connector._keepalive_timeout, 30)  # pylint: disable=protected-access
+        self.assertIsNone(connector._happy_eyeballs_delay)  # pylint: disable=protected-access
+        self.assertIsNone(connector._socket_factory)  # pylint: disable=protected-access
+
+    def test_socket_factory(self):
+        connector = {'ssl': True, 'rcvbuf': 256 * 1024, 'sndbuf': None}
+        factory = socket_factory(connector)
+        self.assertEqual(connector, {'ssl': True})
+        with factory((socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, '', ('127.0.0.1', 443))) as sock:
+            self.assertGreaterEqual(sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF), 256 * 1024)
+
+    def test_default_socket_factory(self):
+        self.assertIsNone(socket_factory({'rcvbuf': None, 'sndbuf': None}))
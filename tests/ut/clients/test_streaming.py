@@ -0,0 +1,30 @@
+import unittest
+from cterasdk.conf import SynchronousClient
+from cterasdk.clients.clients import Client
+from cterasdk.objects.endpoints import EndpointBuilder
+from ...benchmark.clients.server import Server
+
+
+class TestSynchronousStreaming(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self._server = Server().start_in_thread()
+        self.addCleanup(self._server.stop_thread)
+        self._client = Client(EndpointBuilder.new(self._server.baseurl), settings=SynchronousClient().settings,
+                              authenticator=lambda *_: True)
+        self.addCleanup(self._client.close)
+        self._size = 3 * 1024 * 1024 + 100
+
+    def test_iter_content(self):
+        for chunk_size, queue_size in [(None, None), (64 * 1024, 0), (1024 * 1024, 4), (8 * 1024 * 1024, 1)]:
+            chunks = list(self._client.get(f'/files/{self._size}').iter_content(chunk_size, queue_size))
+            self.assertEqual(b''.join(chunks), Server.content(self._size))
+            self.assertTrue(all(len(chunk) <= (chunk_size or 1024 * 1024) for chunk in chunks))
+
+    def test_iter_content_close(self):
+        for queue_size in [0, 2]:
+            chunks = self._client.get(f'/files/{self._size}').iter_content(64 * 1024, queue_size)
+            self.assertEqual(len(next(chunks)), 64 * 1024)
+            chunks.close()
+        self.assertEqual(len(b''.join(self._client.get('/files/1000').iter_content())), 1000)
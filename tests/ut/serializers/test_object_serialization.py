@@ -1,6 +1,6 @@
 import json
 
-from cterasdk.common.object import Object
+from cterasdk.common.object import Object, ObjectEncoder
 from tests.ut import base
 
 
@@ -11,3 +11,8 @@ class TestCommonObject(base.BaseTest):
         object_str = str(o)
         object_str_json = json.loads(object_str)
         self.assertEqual(object_str_json['user'], o.user)
+
+    def test_encoder_does_not_convert_sequences(self):
+        for value in [b'bytes', range(3)]:
+            with self.assertRaises(TypeError):
+                json.dumps(Object(value=value), cls=ObjectEncoder)